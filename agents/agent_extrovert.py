@@ -171,10 +171,11 @@ class PersonalityAgent:
     def _create_strands_agent(self):
         """Create Strands agent with personality-modified system prompt."""
         from strands import Agent
+        from gateway import GatewayBedrockModel
         
         system_prompt = self._build_system_prompt()
         return Agent(
-            model="openai.gpt-oss-120b-1:0",
+            model=GatewayBedrockModel(model_id="openai.gpt-oss-120b-1:0"),
             system_prompt=system_prompt
         )
     
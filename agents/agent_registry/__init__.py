@@ -0,0 +1,9 @@
+"""Process-wide registry that builds agents lazily, on first use or pre-warm."""
+
+from .registry import AgentRegistry, LazyAgent, agent_registry
+
+__all__ = [
+    'AgentRegistry',
+    'LazyAgent',
+    'agent_registry',
+]
@@ -0,0 +1,182 @@
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+
+class LazyAgent:
+    """
+    Stands in for a registered agent until it is first used.
+
+    Attribute access, assignment and calls are forwarded to the agent, which
+    the registry builds on first use; isinstance() sees the agent's class.
+    Module-level names such as `jeff_barr_agent` are LazyAgents, so importing
+    a module no longer builds its agent (and its model and boto3 client).
+    """
+
+    __slots__ = ("_registry", "_name")
+
+    def __init__(self, registry: "AgentRegistry", name: str):
+        object.__setattr__(self, "_registry", registry)
+        object.__setattr__(self, "_name", name)
+
+    def resolve(self) -> Any:
+        """Return the agent, building it if needed."""
+        return self._registry.get(self._name)
+
+    @property
+    def __class__(self):
+        return type(self.resolve())
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self.resolve(), attribute)
+
+    def __setattr__(self, attribute: str, value: Any) -> None:
+        setattr(self.resolve(), attribute, value)
+
+    def __delattr__(self, attribute: str) -> None:
+        delattr(self.resolve(), attribute)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        if self._registry.is_built(self._name):
+            return repr(self.resolve())
+        return f"<LazyAgent {self._name!r} (not built)>"
+
+
+class AgentRegistry:
+    """
+    Builds agents on first use and keeps one instance of each per process.
+
+    Factories are registered at import time and only called when the agent is
+    first needed (or by `prewarm`), so a cold start does not pay for building
+    every agent before it can serve a request. Building is serialized per
+    agent: concurrent first uses wait for a single build, while different
+    agents build in parallel. A failed build is not cached; the next use
+    tries again. Agents are never shared across a fork.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._agents: Dict[str, Any] = {}
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        # Seconds each agent took to build, for startup benchmarks
+        self.build_seconds: Dict[str, float] = {}
+
+    def register(self, name: str, factory: Callable[[], Any]) -> LazyAgent:
+        """Register an agent factory and return a lazy stand-in for the agent."""
+        with self._lock:
+            self._factories[name] = factory
+            self._agents.pop(name, None)
+            self._build_locks.setdefault(name, threading.Lock())
+        return LazyAgent(self, name)
+
+    def names(self) -> List[str]:
+        """Names of the registered agents."""
+        with self._lock:
+            return list(self._factories)
+
+    def is_built(self, name: str) -> bool:
+        with self._lock:
+            self._check_pid()
+            return name in self._agents
+
+    def built(self) -> List[str]:
+        """Names of the agents built in this process."""
+        with self._lock:
+            self._check_pid()
+            return list(self._agents)
+
+    def get(self, name: str) -> Any:
+        """Return the agent registered under `name`, building it on first use."""
+        with self._lock:
+            self._check_pid()
+            agent = self._agents.get(name)
+            if agent is not None:
+                return agent
+            if name not in self._factories:
+                raise KeyError(f"No agent registered as '{name}'")
+            factory = self._factories[name]
+            build_lock = self._build_locks[name]
+
+        with build_lock:
+            with self._lock:
+                agent = self._agents.get(name)
+            if agent is not None:
+                return agent
+            started = time.perf_counter()
+            agent = factory()
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._agents[name] = agent
+                self.build_seconds[name] = elapsed
+            logger.info(f"Built agent {name} in {elapsed * 1000:.0f} ms")
+            return agent
+
+    def prewarm(
+        self,
+        names: Optional[Iterable[str]] = None,
+        background: bool = True,
+        extra: Iterable[Callable[[], Any]] = ()
+    ) -> Optional[threading.Thread]:
+        """
+        Build agents ahead of their first use.
+
+        Args:
+            names: Agents to build; defaults to all registered agents
+            background: Build on a daemon thread and return it, instead of blocking
+            extra: Other warm-up callables (e.g. creating a boto3 client), run after the agents
+
+        Errors are logged, not raised: an agent that fails to pre-warm is built
+        again on first use.
+        """
+        names = list(names) if names is not None else self.names()
+        extra = list(extra)
+
+        def warm():
+            started = time.perf_counter()
+            for name in names:
+                try:
+                    self.get(name)
+                except Exception as e:
+                    logger.warning(f"Pre-warming agent {name} failed; it will be built on first use: {e}")
+            for warm_up in extra:
+                try:
+                    warm_up()
+                except Exception as e:
+                    logger.warning(f"Pre-warm step failed: {e}")
+            logger.info(f"Pre-warmed {len(names)} agents in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+        if not background:
+            warm()
+            return None
+        thread = threading.Thread(target=warm, name='agent-prewarm', daemon=True)
+        thread.start()
+        return thread
+
+    def clear(self) -> None:
+        """Drop all built agents; they are rebuilt on next use."""
+        with self._lock:
+            self._agents.clear()
+            self.build_seconds.clear()
+
+    def _check_pid(self) -> None:
+        # Called with the registry lock held
+        if self._pid != os.getpid():
+            # Agents hold boto3 clients whose connections must not be shared with the parent
+            self._agents.clear()
+            self.build_seconds.clear()
+            self._build_locks = {name: threading.Lock() for name in self._factories}
+            self._pid = os.getpid()
+
+
+# Process-wide registry of the debate agents
+agent_registry = AgentRegistry()
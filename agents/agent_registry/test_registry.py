@@ -0,0 +1,102 @@
+"""Unit tests for the lazy agent registry."""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+
+from agent_registry import AgentRegistry
+
+
+class FakeAgent:
+    def __init__(self, name):
+        self.name = name
+        self.calls = []
+
+    def __call__(self, prompt):
+        self.calls.append(prompt)
+        return f"{self.name}: {prompt}"
+
+
+class TestAgentRegistry:
+    """Test suite for AgentRegistry and LazyAgent."""
+
+    def test_builds_on_first_use_only(self):
+        """Test registering builds nothing and the stand-in behaves like the agent once used."""
+        registry = AgentRegistry()
+        builds = []
+        agent = registry.register("jeff_barr", lambda: builds.append(1) or FakeAgent("jeff_barr"))
+
+        assert builds == [] and registry.built() == []
+        assert "not built" in repr(agent)
+
+        assert agent.name == "jeff_barr"
+        assert agent("Hello") == "jeff_barr: Hello"
+        assert isinstance(agent, FakeAgent)
+        agent.name = "renamed"
+        assert registry.get("jeff_barr").name == "renamed"
+        assert builds == [1], "The agent is built once per process"
+        assert registry.built() == ["jeff_barr"]
+
+        with pytest.raises(KeyError):
+            registry.get("unknown")
+
+    def test_patching_an_attribute(self):
+        """Test patch.object on a stand-in patches the underlying agent and restores it."""
+        registry = AgentRegistry()
+        agent = registry.register("swami", lambda: FakeAgent("swami"))
+        with patch.object(agent, 'name', "patched"):
+            assert registry.get("swami").name == "patched"
+        assert agent.name == "swami"
+
+    def test_concurrent_first_use_builds_once(self):
+        """Test threads racing for an unbuilt agent share a single build, and failures are retried."""
+        registry = AgentRegistry()
+        builds = []
+
+        def build():
+            builds.append(1)
+            time.sleep(0.05)
+            return FakeAgent("werner_vogels")
+
+        registry.register("werner_vogels", build)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(registry.get("werner_vogels"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(builds) == 1
+        assert all(result is results[0] for result in results)
+
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("no credentials")
+            return FakeAgent("synthesis")
+
+        registry.register("synthesis", flaky)
+        with pytest.raises(RuntimeError):
+            registry.get("synthesis")
+        assert registry.get("synthesis").name == "synthesis"
+
+    def test_prewarm(self):
+        """Test pre-warming builds every agent on a background thread and survives failures."""
+        registry = AgentRegistry()
+        registry.register("jeff_barr", lambda: FakeAgent("jeff_barr"))
+        registry.register("broken", lambda: 1 / 0)
+        warmed = []
+
+        thread = registry.prewarm(extra=[lambda: warmed.append("memory client")])
+        thread.join(timeout=5)
+
+        assert registry.built() == ["jeff_barr"]
+        assert warmed == ["memory client"]
+        assert set(registry.build_seconds) == {"jeff_barr"}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
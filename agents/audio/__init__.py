@@ -0,0 +1,39 @@
+"""Text-to-speech for debate turns with Amazon Polly."""
+
+from .pipeline import DEFAULT_MAX_CONCURRENCY, AudioPipeline, AudioSegment
+from .chunker import MAX_CHUNK_CHARS, chunk_text, leading_sentences, split_sentences
+from .transcript import Transcript, Turn, speaker_key
+from .mp3 import FrameHeader, Mp3Assembler, concat_mp3, iter_frames, parse_header, silence_frame
+from .tts_cache import TTSCache, create_tts_cache, default_tts_cache, tts_key
+from .store import AudioStore, DataUrlStore, S3AudioStore, create_audio_store
+from .narration import EXPERT_VOICES, TurnNarrator, audio_key
+
+__all__ = [
+    'DEFAULT_MAX_CONCURRENCY',
+    'AudioPipeline',
+    'AudioSegment',
+    'MAX_CHUNK_CHARS',
+    'chunk_text',
+    'leading_sentences',
+    'split_sentences',
+    'Transcript',
+    'Turn',
+    'speaker_key',
+    'FrameHeader',
+    'Mp3Assembler',
+    'concat_mp3',
+    'iter_frames',
+    'parse_header',
+    'silence_frame',
+    'TTSCache',
+    'create_tts_cache',
+    'default_tts_cache',
+    'tts_key',
+    'AudioStore',
+    'DataUrlStore',
+    'S3AudioStore',
+    'create_audio_store',
+    'EXPERT_VOICES',
+    'TurnNarrator',
+    'audio_key',
+]
@@ -0,0 +1,101 @@
+import re
+from typing import List
+from xml.sax.saxutils import escape
+
+# Polly bills at most 3000 characters of text per request and accepts 6000
+# characters including SSML markup; chunks stay well below both so each
+# request is quick and a chunk's escaped, prosody-wrapped SSML always fits
+MAX_CHUNK_CHARS = 1500
+
+# A sentence: text up to terminal punctuation (plus closing quotes/brackets)
+# followed by whitespace, or up to the end of the paragraph
+_SENTENCE = re.compile(r'\S.*?(?:[.!?]+["\'”’)\]]*(?=\s|$)|$)', re.S)
+_PARAGRAPH = re.compile(r'\n\s*\n')
+# Preferred places to break a sentence that is too long on its own
+_CLAUSE_BREAKS = ("; ", ": ", ", ", " - ", " ")
+
+
+def ssml_length(text: str) -> int:
+    """Length of text once escaped for SSML."""
+    return len(escape(text))
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences, treating blank lines as sentence boundaries."""
+    sentences = []
+    for paragraph in _PARAGRAPH.split(text):
+        paragraph = " ".join(paragraph.split())
+        sentences.extend(match.group(0).strip() for match in _SENTENCE.finditer(paragraph))
+    return [sentence for sentence in sentences if sentence]
+
+
+def _split_long(sentence: str, max_chars: int) -> List[str]:
+    pieces = []
+    while ssml_length(sentence) > max_chars:
+        window = sentence[:max_chars]
+        while ssml_length(window) > max_chars:
+            window = window[:-1]
+        cut = -1
+        for separator in _CLAUSE_BREAKS:
+            cut = window.rfind(separator)
+            if cut > 0:
+                cut += len(separator.rstrip()) if separator.strip() else 0
+                break
+        if cut <= 0:
+            cut = len(window)
+        pieces.append(sentence[:cut].strip())
+        sentence = sentence[cut:].strip()
+    if sentence:
+        pieces.append(sentence)
+    return pieces
+
+
+def chunk_text(text: str, max_chars: int = MAX_CHUNK_CHARS, first_sentence_alone: bool = True) -> List[str]:
+    """
+    Split text into chunks of whole sentences for separate Polly requests.
+
+    Sentences are packed greedily into chunks of at most `max_chars`
+    characters after SSML escaping; a sentence longer than that is broken at
+    a clause boundary or a space. With `first_sentence_alone` the first chunk
+    is just the first sentence, so playback can start as soon as it is
+    synthesized.
+
+    Args:
+        text: Plain text of a turn
+        max_chars: Maximum escaped length of a chunk
+        first_sentence_alone: Put the first sentence in a chunk of its own
+
+    Returns:
+        Chunks in order; joined with spaces they hold every sentence of the text
+    """
+    chunks: List[str] = []
+    current = ""
+    for sentence in split_sentences(text):
+        for piece in _split_long(sentence, max_chars):
+            candidate = f"{current} {piece}" if current else piece
+            if current and ssml_length(candidate) > max_chars:
+                chunks.append(current)
+                current = piece
+            else:
+                current = candidate
+            if first_sentence_alone and not chunks:
+                chunks.append(current)
+                current = ""
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def leading_sentences(text: str, max_chars: int) -> str:
+    """
+    Return the longest run of whole leading sentences within `max_chars`, for
+    scripts that condense turns to a time budget without cutting mid-word.
+    The first sentence is always kept, broken at a clause boundary if needed.
+    """
+    kept = ""
+    for sentence in split_sentences(text):
+        candidate = f"{kept} {sentence}" if kept else sentence
+        if len(candidate) > max_chars:
+            return kept or _split_long(sentence, max_chars)[0]
+        kept = candidate
+    return kept
@@ -0,0 +1,343 @@
+import logging
+import math
+import os
+import struct
+from array import array
+from dataclasses import dataclass
+from typing import BinaryIO, Iterable, Iterator, Optional, Tuple, Union
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+# MPEG versions as encoded in the frame header
+MPEG_25 = 0
+MPEG_2 = 2
+MPEG_1 = 3
+
+# Layer III bitrates (kbps) by bitrate index
+_BITRATES = {
+    MPEG_1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    MPEG_2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_BITRATES[MPEG_25] = _BITRATES[MPEG_2]
+
+_SAMPLE_RATES = {
+    MPEG_1: (44100, 48000, 32000),
+    MPEG_2: (22050, 24000, 16000),
+    MPEG_25: (11025, 12000, 8000),
+}
+
+MONO = 3
+
+_XING_FLAGS = 0x0F  # frames, bytes, TOC and quality fields present
+_XING_SIZE = 4 + 4 + 4 + 4 + 100 + 4
+
+
+@dataclass(frozen=True)
+class FrameHeader:
+    """The fields of an MPEG audio Layer III frame header."""
+    version: int
+    bitrate: int
+    sample_rate: int
+    padding: int
+    channel_mode: int
+    raw: bytes
+
+    @property
+    def samples(self) -> int:
+        """Samples per frame."""
+        return 1152 if self.version == MPEG_1 else 576
+
+    @property
+    def length(self) -> int:
+        """Frame length in bytes, header included."""
+        return frame_length(self.version, self.bitrate, self.sample_rate, self.padding)
+
+    @property
+    def side_info_size(self) -> int:
+        if self.version == MPEG_1:
+            return 17 if self.channel_mode == MONO else 32
+        return 9 if self.channel_mode == MONO else 17
+
+    @property
+    def duration(self) -> float:
+        """Seconds of audio in the frame."""
+        return self.samples / self.sample_rate
+
+    def same_stream(self, other: "FrameHeader") -> bool:
+        """Whether frames can follow each other in one file (only the bitrate may vary)."""
+        return (self.version, self.sample_rate, self.channel_mode) == (
+            other.version, other.sample_rate, other.channel_mode
+        )
+
+
+def frame_length(version: int, bitrate: int, sample_rate: int, padding: int = 0) -> int:
+    """Length in bytes of a Layer III frame."""
+    coefficient = 144 if version == MPEG_1 else 72
+    return coefficient * bitrate * 1000 // sample_rate + padding
+
+
+def parse_header(data, offset: int = 0) -> Optional[FrameHeader]:
+    """Parse the Layer III frame header at an offset; None if there is no valid header there."""
+    if offset + 4 > len(data):
+        return None
+    b0, b1, b2, b3 = data[offset], data[offset + 1], data[offset + 2], data[offset + 3]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+    version = (b1 >> 3) & 0x03
+    layer = (b1 >> 1) & 0x03
+    bitrate_index = b2 >> 4
+    sample_rate_index = (b2 >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+    return FrameHeader(
+        version=version,
+        bitrate=_BITRATES[version][bitrate_index],
+        sample_rate=_SAMPLE_RATES[version][sample_rate_index],
+        padding=(b2 >> 1) & 0x01,
+        channel_mode=b3 >> 6,
+        raw=bytes(data[offset:offset + 4])
+    )
+
+
+def _id3v2_size(data, offset: int) -> int:
+    if data[offset:offset + 3] != b"ID3" or offset + 10 > len(data):
+        return 0
+    size = 0
+    for byte in data[offset + 6:offset + 10]:
+        size = (size << 7) | (byte & 0x7F)
+    footer = 10 if data[offset + 5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _is_vbr_header(header: FrameHeader, frame) -> bool:
+    tag_offset = 4 + header.side_info_size
+    return bytes(frame[tag_offset:tag_offset + 4]) in (b"Xing", b"Info") or bytes(frame[36:40]) == b"VBRI"
+
+
+def iter_frames(data: bytes) -> Iterator[Tuple[FrameHeader, memoryview]]:
+    """
+    Yield the audio frames of an MP3 file.
+
+    ID3v2 tags (anywhere), a trailing ID3v1 tag and Xing/Info/VBRI header
+    frames are skipped, as is any garbage between frames: after garbage (and
+    at the start) a sync word only counts as a frame when the frame after it
+    also starts with a matching header (or ends the data).
+    """
+    view = memoryview(data)
+    end = len(data)
+    if end >= 128 and bytes(view[end - 128:end - 125]) == b"TAG":
+        end -= 128
+    offset = 0
+    first = True
+    synced = False
+    while offset + 4 <= end:
+        tag = _id3v2_size(view, offset)
+        if tag:
+            offset += tag
+            continue
+        header = parse_header(view, offset)
+        if header is None or offset + header.length > end:
+            synced = False
+            offset += 1
+            continue
+        following = offset + header.length
+        if not synced and following + 4 <= end and _id3v2_size(view, following) == 0:
+            next_header = parse_header(view, following)
+            if next_header is None or not next_header.same_stream(header):
+                offset += 1
+                continue
+        frame = view[offset:offset + header.length]
+        if not (first and _is_vbr_header(header, frame)):
+            yield header, frame
+        first = False
+        synced = True
+        offset += header.length
+
+
+def _frame_header_bytes(template: FrameHeader, bitrate: int) -> bytes:
+    bitrate_index = _BITRATES[template.version].index(bitrate)
+    b0, b1, b2, b3 = template.raw
+    # Clear the protection bit (no CRC follows), set bitrate, clear padding
+    b1 |= 0x01
+    b2 = (bitrate_index << 4) | (b2 & 0x0C)
+    return bytes((b0, b1, b2, b3))
+
+
+def silence_frame(template: FrameHeader) -> bytes:
+    """
+    A frame of digital silence in the format of `template`.
+
+    All side information is zero (no Huffman data, global gain 0), which
+    every decoder renders as silence; the lowest bitrate keeps it small.
+    """
+    bitrate = _BITRATES[template.version][1]
+    header = _frame_header_bytes(template, bitrate)
+    return header + bytes(frame_length(template.version, bitrate, template.sample_rate) - 4)
+
+
+def _xing_bitrate(template: FrameHeader) -> int:
+    needed = 4 + template.side_info_size + _XING_SIZE
+    for bitrate in _BITRATES[template.version][1:]:
+        if frame_length(template.version, bitrate, template.sample_rate) >= needed:
+            return bitrate
+    raise ValueError("No bitrate holds a Xing header")
+
+
+def xing_frame(template: FrameHeader, frame_count: int, byte_count: int, toc: bytes) -> bytes:
+    """A Xing VBR header frame carrying the frame count, byte count and seek table of a file."""
+    bitrate = _xing_bitrate(template)
+    length = frame_length(template.version, bitrate, template.sample_rate)
+    frame = bytearray(length)
+    frame[0:4] = _frame_header_bytes(template, bitrate)
+    offset = 4 + template.side_info_size
+    frame[offset:offset + _XING_SIZE] = (
+        b"Xing" + struct.pack(">III", _XING_FLAGS, frame_count, byte_count) + toc + struct.pack(">I", 0)
+    )
+    return bytes(frame)
+
+
+class Mp3Assembler:
+    """
+    Joins MP3 files into one well-formed MP3 in a single pass.
+
+    Each added file is parsed frame by frame: its ID3 tags and Xing/Info
+    headers are dropped and its audio frames are written to the output as
+    they are parsed. Silence frames can be inserted between files (e.g.
+    between speakers). On close, a Xing header with the total frame count,
+    byte count and a 100-point seek table is written at the start, so players
+    show the correct duration and seek quickly even though bitrates vary.
+
+    The header needs a seekable output (a file or BytesIO); on a
+    non-seekable stream the frames are written without one. All files must
+    share the MPEG version, sample rate and channel mode of the first.
+    """
+
+    def __init__(self, output: BinaryIO):
+        """
+        Initialize the assembler.
+
+        Args:
+            output: Binary file or buffer, positioned where the MP3 should start
+        """
+        self.output = output
+        self.template: Optional[FrameHeader] = None
+        self.frames = 0
+        self.audio_bytes = 0
+        self.duration = 0.0
+        self._offsets = array('Q')
+        self._start = None
+        self._header_length = 0
+        self._closed = False
+        try:
+            self._seekable = output.seekable()
+        except (AttributeError, ValueError):
+            self._seekable = False
+
+    def add(self, data: bytes) -> int:
+        """
+        Append the audio frames of an MP3 file.
+
+        Returns:
+            Number of frames appended
+
+        Raises:
+            ValueError: If the file's format differs from the earlier files
+        """
+        count = 0
+        for header, frame in iter_frames(data):
+            if self.template is None:
+                self._begin(header)
+            elif not header.same_stream(self.template):
+                raise ValueError(
+                    f"Cannot join MP3 streams of different formats: {header.sample_rate} Hz "
+                    f"after {self.template.sample_rate} Hz"
+                )
+            self._write_frame(frame, header.duration)
+            count += 1
+        return count
+
+    def add_silence(self, seconds: float) -> int:
+        """
+        Append silence of at least `seconds` (rounded up to whole frames).
+
+        Silence before the first file is dropped, since the format is unknown
+        until then.
+
+        Returns:
+            Number of frames appended
+        """
+        if self.template is None or seconds <= 0:
+            return 0
+        frame = silence_frame(self.template)
+        count = math.ceil(seconds / self.template.duration)
+        for _ in range(count):
+            self._write_frame(frame, self.template.duration)
+        return count
+
+    def close(self) -> None:
+        """Write the Xing header (seekable outputs) and leave the output after the last frame."""
+        if self._closed:
+            return
+        self._closed = True
+        if self.template is None or not self._seekable:
+            return
+        end = self.output.tell()
+        self.output.seek(self._start)
+        self.output.write(self._xing())
+        self.output.seek(end)
+
+    def _begin(self, header: FrameHeader) -> None:
+        self.template = header
+        if self._seekable:
+            self._start = self.output.tell()
+            # Placeholder of the final header's size, filled in on close
+            placeholder = xing_frame(header, 0, 0, bytes(100))
+            self._header_length = len(placeholder)
+            self.output.write(placeholder)
+
+    def _write_frame(self, frame, duration: float) -> None:
+        self._offsets.append(self.audio_bytes)
+        self.output.write(frame)
+        self.frames += 1
+        self.audio_bytes += len(frame)
+        self.duration += duration
+
+    def _xing(self) -> bytes:
+        total = self._header_length + self.audio_bytes
+        toc = bytearray(100)
+        if self.frames:
+            for percent in range(100):
+                index = min(self.frames - 1, int(percent / 100 * self.frames))
+                position = self._header_length + self._offsets[index]
+                toc[percent] = min(255, int(256 * position / total))
+        return xing_frame(self.template, self.frames, total, bytes(toc))
+
+    def __enter__(self) -> "Mp3Assembler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def concat_mp3(parts: Iterable[bytes], output: Union[str, os.PathLike, BinaryIO], gap: float = 0.0) -> float:
+    """
+    Join MP3 files into one, with `gap` seconds of silence between them.
+
+    Args:
+        parts: MP3 files, in order
+        output: Path or binary file to write
+        gap: Seconds of silence between consecutive parts
+
+    Returns:
+        Duration of the joined audio in seconds
+    """
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, 'wb') as f:
+            return concat_mp3(parts, f, gap)
+    with Mp3Assembler(output) as assembler:
+        for index, part in enumerate(parts):
+            if index and gap:
+                assembler.add_silence(gap)
+            assembler.add(part)
+    return assembler.duration
@@ -0,0 +1,197 @@
+import asyncio
+import logging
+from collections import deque
+from dataclasses import replace
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from .chunker import split_sentences
+from .pipeline import AudioPipeline, AudioSegment
+from .store import AudioStore
+from .tts_cache import tts_key
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+# Polly voice and language per expert, as in generate_panel_audio.py
+EXPERT_VOICES: Dict[str, Tuple[str, str]] = {
+    "jeff_barr": ("Matthew", "en-US"),
+    "swami": ("Stephen", "en-US"),
+    "werner_vogels": ("Arthur", "en-GB"),
+}
+
+# Voices by speaking position within a round, for experts without an entry above
+TURN_VOICES: List[Tuple[str, str]] = [("Matthew", "en-US"), ("Stephen", "en-US"), ("Arthur", "en-GB")]
+
+# Events of a turn or synthesis in progress; they are delivered as they arrive
+# rather than held back behind a completed turn's audio
+LIVE_EVENTS = {'expert_speaking', 'synthesis_partial', 'synthesis_restarted', 'mermaid_node', 'mermaid_edge'}
+
+_DONE = object()
+
+
+def is_live(event: dict) -> bool:
+    """Whether an event is streaming progress rather than a completed step of the debate."""
+    if event.get('type') == 'expert_response':
+        return not event.get('isComplete', True)
+    return event.get('type') in LIVE_EVENTS
+
+
+def audio_key(segment: AudioSegment) -> str:
+    """Content address of a segment's audio: the same text and voice always map to the same key."""
+    return f"{tts_key(segment)}.mp3"
+
+
+class TurnNarrator:
+    """
+    Adds Polly audio to the expert turns of a debate event stream.
+
+    `narrate` runs the debate ahead of its consumer. A turn's first sentence
+    is synthesized as soon as it appears in the turn's streaming text, and the
+    rest once the turn is complete, in the background while the debate goes on
+    to the next expert's model call. Only playback is ordered: completed turns
+    (and the round and debate events after them) are delivered in order, each
+    once its audio is published, with an `audioUrl`; streaming events are
+    delivered as they arrive. TTS latency is hidden behind the next turn's LLM
+    latency; a turn whose audio fails is delivered without one.
+    """
+
+    def __init__(self, pipeline: AudioPipeline, store: AudioStore, voices: Optional[Dict[str, Tuple[str, str]]] = None):
+        """
+        Initialize the narrator.
+
+        Args:
+            pipeline: Polly pipeline to synthesize turns on
+            store: Where audio is published for the website
+            voices: (voice ID, language code) per expert ID
+        """
+        self.pipeline = pipeline
+        self.store = store
+        self.voices = EXPERT_VOICES if voices is None else voices
+
+    def segment(self, expert_id: str, position: int, text: str) -> AudioSegment:
+        """Build the audio segment of a turn from its expert and speaking position in the round."""
+        voice_id, language_code = self.voices.get(expert_id) or TURN_VOICES[position % len(TURN_VOICES)]
+        return AudioSegment(text, voice_id, language_code=language_code)
+
+    async def audio_url(self, segment: AudioSegment, head: Optional[Tuple[str, asyncio.Future]] = None) -> Optional[str]:
+        """
+        Synthesize and publish a segment; None (logged) on failure.
+
+        Args:
+            segment: The turn to narrate
+            head: (first sentence, audio future) when the first sentence was
+                already submitted from the turn's streaming text; only the rest
+                of the turn is synthesized then
+        """
+        try:
+            audio = await self._synthesize(segment, head)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.store.publish, audio_key(segment), audio)
+        except Exception as e:
+            logger.error(f"Audio generation failed for voice {segment.voice_id}: {e}")
+            return None
+
+    async def _synthesize(self, segment: AudioSegment, head: Optional[Tuple[str, asyncio.Future]]) -> bytes:
+        if head is not None:
+            first_sentence, first_audio = head
+            sentences = split_sentences(segment.text)
+            if sentences and sentences[0] == first_sentence:
+                rest = " ".join(sentences[1:])
+                if not rest:
+                    return await first_audio
+                parts = await asyncio.gather(first_audio, self.pipeline.synthesize_async(replace(segment, text=rest)))
+                return b"".join(parts)
+            # The final text does not start with the streamed sentence
+            first_audio.cancel()
+        return await self.pipeline.synthesize_async(segment)
+
+    async def narrate(self, events: AsyncIterator[dict], skip: Callable[[dict], bool] = lambda event: False):
+        """
+        Yield the events of a debate with `audioUrl` set on completed expert turns.
+
+        Args:
+            events: Debate events (see orchestrator.app.run_debate)
+            skip: Completed turns for which no audio is generated (e.g. failed turns)
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        # First-sentence syntheses started from streaming text, to cancel on early exit
+        heads: List[asyncio.Future] = []
+
+        async def pump():
+            position = 0
+            # Streaming text and first-sentence audio of turns in progress, by (expertId, round)
+            texts: Dict[tuple, str] = {}
+            started: Dict[tuple, Tuple[str, asyncio.Future]] = {}
+            try:
+                async for event in events:
+                    audio = None
+                    if event.get('type') == 'expert_response':
+                        turn = (event.get('expertId', ''), event.get('round'))
+                        if not event.get('isComplete', True):
+                            text = texts[turn] = texts.get(turn, "") + event['content']
+                            sentences = split_sentences(text) if turn not in started else []
+                            if len(sentences) > 1:
+                                segment = self.segment(turn[0], position, sentences[0])
+                                started[turn] = (sentences[0], asyncio.ensure_future(self.pipeline.synthesize_async(segment)))
+                                heads.append(started[turn][1])
+                        else:
+                            texts.pop(turn, None)
+                            head = started.pop(turn, None)
+                            if not skip(event):
+                                segment = self.segment(turn[0], position, event['content'])
+                                audio = asyncio.ensure_future(self.audio_url(segment, head))
+                            elif head is not None:
+                                head[1].cancel()
+                            position += 1
+                    elif event.get('type') == 'round_complete':
+                        position = 0
+                    queue.put_nowait((event, audio))
+            except Exception as e:
+                queue.put_nowait((e, None))
+            queue.put_nowait((_DONE, None))
+
+        producer = asyncio.ensure_future(pump())
+        # Completed steps waiting, in order, for the audio of the turn at the front
+        held: deque = deque()
+        getter = None
+        error = None
+        finished = False
+        try:
+            while True:
+                while held and (held[0][1] is None or held[0][1].done()):
+                    event, audio = held.popleft()
+                    url = audio.result() if audio is not None else None
+                    yield dict(event, audioUrl=url) if url else event
+                if finished:
+                    if not held:
+                        break
+                    await asyncio.wait([held[0][1]])
+                    continue
+                if getter is None:
+                    getter = asyncio.ensure_future(queue.get())
+                waiting = [getter, held[0][1]] if held else [getter]
+                await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    continue
+                event, audio = getter.result()
+                getter = None
+                if event is _DONE or isinstance(event, Exception):
+                    finished = True
+                    error = event if isinstance(event, Exception) else None
+                elif is_live(event):
+                    yield event
+                else:
+                    held.append((event, audio))
+            if error is not None:
+                raise error
+        finally:
+            # The consumer stopped early: stop the debate and any audio still pending
+            producer.cancel()
+            if getter is not None:
+                getter.cancel()
+            pending = [audio for _, audio in held]
+            while not queue.empty():
+                pending.append(queue.get_nowait()[1])
+            for future in pending + heads:
+                if future is not None:
+                    future.cancel()
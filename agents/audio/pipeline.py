@@ -0,0 +1,274 @@
+import asyncio
+import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
+from xml.sax.saxutils import escape
+
+from aws_clients import get_client
+from .chunker import MAX_CHUNK_CHARS, chunk_text
+from .mp3 import Mp3Assembler
+from .tts_cache import TTSCache, default_tts_cache
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+# Polly requests in flight at once; Polly's default neural TPS quota is 8
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Marks the cache argument as "use the process-wide TTS cache"
+_DEFAULT_CACHE = object()
+
+
+@dataclass(frozen=True)
+class AudioSegment:
+    """
+    One piece of speech to synthesize.
+
+    Plain text is escaped and wrapped in SSML when a prosody `rate` is set;
+    text_type='ssml' passes `text` to Polly unchanged.
+    """
+    text: str
+    voice_id: str
+    engine: str = "neural"
+    language_code: Optional[str] = None
+    rate: Optional[str] = None
+    text_type: str = "text"
+
+    def request(self) -> dict:
+        """Return the Polly synthesize_speech arguments for this segment."""
+        text = self.text
+        text_type = self.text_type
+        if text_type == "text" and self.rate:
+            text = f'<speak><prosody rate="{self.rate}">{escape(text)}</prosody></speak>'
+            text_type = "ssml"
+        request = {
+            "Text": text,
+            "TextType": text_type,
+            "OutputFormat": "mp3",
+            "VoiceId": self.voice_id,
+            "Engine": self.engine,
+        }
+        if self.language_code:
+            request["LanguageCode"] = self.language_code
+        return request
+
+    def chunks(self, max_chars: int = MAX_CHUNK_CHARS) -> List["AudioSegment"]:
+        """
+        Split plain text at sentence boundaries into segments that each fit one
+        Polly request (see chunk_text). SSML segments are returned whole.
+        """
+        if self.text_type != "text":
+            return [self]
+        pieces = chunk_text(self.text, max_chars)
+        if len(pieces) <= 1:
+            return [self]
+        return [replace(self, text=piece) for piece in pieces]
+
+
+class AudioPipeline:
+    """
+    Concurrent Polly synthesis with ordered output.
+
+    Segments are synthesized on a bounded thread pool (POLLY_MAX_CONCURRENCY,
+    default 4) and their MP3 bytes are returned or streamed in the order the
+    segments were given, so a whole debate costs about as long as its slowest
+    few segments instead of the sum of all of them. Nothing is written to
+    temporary files. Audio is read from and written to the TTS cache, so the
+    same text in the same voice is only ever synthesized once.
+
+    Long text is never truncated: each segment is split at sentence
+    boundaries into chunks that fit a Polly request, the chunks are
+    synthesized concurrently and their audio is joined in order. `stream`
+    yields audio chunk by chunk, so playback can start once the first
+    sentence is ready.
+
+    `submit` / `synthesize_async` synthesize a single turn in the background,
+    for callers (the orchestrator) that produce segments one at a time.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        client=None,
+        region_name: Optional[str] = None,
+        cache: Optional[TTSCache] = _DEFAULT_CACHE,
+        max_chunk_chars: int = MAX_CHUNK_CHARS
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            max_concurrency: Polly requests in flight at once
+            client: Polly client; the shared client is used if omitted
+            region_name: Polly region (default: POLLY_REGION or us-east-1)
+            cache: TTS cache; the process-wide cache (see TTS_CACHE) if omitted, None to disable
+            max_chunk_chars: Maximum characters of text per Polly request
+        """
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv('POLLY_MAX_CONCURRENCY', str(DEFAULT_MAX_CONCURRENCY)))
+        self.max_concurrency = max(1, max_concurrency)
+        self.region_name = region_name or os.getenv('POLLY_REGION', 'us-east-1')
+        self._client = client
+        self._cache = cache
+        self.max_chunk_chars = max_chunk_chars
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="polly")
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_client('polly', region_name=self.region_name)
+        return self._client
+
+    @property
+    def cache(self) -> Optional[TTSCache]:
+        if self._cache is _DEFAULT_CACHE:
+            self._cache = default_tts_cache()
+        return self._cache
+
+    def synthesize(self, segment: AudioSegment) -> bytes:
+        """
+        Synthesize one segment, chunk by chunk, in the calling thread and return its MP3 bytes.
+
+        Polly returns bare constant-bitrate frames in one format per voice, so
+        the chunks of a segment are joined as they are.
+        """
+        return b"".join(self._synthesize_chunk(chunk) for chunk in segment.chunks(self.max_chunk_chars))
+
+    def submit(self, segment: AudioSegment) -> Future:
+        """Start synthesizing one segment in the background; the future resolves to its MP3 bytes."""
+        return _join_futures([
+            self._executor.submit(self._synthesize_chunk, chunk)
+            for chunk in segment.chunks(self.max_chunk_chars)
+        ])
+
+    async def synthesize_async(self, segment: AudioSegment) -> bytes:
+        """Synthesize one segment without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(segment))
+
+    def stream(self, segments: Iterable[AudioSegment]) -> Iterator[bytes]:
+        """
+        Yield MP3 audio chunk by chunk, in order, as soon as each chunk and all
+        chunks before it are ready; joined, the chunks are the segments' audio.
+
+        At most twice max_concurrency chunks are submitted ahead of the one
+        being yielded, which bounds both Polly concurrency and buffered audio.
+        """
+        for _, audio in self._stream_chunks(segments):
+            yield audio
+
+    def synthesize_all(self, segments: Iterable[AudioSegment]) -> List[bytes]:
+        """Synthesize all segments concurrently and return their MP3 bytes in order."""
+        futures = [self.submit(segment) for segment in segments]
+        try:
+            return [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def write(
+        self,
+        segments: Iterable[AudioSegment],
+        output: Union[str, os.PathLike, BinaryIO],
+        gap: float = 0.0
+    ) -> float:
+        """
+        Synthesize all segments into one MP3 written to a path or binary file.
+
+        Audio is assembled frame by frame as it streams in (see Mp3Assembler):
+        per-file tags and VBR headers are dropped, `gap` seconds of silence
+        separate consecutive segments, and one VBR header indexes the result.
+
+        Returns:
+            Duration of the written audio in seconds
+        """
+        if isinstance(output, (str, os.PathLike)):
+            with open(output, 'wb') as f:
+                return self.write(segments, f, gap)
+        with Mp3Assembler(output) as assembler:
+            previous = 0
+            for index, audio in self._stream_chunks(segments):
+                if index != previous and gap:
+                    assembler.add_silence(gap)
+                previous = index
+                assembler.add(audio)
+        return assembler.duration
+
+    def _stream_chunks(self, segments: Iterable[AudioSegment]) -> Iterator[Tuple[int, bytes]]:
+        """Yield (segment index, chunk audio) in order; see stream."""
+        pending: deque = deque()
+        window = self.max_concurrency * 2
+        try:
+            for index, segment in enumerate(segments):
+                for chunk in segment.chunks(self.max_chunk_chars):
+                    pending.append((index, self._executor.submit(self._synthesize_chunk, chunk)))
+                    if len(pending) >= window:
+                        index_ready, future = pending.popleft()
+                        yield index_ready, future.result()
+            while pending:
+                index_ready, future = pending.popleft()
+                yield index_ready, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+    def _synthesize_chunk(self, segment: AudioSegment) -> bytes:
+        """Synthesize text that fits one Polly request, through the TTS cache."""
+        cache = self.cache
+        if cache is not None:
+            audio = cache.get(segment)
+            if audio is not None:
+                return audio
+        response = self.client.synthesize_speech(**segment.request())
+        stream = response['AudioStream']
+        try:
+            audio = stream.read()
+        finally:
+            stream.close()
+        if cache is not None:
+            cache.put(segment, audio)
+        return audio
+
+    def close(self) -> None:
+        """Stop the worker threads once queued segments finish."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "AudioPipeline":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _join_futures(futures: List[Future]) -> Future:
+    """Return a future of the concatenated results; it fails as soon as any part fails."""
+    joined: Future = Future()
+    lock = threading.Lock()
+
+    def on_done(_):
+        with lock:
+            if joined.done():
+                return
+            failed = next((f for f in futures if f.done() and (f.cancelled() or f.exception())), None)
+            if failed is not None:
+                for future in futures:
+                    future.cancel()
+                if failed.cancelled():
+                    joined.cancel()
+                else:
+                    joined.set_exception(failed.exception())
+            elif all(f.done() for f in futures):
+                joined.set_result(b"".join(f.result() for f in futures))
+
+    def on_cancel(_):
+        if joined.cancelled():
+            for future in futures:
+                future.cancel()
+
+    joined.add_done_callback(on_cancel)
+    for future in futures:
+        future.add_done_callback(on_done)
+    return joined
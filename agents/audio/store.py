@@ -0,0 +1,82 @@
+import base64
+import logging
+import os
+from typing import Optional
+
+from aws_clients import get_client
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+
+class AudioStore:
+    """Makes synthesized audio available to the website under a URL."""
+
+    def publish(self, key: str, audio: bytes) -> str:
+        """Store MP3 audio under a key and return a URL the browser can play."""
+        raise NotImplementedError
+
+
+class DataUrlStore(AudioStore):
+    """Inline the audio as a data: URL; needs no storage, but events carry the whole clip."""
+
+    def publish(self, key: str, audio: bytes) -> str:
+        return "data:audio/mpeg;base64," + base64.b64encode(audio).decode("ascii")
+
+
+class S3AudioStore(AudioStore):
+    """
+    Upload audio to an S3-compatible bucket.
+
+    URLs are presigned GET URLs valid for `url_expires` seconds, or
+    `base_url` + key when the bucket is served publicly (e.g. by CloudFront).
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        client=None,
+        base_url: Optional[str] = None,
+        url_expires: int = 86400
+    ):
+        self.bucket = bucket
+        self.prefix = prefix
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.url_expires = url_expires
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_client('s3')
+        return self._client
+
+    def publish(self, key: str, audio: bytes) -> str:
+        key = self.prefix + key
+        self.client.put_object(Bucket=self.bucket, Key=key, Body=audio, ContentType="audio/mpeg")
+        if self.base_url:
+            return f"{self.base_url}/{key}"
+        return self.client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': self.bucket, 'Key': key},
+            ExpiresIn=self.url_expires
+        )
+
+
+def create_audio_store() -> AudioStore:
+    """
+    Create the audio store configured by the environment.
+
+    AUDIO_BUCKET selects S3 (with AUDIO_PREFIX, AUDIO_BASE_URL and
+    AUDIO_URL_EXPIRES); without it audio is returned as data: URLs.
+    """
+    bucket = os.getenv('AUDIO_BUCKET')
+    if not bucket:
+        return DataUrlStore()
+    return S3AudioStore(
+        bucket,
+        prefix=os.getenv('AUDIO_PREFIX', 'debate-audio/'),
+        base_url=os.getenv('AUDIO_BASE_URL'),
+        url_expires=int(os.getenv('AUDIO_URL_EXPIRES', '86400'))
+    )
@@ -0,0 +1,58 @@
+"""Unit tests for sentence chunking of Polly requests."""
+
+import pytest
+
+from audio.chunker import chunk_text, leading_sentences, split_sentences, ssml_length
+
+
+class TestChunker:
+    """Test suite for the sentence chunker."""
+
+    def test_split_sentences(self):
+        """Test sentence boundaries, closing quotes, paragraphs and unterminated text."""
+        text = 'Start simple. Then "ship it." Really?\n\nA new paragraph without a stop\nthat wraps. Done!'
+        assert split_sentences(text) == [
+            "Start simple.",
+            'Then "ship it."',
+            "Really?",
+            "A new paragraph without a stop that wraps.",
+            "Done!",
+        ]
+
+    def test_chunks_keep_every_word(self):
+        """Test chunks pack whole sentences under the limit and lose no text."""
+        text = " ".join(f"Sentence number {n} is about scaling & cost." for n in range(60))
+        chunks = chunk_text(text, max_chars=200)
+
+        assert chunks[0] == "Sentence number 0 is about scaling & cost.", "First sentence stands alone"
+        assert all(ssml_length(chunk) <= 200 for chunk in chunks), "Limits apply after SSML escaping"
+        assert all(chunk.endswith(".") for chunk in chunks), "Chunks end at sentence boundaries"
+        assert " ".join(chunks) == text
+
+    def test_long_sentence_breaks_at_clauses(self):
+        """Test a sentence longer than the limit is broken at commas, then spaces."""
+        sentence = ", ".join(["serverless functions"] * 30) + "."
+        chunks = chunk_text(sentence, max_chars=100, first_sentence_alone=False)
+
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 100 for chunk in chunks)
+        assert all(chunk.endswith((",", ".")) for chunk in chunks)
+        assert " ".join(chunks) == sentence
+
+        unbroken = "x" * 250
+        assert chunk_text(unbroken, max_chars=100) == ["x" * 100, "x" * 100, "x" * 50]
+
+    def test_leading_sentences(self):
+        """Test condensing to whole sentences within a budget."""
+        text = "One two three. Four five six. Seven eight nine."
+        assert leading_sentences(text, 30) == "One two three. Four five six."
+        assert leading_sentences(text, 100) == text
+        assert leading_sentences("A very long first sentence, with a clause.", 30) == "A very long first sentence,"
+
+    def test_empty_text(self):
+        """Test empty text produces no chunks."""
+        assert chunk_text("   \n\n ") == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
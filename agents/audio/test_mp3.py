@@ -0,0 +1,127 @@
+"""Unit tests for frame-aware MP3 assembly."""
+
+import io
+import struct
+
+import pytest
+
+from audio.mp3 import MPEG_1, MPEG_2, Mp3Assembler, concat_mp3, iter_frames, parse_header, silence_frame
+
+_BITRATE_INDEX = {MPEG_2: {8: 1, 32: 4, 48: 6, 64: 8}, MPEG_1: {128: 9, 192: 11}}
+
+
+def make_frame(payload=b"", bitrate=48, version=MPEG_2, mono=True):
+    """Build a Layer III frame (24 kHz for MPEG-2, 44.1 kHz for MPEG-1) carrying payload after its side info."""
+    b1 = 0xE0 | (version << 3) | (1 << 1) | 1
+    sample_rate_index = 1 if version == MPEG_2 else 0
+    b2 = (_BITRATE_INDEX[version][bitrate] << 4) | (sample_rate_index << 2)
+    b3 = 0xC0 if mono else 0x00
+    header = bytes((0xFF, b1, b2, b3))
+    sample_rate = 24000 if version == MPEG_2 else 44100
+    length = (72 if version == MPEG_2 else 144) * bitrate * 1000 // sample_rate
+    side_info = 9 if version == MPEG_2 and mono else 32 if version == MPEG_1 and not mono else 17
+    body = bytes(side_info) + payload
+    return header + body + bytes(length - 4 - len(body))
+
+
+def id3v2(size=20):
+    syncsafe = bytes(((size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F))
+    return b"ID3\x04\x00\x00" + syncsafe + bytes(size)
+
+
+def xing_header_frame():
+    frame = bytearray(make_frame(bitrate=64))
+    frame[13:17] = b"Info"
+    return bytes(frame)
+
+
+def payloads(data):
+    return [bytes(frame[13:18]).rstrip(b"\0") for _, frame in iter_frames(data)]
+
+
+class TestFrameParsing:
+    """Test suite for MP3 frame parsing."""
+
+    def test_parse_header(self):
+        """Test header fields and frame length of MPEG-1 and MPEG-2 frames."""
+        header = parse_header(make_frame())
+        assert (header.version, header.bitrate, header.sample_rate, header.samples) == (MPEG_2, 48, 24000, 576)
+        assert header.length == 144
+
+        header = parse_header(make_frame(bitrate=128, version=MPEG_1, mono=False))
+        assert (header.sample_rate, header.samples, header.length) == (44100, 1152, 417)
+
+        assert parse_header(b"\xff\xfb") is None
+        assert parse_header(b"ID3\x04") is None
+
+    def test_iter_frames_skips_tags_and_vbr_headers(self):
+        """Test ID3v2/ID3v1 tags, Xing/Info headers and garbage are dropped."""
+        data = (
+            id3v2()
+            + xing_header_frame()
+            + make_frame(b"one")
+            + b"\x00\xff\x12junk"
+            + make_frame(b"two", bitrate=32)
+            + b"TAG" + bytes(125)
+        )
+        assert payloads(data) == [b"one", b"two"]
+
+
+class TestMp3Assembler:
+    """Test suite for Mp3Assembler and concat_mp3."""
+
+    def test_concat_writes_one_vbr_header(self):
+        """Test files are joined frame by frame under a single Xing header with a seek table."""
+        first = id3v2() + xing_header_frame() + make_frame(b"a1") + make_frame(b"a2", bitrate=64)
+        second = xing_header_frame() + make_frame(b"b1", bitrate=32)
+        buffer = io.BytesIO()
+
+        duration = concat_mp3([first, second], buffer)
+        data = buffer.getvalue()
+
+        assert duration == pytest.approx(3 * 576 / 24000)
+        assert data.count(b"Xing") == 1 and b"Info" not in data and b"ID3" not in data
+        # The header is the first frame; readers skip it as metadata
+        assert payloads(data) == [b"a1", b"a2", b"b1"]
+        xing = data.index(b"Xing")
+        flags, frames, total = struct.unpack(">III", data[xing + 4:xing + 16])
+        assert (flags, frames, total) == (0x0F, 3, len(data))
+        toc = data[xing + 16:xing + 116]
+        assert list(toc) == sorted(toc), "Seek table should be monotonic"
+
+    def test_silence_between_speakers(self):
+        """Test gaps are filled with whole silence frames in the stream's format."""
+        buffer = io.BytesIO()
+        duration = concat_mp3([make_frame(b"a"), make_frame(b"b")], buffer, gap=0.05)
+
+        frames = list(iter_frames(buffer.getvalue()))
+        silence = silence_frame(parse_header(make_frame()))
+        # 0.05s at 24 ms per frame rounds up to 3 frames
+        assert len(frames) == 5
+        assert all(bytes(frame) == silence for _, frame in frames[1:4])
+        assert duration == pytest.approx(5 * 576 / 24000)
+
+    def test_mismatched_formats_rejected(self):
+        """Test that joining different sample rates raises ValueError."""
+        assembler = Mp3Assembler(io.BytesIO())
+        assembler.add(make_frame())
+        with pytest.raises(ValueError):
+            assembler.add(make_frame(bitrate=128, version=MPEG_1))
+
+    def test_non_seekable_output(self):
+        """Test streaming to a non-seekable output writes the frames without a header."""
+        written = []
+
+        class Pipe:
+            def write(self, data):
+                written.append(bytes(data))
+
+            def seekable(self):
+                return False
+
+        concat_mp3([make_frame(b"a"), make_frame(b"b")], Pipe())
+        assert b"".join(written) == make_frame(b"a") + make_frame(b"b")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,195 @@
+"""Unit tests for turn narration and audio stores."""
+
+import asyncio
+import base64
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from audio import AudioSegment, DataUrlStore, S3AudioStore, TurnNarrator, audio_key
+
+
+class FakePipeline:
+    """Pipeline whose audio is the segment's voice and text, after a delay."""
+
+    def __init__(self, delay=0.0, fail_on=None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.segments = []
+
+    async def synthesize_async(self, segment):
+        self.segments.append(segment)
+        await asyncio.sleep(self.delay)
+        if segment.text == self.fail_on:
+            raise RuntimeError("Polly down")
+        return f"{segment.voice_id}:{segment.text}".encode()
+
+
+class FakeStore:
+    def publish(self, key, audio):
+        return "https://audio.example.com/" + audio.decode()
+
+
+def turn(expert_id, content, complete=True):
+    return {"type": "expert_response", "expertId": expert_id, "content": content, "isComplete": complete}
+
+
+class TestTurnNarrator:
+    """Test suite for TurnNarrator."""
+
+    def test_attaches_audio_in_order(self):
+        """Test completed turns carry their audio URL and event order is unchanged."""
+        narrator = TurnNarrator(FakePipeline(), FakeStore())
+        events = [
+            {"type": "session_started"},
+            turn("jeff_barr", "Hel", complete=False),
+            turn("jeff_barr", "Hello"),
+            turn("guest_expert", "Hi"),
+            {"type": "round_complete", "roundNumber": 1},
+            turn("guest_expert", "Again"),
+            {"type": "debate_complete"},
+        ]
+
+        async def source():
+            for event in events:
+                yield event
+
+        async def collect():
+            return [event async for event in narrator.narrate(source())]
+
+        narrated = asyncio.run(collect())
+        assert [event["type"] for event in narrated] == [event["type"] for event in events]
+        assert "audioUrl" not in narrated[1], "Partial text has no audio"
+        assert narrated[2]["audioUrl"] == "https://audio.example.com/Matthew:Hello"
+        # Experts without a voice of their own get one by speaking position in the round
+        assert narrated[3]["audioUrl"] == "https://audio.example.com/Stephen:Hi"
+        assert narrated[5]["audioUrl"] == "https://audio.example.com/Matthew:Again"
+
+    def test_audio_overlaps_next_turn(self):
+        """Test the next turn is produced while the previous turn's audio is synthesized."""
+        narrator = TurnNarrator(FakePipeline(delay=0.2), FakeStore())
+        produced = {}
+
+        async def source():
+            for name in ["first", "second", "third"]:
+                await asyncio.sleep(0.2)  # the expert's model call
+                produced[name] = time.monotonic()
+                yield turn("jeff_barr", name)
+
+        async def collect():
+            started = time.monotonic()
+            events = [event async for event in narrator.narrate(source())]
+            return events, time.monotonic() - started
+
+        events, elapsed = asyncio.run(collect())
+        assert all("audioUrl" in event for event in events)
+        # Three model calls plus only the last turn's audio, not 3 x (call + audio)
+        assert elapsed < 1.0
+
+    def test_first_sentence_starts_from_streaming_text(self):
+        """Test a turn's first sentence is synthesized while the turn is still streaming."""
+        pipeline = FakePipeline()
+        narrator = TurnNarrator(pipeline, FakeStore())
+        submitted_before_complete = []
+
+        async def source():
+            for delta in ["Serverless ", "first. Then ", "the rest", "."]:
+                yield dict(turn("jeff_barr", delta, complete=False), round=1)
+                await asyncio.sleep(0.01)
+            submitted_before_complete.extend(segment.text for segment in pipeline.segments)
+            yield dict(turn("jeff_barr", "Serverless first. Then the rest."), round=1)
+
+        async def collect():
+            return [event async for event in narrator.narrate(source())]
+
+        events = asyncio.run(collect())
+        assert submitted_before_complete == ["Serverless first."]
+        assert [segment.text for segment in pipeline.segments] == ["Serverless first.", "Then the rest."]
+        assert events[-1]["audioUrl"] == "https://audio.example.com/Matthew:Serverless first.Matthew:Then the rest."
+
+    def test_streaming_is_not_held_behind_audio(self):
+        """Test the next turn streams while the previous turn's audio is synthesized; playback stays ordered."""
+        narrator = TurnNarrator(FakePipeline(delay=0.3), FakeStore())
+
+        async def source():
+            yield turn("jeff_barr", "Hello")
+            yield {"type": "expert_speaking", "expertId": "swami"}
+            yield turn("swami", "Hi ", complete=False)
+            await asyncio.sleep(0.05)
+            yield turn("swami", "Hi there")
+            yield {"type": "round_complete", "roundNumber": 1}
+
+        async def collect():
+            started = time.monotonic()
+            return [(event, time.monotonic() - started) async for event in narrator.narrate(source())]
+
+        delivered = asyncio.run(collect())
+        events = [event for event, _ in delivered]
+        assert [event["type"] for event in events[:2]] == ["expert_speaking", "expert_response"]
+        assert events[1]["isComplete"] is False and delivered[1][1] < 0.2, "Partials should not wait for audio"
+        assert [event.get("content") for event in events[2:]] == ["Hello", "Hi there", None]
+        assert all("audioUrl" in event for event in events[2:4])
+
+    def test_failed_and_skipped_turns(self):
+        """Test turns are delivered without audio when skipped or when synthesis fails."""
+        narrator = TurnNarrator(FakePipeline(fail_on="boom"), FakeStore())
+
+        async def source():
+            yield turn("jeff_barr", "boom")
+            yield turn("swami", "[Agent swami failed to respond]")
+            yield turn("werner_vogels", "fine")
+
+        async def collect():
+            skip = lambda event: event["content"].startswith("[Agent")
+            return [event async for event in narrator.narrate(source(), skip=skip)]
+
+        events = asyncio.run(collect())
+        assert "audioUrl" not in events[0] and "audioUrl" not in events[1]
+        assert events[2]["audioUrl"].endswith("Arthur:fine")
+
+    def test_source_errors_propagate(self):
+        """Test an exception raised by the debate reaches the consumer."""
+        narrator = TurnNarrator(FakePipeline(), FakeStore())
+
+        async def source():
+            yield turn("jeff_barr", "Hello")
+            raise ValueError("Debate failed")
+
+        async def collect():
+            return [event async for event in narrator.narrate(source())]
+
+        with pytest.raises(ValueError, match="Debate failed"):
+            asyncio.run(collect())
+
+
+class TestAudioStores:
+    """Test suite for audio stores and keys."""
+
+    def test_audio_key_is_content_addressed(self):
+        """Test keys depend on text and voice only."""
+        assert audio_key(AudioSegment("Hi", "Matthew")) == audio_key(AudioSegment("Hi", "Matthew"))
+        assert audio_key(AudioSegment("Hi", "Matthew")) != audio_key(AudioSegment("Hi", "Brian"))
+        assert audio_key(AudioSegment("Hi", "Matthew")).endswith(".mp3")
+
+    def test_data_url_store(self):
+        """Test audio is inlined as a data URL."""
+        url = DataUrlStore().publish("key.mp3", b"mp3")
+        assert url == "data:audio/mpeg;base64," + base64.b64encode(b"mp3").decode()
+
+    def test_s3_store(self):
+        """Test uploads and presigned or public URLs."""
+        client = Mock()
+        client.generate_presigned_url.return_value = "https://signed"
+        store = S3AudioStore("bucket", prefix="audio/", client=client)
+        assert store.publish("key.mp3", b"mp3") == "https://signed"
+        client.put_object.assert_called_once_with(
+            Bucket="bucket", Key="audio/key.mp3", Body=b"mp3", ContentType="audio/mpeg"
+        )
+
+        public = S3AudioStore("bucket", prefix="audio/", client=client, base_url="https://cdn.example.com/")
+        assert public.publish("key.mp3", b"mp3") == "https://cdn.example.com/audio/key.mp3"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
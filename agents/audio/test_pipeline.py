@@ -0,0 +1,186 @@
+"""Unit tests for the Polly audio pipeline."""
+
+import asyncio
+import io
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from audio import AudioPipeline, AudioSegment, TTSCache, create_tts_cache, iter_frames, tts_key
+from audio.test_mp3 import make_frame
+from cache.backends import DiskBackend, MemoryBackend
+
+
+class FakePolly:
+    """Polly client returning the segment text as audio, slower for earlier segments."""
+
+    def __init__(self, delays=None, encode=str.encode):
+        self.delays = delays or {}
+        self.encode = encode
+        self.requests = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def synthesize_speech(self, **request):
+        with self._lock:
+            self.requests.append(request)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delays.get(request["Text"], 0.01))
+        with self._lock:
+            self.active -= 1
+        return {"AudioStream": io.BytesIO(self.encode(request["Text"]))}
+
+
+class TestAudioSegment:
+    """Test suite for AudioSegment."""
+
+    def test_request(self):
+        """Test plain text, prosody SSML with escaping, and language codes."""
+        assert AudioSegment("Hello", "Matthew").request() == {
+            "Text": "Hello",
+            "TextType": "text",
+            "OutputFormat": "mp3",
+            "VoiceId": "Matthew",
+            "Engine": "neural",
+        }
+
+        request = AudioSegment("S3 & <Lambda>", "Arthur", language_code="en-GB", rate="fast").request()
+        assert request["Text"] == '<speak><prosody rate="fast">S3 &amp; &lt;Lambda&gt;</prosody></speak>'
+        assert request["TextType"] == "ssml"
+        assert request["LanguageCode"] == "en-GB"
+
+
+class TestTTSCache:
+    """Test suite for TTSCache."""
+
+    def test_key_covers_speech_inputs(self):
+        """Test that text, voice, engine, language and prosody change the key."""
+        base = AudioSegment("Hello", "Matthew")
+        variants = [
+            AudioSegment("Hello!", "Matthew"),
+            AudioSegment("Hello", "Brian"),
+            AudioSegment("Hello", "Matthew", engine="standard"),
+            AudioSegment("Hello", "Matthew", language_code="en-GB"),
+            AudioSegment("Hello", "Matthew", rate="fast"),
+            AudioSegment("Hello", "Matthew", text_type="ssml"),
+        ]
+        assert tts_key(base) == tts_key(AudioSegment("Hello", "Matthew"))
+        assert len({tts_key(base)} | {tts_key(variant) for variant in variants}) == 7
+
+    def test_pipeline_uses_cache(self):
+        """Test each distinct segment is synthesized once and counted as hit or miss."""
+        polly = FakePolly()
+        cache = TTSCache(MemoryBackend())
+        segments = [AudioSegment("one", "Matthew"), AudioSegment("two", "Matthew")]
+
+        with AudioPipeline(client=polly, cache=cache) as pipeline:
+            assert pipeline.synthesize_all(segments) == [b"one", b"two"]
+            assert pipeline.synthesize_all(segments + [AudioSegment("one", "Brian")]) == [b"one", b"two", b"one"]
+
+        assert len(polly.requests) == 3
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (2, 3)
+        assert stats["hitRate"] == pytest.approx(0.4)
+
+    def test_disk_cache_defaults_to_user_cache_dir(self, tmp_path, monkeypatch):
+        """Test the disk cache lives in the user cache directory, outside the source tree."""
+        monkeypatch.delenv("TTS_CACHE", raising=False)
+        monkeypatch.delenv("TTS_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        cache = create_tts_cache()
+        assert isinstance(cache.backend, DiskBackend)
+        assert (tmp_path / "disagree-and-commit" / "tts").is_dir()
+
+    def test_unwritable_disk_cache_falls_back_to_memory(self, tmp_path, monkeypatch, caplog):
+        """Test a cache directory that cannot be created logs a warning and caches in memory."""
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+        monkeypatch.delenv("TTS_CACHE", raising=False)
+        monkeypatch.setenv("TTS_CACHE_DIR", str(blocker / "tts"))
+        cache = create_tts_cache()
+        assert isinstance(cache.backend, MemoryBackend)
+        assert "caching speech in memory" in caplog.text
+
+
+class TestAudioPipeline:
+    """Test suite for AudioPipeline."""
+
+    def test_ordered_concurrent_output(self):
+        """Test segments run concurrently, bounded, and come back in the original order."""
+        polly = FakePolly(delays={"one": 0.1, "two": 0.05})
+        segments = [AudioSegment(text, "Matthew") for text in ["one", "two", "three", "four", "five", "six"]]
+
+        with AudioPipeline(max_concurrency=3, client=polly, cache=None) as pipeline:
+            started = time.monotonic()
+            audio = pipeline.synthesize_all(segments)
+            elapsed = time.monotonic() - started
+
+        assert audio == [b"one", b"two", b"three", b"four", b"five", b"six"]
+        assert polly.peak == 3
+        assert elapsed < 0.2, "Segments should not be synthesized one after another"
+
+    def test_write_streams_into_output(self):
+        """Test segments are written frame by frame, in order, with silence between them."""
+        segments = [AudioSegment("a", "Matthew"), AudioSegment("b", "Stephen")]
+        polly = FakePolly(encode=lambda text: make_frame(text.encode()))
+        with AudioPipeline(max_concurrency=2, client=polly, cache=None) as pipeline:
+            buffer = io.BytesIO()
+            duration = pipeline.write(segments, buffer, gap=0.024)
+        frames = [bytes(frame) for _, frame in iter_frames(buffer.getvalue())]
+        assert frames[0] == make_frame(b"a") and frames[-1] == make_frame(b"b")
+        assert len(frames) == 3, "One silence frame fills the gap"
+        assert duration == pytest.approx(3 * 0.024)
+        assert buffer.getvalue().count(b"Xing") == 1
+
+    def test_write_to_path(self, tmp_path):
+        """Test writing to a file path creates only the output file."""
+        polly = FakePolly(encode=lambda text: make_frame(text.encode()))
+        with AudioPipeline(client=polly, cache=None) as pipeline:
+            pipeline.write([AudioSegment("a", "Matthew"), AudioSegment("b", "Matthew")], tmp_path / "out.mp3")
+        data = (tmp_path / "out.mp3").read_bytes()
+        assert data.endswith(make_frame(b"a") + make_frame(b"b"))
+        assert [path.name for path in tmp_path.iterdir()] == ["out.mp3"]
+
+    def test_failed_segment_raises(self):
+        """Test a Polly error surfaces from the stream."""
+        polly = Mock()
+        polly.synthesize_speech.side_effect = RuntimeError("Polly down")
+        with AudioPipeline(client=polly, cache=None) as pipeline:
+            with pytest.raises(RuntimeError, match="Polly down"):
+                pipeline.synthesize_all([AudioSegment("a", "Matthew")])
+
+    def test_long_segments_are_chunked(self):
+        """Test long text is split into concurrent sentence requests, joined in order and streamed early."""
+        text = " ".join(f"Sentence {n} explains the trade-off." for n in range(12))
+        polly = FakePolly()
+        segment = AudioSegment(text, "Matthew")
+        chunks = [chunk.text for chunk in segment.chunks(80)]
+        assert len(chunks) > 2
+        polly.delays = {chunks[-1]: 0.3}
+
+        with AudioPipeline(max_concurrency=4, client=polly, cache=None, max_chunk_chars=80) as pipeline:
+            audio = "".join(chunks).encode()
+            assert pipeline.synthesize_all([segment]) == [audio]
+            assert pipeline.submit(segment).result(5) == audio
+            assert polly.peak > 1, "Chunks should be synthesized concurrently"
+
+            # Playback can start with the first sentence while the slow last chunk is synthesized
+            started = time.monotonic()
+            stream = pipeline.stream([segment])
+            assert next(stream) == b"Sentence 0 explains the trade-off."
+            assert time.monotonic() - started < 0.2
+            assert b"".join(stream) == audio[len(chunks[0]):]
+
+    def test_per_turn_api(self):
+        """Test submit and synthesize_async for single turns."""
+        with AudioPipeline(client=FakePolly(), cache=None) as pipeline:
+            assert pipeline.submit(AudioSegment("turn one", "Matthew")).result(5) == b"turn one"
+            assert asyncio.run(pipeline.synthesize_async(AudioSegment("turn two", "Brian"))) == b"turn two"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,157 @@
+"""Unit tests for the single-pass transcript parser."""
+
+import json
+
+import pytest
+
+from audio import Transcript, speaker_key
+
+MARKDOWN = """# End-to-End Conversation: Test
+
+**Problem Statement:** Build it.
+
+---
+
+## Round 1: Initial Positions
+
+### Jeff Barr (The Simplifier)
+
+Start simple.
+
+---
+
+### Swami (The Shipper)
+
+Ship it.
+
+---
+
+### Werner Vogels (The Scale Architect)
+
+Everything fails.
+
+---
+
+## Round 2: Debate
+
+### Jeff Barr
+
+Still simple.
+
+---
+
+## Final Synthesis
+
+**Architecture Overview:**
+
+Serverless.
+
+**Core Components:**
+
+1. Lambda
+"""
+
+PANEL = """Panelists:
+  • Jeff Barr
+
+================================================================================
+ROUND 1: INITIAL OPINIONS
+================================================================================
+
+PROBLEM: Build it.
+
+────────────────────────────────────────────────────────────────────────────────
+Jeff Barr:
+────────────────────────────────────────────────────────────────────────────────
+*Smiles* Start simple.
+
+────────────────────────────────────────────────────────────────────────────────
+Swami Sivasubramanian:
+────────────────────────────────────────────────────────────────────────────────
+Ship it.
+
+────────────────────────────────────────────────────────────────────────────────
+Werner Vogels:
+────────────────────────────────────────────────────────────────────────────────
+Everything fails.
+
+================================================================================
+DISCUSSION COMPLETE
+================================================================================
+"""
+
+
+class TestTranscript:
+    """Test suite for Transcript."""
+
+    def test_markdown(self):
+        """Test rounds, speakers, turn text and synthesis fields of a conversation file."""
+        transcript = Transcript.parse(MARKDOWN)
+
+        assert transcript.round_numbers() == [1, 2]
+        assert transcript.rounds[1].title == "Initial Positions"
+        assert [(turn.speaker, turn.name) for turn in transcript.turns(1)] == [
+            ("jeff_barr", "Jeff Barr"), ("swami", "Swami"), ("werner_vogels", "Werner Vogels")
+        ]
+        assert transcript.turn(1, "werner_vogels") == "Everything fails."
+        assert transcript.turn(2, "Jeff Barr") == "Still simple."
+        assert transcript.turn(2, "swami") == ""
+        assert transcript.turns(5) == []
+
+        assert transcript.field("Final Synthesis", "Architecture Overview") == "Serverless."
+        assert transcript.field("Final Synthesis", "Core Components") == "1. Lambda"
+        assert transcript.field("Final Synthesis", "Trade-offs") is None
+        assert transcript.section("Final Synthesis").startswith("**Architecture Overview:**")
+
+    def test_panel(self):
+        """Test the console format: names framed by rules, rounds closed by the footer."""
+        transcript = Transcript.parse(PANEL)
+
+        assert transcript.round_numbers() == [1]
+        assert transcript.rounds[1].title == "INITIAL OPINIONS"
+        assert [turn.speaker for turn in transcript.turns(1)] == ["jeff_barr", "swami", "werner_vogels"]
+        assert transcript.turn(1, "jeff_barr") == "*Smiles* Start simple."
+        assert transcript.turn(1, "werner") == "Everything fails."
+
+    def test_long_transcript(self):
+        """Test every turn of a 50-round transcript is indexed by offsets into the source."""
+        text = "".join(
+            f"## Round {n}: Round {n}\n\n" + "".join(
+                f"### {name}\n\n{name} speaks in round {n}.\n\n---\n\n"
+                for name in ("Jeff Barr", "Swami", "Werner Vogels")
+            )
+            for n in range(1, 51)
+        )
+        transcript = Transcript.parse(text)
+
+        assert transcript.round_numbers() == list(range(1, 51))
+        turn = transcript.rounds[37].by_speaker["swami"]
+        assert text[turn.start:turn.end] == "Swami speaks in round 37."
+        assert transcript.turn(50, "werner_vogels") == "Werner Vogels speaks in round 50."
+
+    def test_orchestrator_transcript(self, tmp_path):
+        """Test JSON Lines transcripts load without parsing, synthesis fields included."""
+        records = [
+            {"type": "session", "version": 1, "sessionId": "debate_1"},
+            {"type": "turn", "round": 1, "position": 0, "speaker": "jeff_barr", "text": "Start simple."},
+            {"type": "turn", "round": 1, "position": 1, "speaker": "swami", "text": "Ship it."},
+            {"type": "synthesis", "text": "**Architecture Overview:**\n\nServerless.\n\n**Core Components:**\n\nLambda"},
+        ]
+        path = tmp_path / "debate_1.jsonl"
+        path.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+        transcript = Transcript.load(path)
+        assert [turn.speaker for turn in transcript.turns(1)] == ["jeff_barr", "swami"]
+        assert transcript.turn(1, "swami") == "Ship it."
+        assert transcript.field("Final Synthesis", "Architecture Overview") == "Serverless."
+        assert transcript.field("Final Synthesis", "Core Components") == "Lambda"
+
+    def test_speaker_key(self):
+        """Test names map to the orchestrator's expert IDs."""
+        assert speaker_key("Swami  Sivasubramanian") == "swami"
+        assert speaker_key("Werner") == "werner_vogels"
+        assert speaker_key("Andy Jassy") == "andy_jassy"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
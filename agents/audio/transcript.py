@@ -0,0 +1,241 @@
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from transcripts import read_transcript
+
+# Speaker names as written in transcripts, mapped to the expert IDs used by
+# the orchestrator; other names get their lower-cased, underscored form
+SPEAKER_KEYS: Dict[str, str] = {
+    "jeff barr": "jeff_barr",
+    "jeff": "jeff_barr",
+    "swami": "swami",
+    "swami sivasubramanian": "swami",
+    "werner vogels": "werner_vogels",
+    "werner": "werner_vogels",
+}
+
+# One alternation over every line that starts or ends a span, matched in a
+# single scan of the document. Markdown transcripts (conversation_*.md) use
+# "## Round N:" / "### Speaker (Role)" / "---"; console transcripts
+# (panel.txt) use "ROUND N:" / "Speaker:" between rules of ─ or =.
+_TOKENS = re.compile(
+    r'^(?:'
+    r'## Round (?P<md_round>\d+):?[ \t]*(?P<md_round_title>.*?)'
+    r'|## (?P<md_section>.+?)'
+    r'|### (?P<md_speaker>[^(\n]+?)(?:[ \t]*\([^)\n]*\))?'
+    r'|\*\*(?P<field>[^*\n]+?):\*\*[ \t]*'
+    r'|ROUND (?P<panel_round>\d+):[ \t]*(?P<panel_round_title>.*?)'
+    r'|(?P<panel_end>DISCUSSION COMPLETE.*?)'
+    r'|(?P<panel_speaker>[A-Z][\w.\'-]*(?: [A-Z][\w.\'-]*)*):'
+    r'|(?P<rule>---+|[─=]{10,})'
+    r')[ \t]*\r?$',
+    re.M
+)
+
+
+def speaker_key(name: str) -> str:
+    """Expert ID of a speaker name as written in a transcript."""
+    name = " ".join(name.split())
+    return SPEAKER_KEYS.get(name.lower(), name.lower().replace(" ", "_"))
+
+
+@dataclass(frozen=True)
+class Turn:
+    """One speaker's text in a round, as offsets into the transcript."""
+    speaker: str
+    name: str
+    start: int
+    end: int
+
+
+@dataclass
+class Round:
+    """A round of the debate and its turns in speaking order."""
+    number: int
+    title: str
+    turns: List[Turn] = field(default_factory=list)
+    by_speaker: Dict[str, Turn] = field(default_factory=dict)
+
+
+@dataclass
+class Section:
+    """A section outside the rounds (e.g. "Final Synthesis") and its **Label:** fields."""
+    title: str
+    start: int
+    end: int
+    fields: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+
+
+class Transcript:
+    """
+    Index of a debate transcript, built in a single pass.
+
+    `parse` scans the document once and records rounds, turns, sections and
+    bold fields as (start, end) offsets; text is only sliced out when it is
+    asked for, so looking up any turn is a dictionary access whatever the
+    transcript's length. Handles the markdown conversation format, the
+    panel_discussion.py console format and the orchestrator's JSON Lines
+    transcripts (see the transcripts package).
+    """
+
+    def __init__(self, text: str, rounds: Dict[int, Round], sections: Dict[str, Section]):
+        self.source = text
+        self.rounds = rounds
+        self.sections = sections
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Transcript":
+        """Parse a transcript file; .jsonl files are read as orchestrator transcripts."""
+        if str(path).endswith('.jsonl'):
+            return cls.from_records(read_transcript(path))
+        with open(path, 'r') as f:
+            return cls.parse(f.read())
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> "Transcript":
+        """Build the index from orchestrator transcript records, without any parsing."""
+        parts: List[str] = []
+        length = 0
+        rounds: Dict[int, Round] = {}
+        sections: Dict[str, Section] = {}
+
+        def add(text: str) -> Tuple[int, int]:
+            nonlocal length
+            if parts:
+                parts.append("\n\n")
+                length += 2
+            start = length
+            parts.append(text)
+            length += len(text)
+            return start, length
+
+        for record in records:
+            if record['type'] == 'turn':
+                start, end = add(record['text'])
+                found = rounds.setdefault(record['round'], Round(record['round'], ""))
+                entry = Turn(speaker_key(record['speaker']), record['speaker'], start, end)
+                found.turns.append(entry)
+                found.by_speaker.setdefault(entry.speaker, entry)
+            elif record['type'] == 'synthesis':
+                start, end = add(record['text'])
+                # Index the synthesis's **Label:** fields as if it were a markdown section
+                header = "## Final Synthesis\n"
+                indexed = cls.parse(header + record['text']).sections["Final Synthesis"]
+                shift = start - len(header)
+                fields = {label: (a + shift, b + shift) for label, (a, b) in indexed.fields.items()}
+                sections["Final Synthesis"] = Section("Final Synthesis", start, end, fields)
+        return cls("".join(parts), rounds, sections)
+
+    @classmethod
+    def parse(cls, text: str) -> "Transcript":
+        """Parse a transcript in one scan over its marker lines."""
+        rounds: Dict[int, Round] = {}
+        sections: Dict[str, Section] = {}
+        current_round: Optional[Round] = None
+        section: Optional[Section] = None
+        # Open spans: [speaker, name, start] of a turn, [label, start] of a field
+        turn: Optional[list] = None
+        open_field: Optional[list] = None
+
+        def close_turn(end: int) -> None:
+            nonlocal turn
+            if turn is not None and current_round is not None:
+                start, end = _strip(text, turn[2], end)
+                entry = Turn(turn[0], turn[1], start, end)
+                current_round.turns.append(entry)
+                current_round.by_speaker.setdefault(entry.speaker, entry)
+            turn = None
+
+        def close_field(end: int) -> None:
+            nonlocal open_field
+            if open_field is not None and section is not None:
+                section.fields.setdefault(open_field[0], _strip(text, open_field[1], end))
+            open_field = None
+
+        def close_section(end: int) -> None:
+            nonlocal section
+            close_field(end)
+            if section is not None:
+                section.end = end
+            section = None
+
+        for match in _TOKENS.finditer(text):
+            kind = match.lastgroup
+            line_start, line_end = match.start(), match.end()
+            number = match.group('md_round') or match.group('panel_round')
+
+            if number is not None or kind in ('md_section', 'panel_end'):
+                close_turn(line_start)
+                close_section(line_start)
+                current_round = None
+                if number is not None:
+                    title = match.group('md_round_title') or match.group('panel_round_title') or ""
+                    current_round = rounds.setdefault(int(number), Round(int(number), title.strip()))
+                elif kind == 'md_section':
+                    title = match.group('md_section').strip()
+                    section = sections.setdefault(title, Section(title, line_end, len(text)))
+            elif kind in ('md_speaker', 'panel_speaker'):
+                if current_round is None:
+                    continue
+                close_turn(line_start)
+                name = " ".join(match.group(kind).split())
+                turn = [speaker_key(name), name, line_end]
+            elif kind == 'field':
+                if section is not None:
+                    close_field(line_start)
+                    open_field = [match.group('field').strip(), line_end]
+            elif kind == 'rule' and turn is not None:
+                # A rule right under the speaker's name frames the name; any
+                # other rule ends the turn
+                if text[turn[2]:line_start].strip():
+                    close_turn(line_start)
+                else:
+                    turn[2] = line_end
+
+        close_turn(len(text))
+        close_section(len(text))
+        return cls(text, rounds, sections)
+
+    def round_numbers(self) -> List[int]:
+        """Numbers of the rounds in the transcript, in order."""
+        return sorted(self.rounds)
+
+    def turns(self, round_num: int) -> List[Turn]:
+        """Turns of a round in speaking order (empty if there is no such round)."""
+        found = self.rounds.get(round_num)
+        return list(found.turns) if found else []
+
+    def text(self, turn: Turn) -> str:
+        """Text of a turn."""
+        return self.source[turn.start:turn.end]
+
+    def turn(self, round_num: int, speaker: str, default: str = "") -> str:
+        """Text of a speaker's (first) turn in a round; `speaker` is an expert ID or a name."""
+        found = self.rounds.get(round_num)
+        entry = found.by_speaker.get(speaker_key(speaker)) if found else None
+        return self.text(entry) if entry else default
+
+    def section(self, title: str) -> Optional[str]:
+        """Text of a section such as "Final Synthesis", or None."""
+        found = self.sections.get(title)
+        if found is None:
+            return None
+        start, end = _strip(self.source, found.start, found.end)
+        return self.source[start:end]
+
+    def field(self, section: str, label: str) -> Optional[str]:
+        """Text following "**label:**" in a section, up to the next field, or None."""
+        found = self.sections.get(section)
+        span = found.fields.get(label) if found else None
+        return self.source[span[0]:span[1]] if span else None
+
+
+def _strip(text: str, start: int, end: int) -> Tuple[int, int]:
+    """Narrow a span to exclude surrounding whitespace without copying the text."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
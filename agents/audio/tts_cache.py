@@ -0,0 +1,119 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Optional
+
+from cache.backends import CacheBackend, MemoryBackend, create_backend
+
+if TYPE_CHECKING:
+    from .pipeline import AudioSegment
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+# Default size of the disk TTS cache
+DEFAULT_TTS_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+
+def default_tts_cache_dir() -> str:
+    """Return the user cache directory for synthesized speech ($XDG_CACHE_HOME or ~/.cache)."""
+    cache_home = os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'disagree-and-commit', 'tts')
+
+
+def tts_key(segment: "AudioSegment") -> str:
+    """
+    Content address of a segment's audio.
+
+    Covers everything that changes the speech Polly returns: the text and
+    whether it is SSML, the voice, engine, language and prosody rate.
+    """
+    fingerprint = json.dumps({
+        "text": hashlib.sha256(segment.text.encode("utf-8")).hexdigest(),
+        "textType": segment.text_type,
+        "voice": segment.voice_id,
+        "engine": segment.engine,
+        "language": segment.language_code,
+        "prosody": segment.rate,
+        "format": "mp3",
+    }, sort_keys=True)
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+
+class TTSCache:
+    """
+    Content-addressed cache of synthesized speech.
+
+    The same text in the same voice is synthesized once: panel re-runs,
+    cached debates replayed with audio and repeated turns all read the MP3
+    from the backend instead of calling Polly.
+    """
+
+    def __init__(self, backend: CacheBackend, namespace: str = "tts/v1"):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend for MP3 audio
+            namespace: Prefix for every key; change it to invalidate all entries
+        """
+        self.backend = backend
+        self.namespace = namespace
+
+    def get(self, segment: "AudioSegment") -> Optional[bytes]:
+        """Return the cached audio of a segment, or None on a miss."""
+        return self.backend.get(f"{self.namespace}/{tts_key(segment)}")
+
+    def put(self, segment: "AudioSegment", audio: bytes) -> None:
+        """Store the audio of a segment."""
+        self.backend.put(f"{self.namespace}/{tts_key(segment)}", audio)
+
+    def stats(self) -> dict:
+        """Return the backend counters and the hit rate."""
+        stats = self.backend.stats()
+        lookups = stats["hits"] + stats["misses"]
+        stats["hitRate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+
+def create_tts_cache() -> Optional[TTSCache]:
+    """
+    Create the TTS cache configured by the environment.
+
+    TTS_CACHE selects the backend: 'disk' (default; TTS_CACHE_DIR, default
+    the user cache directory, and TTS_CACHE_MAX_BYTES), 's3'
+    (TTS_CACHE_BUCKET, TTS_CACHE_PREFIX), 'memory' or 'none'. A disk cache
+    whose directory cannot be created falls back to memory.
+    """
+    kind = os.getenv('TTS_CACHE', 'disk')
+    try:
+        backend = create_backend(
+            kind,
+            directory=os.getenv('TTS_CACHE_DIR') or default_tts_cache_dir(),
+            max_bytes=int(os.getenv('TTS_CACHE_MAX_BYTES', str(DEFAULT_TTS_CACHE_MAX_BYTES))),
+            bucket=os.getenv('TTS_CACHE_BUCKET'),
+            prefix=os.getenv('TTS_CACHE_PREFIX', 'tts-cache/')
+        )
+    except OSError as e:
+        if kind != 'disk':
+            raise
+        logger.warning(f"TTS disk cache unavailable, caching speech in memory: {e}")
+        backend = MemoryBackend()
+    return TTSCache(backend) if backend else None
+
+
+_default_cache: Optional[TTSCache] = None
+_default_cache_created = False
+_default_cache_lock = threading.Lock()
+
+
+def default_tts_cache() -> Optional[TTSCache]:
+    """Return the process-wide TTS cache, created from the environment on first use."""
+    global _default_cache, _default_cache_created
+    with _default_cache_lock:
+        if not _default_cache_created:
+            _default_cache = create_tts_cache()
+            _default_cache_created = True
+        return _default_cache
@@ -0,0 +1,15 @@
+"""Shared, per-process boto3 clients with tuned connection pooling."""
+
+from .factory import (
+    DEFAULT_MAX_POOL_CONNECTIONS,
+    client_config,
+    clear_clients,
+    get_client,
+)
+
+__all__ = [
+    'DEFAULT_MAX_POOL_CONNECTIONS',
+    'client_config',
+    'clear_clients',
+    'get_client',
+]
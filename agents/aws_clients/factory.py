@@ -0,0 +1,72 @@
+import logging
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+# Connections kept open per client; botocore's default of 10 starves thread pools
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+
+_clients: Dict[Tuple[str, Optional[str], Optional[str]], object] = {}
+_lock = threading.Lock()
+_pid = os.getpid()
+
+
+def client_config(max_pool_connections: Optional[int] = None) -> Config:
+    """
+    Return the botocore Config used for shared clients.
+
+    Connections are pooled (AWS_MAX_POOL_CONNECTIONS, default 50) and kept
+    alive with TCP keep-alive, so repeated calls reuse an open TLS connection.
+    """
+    if max_pool_connections is None:
+        max_pool_connections = int(os.getenv('AWS_MAX_POOL_CONNECTIONS', str(DEFAULT_MAX_POOL_CONNECTIONS)))
+    return Config(
+        max_pool_connections=max_pool_connections,
+        tcp_keepalive=True,
+        retries={'mode': 'standard'}
+    )
+
+
+def get_client(service_name: str, region_name: Optional[str] = None, endpoint_url: Optional[str] = None):
+    """
+    Return the process-wide boto3 client for a service, region and endpoint.
+
+    The client is created on first use and reused afterwards, so credentials
+    are resolved and connections opened once per process instead of per call.
+    boto3 clients are thread-safe; creating them is not, so creation is
+    serialized. Clients are never shared across a fork.
+
+    Args:
+        service_name: AWS service (e.g. 'polly', 's3')
+        region_name: Region; boto3's default resolution when omitted
+        endpoint_url: Endpoint of a compatible service (e.g. MinIO)
+    """
+    global _pid
+    key = (service_name, region_name, endpoint_url)
+    with _lock:
+        if _pid != os.getpid():
+            # Connection pools must not be shared with the parent process
+            _clients.clear()
+            _pid = os.getpid()
+        client = _clients.get(key)
+        if client is None:
+            logger.debug(f"Creating shared {service_name} client (region={region_name}, endpoint={endpoint_url})")
+            client = _clients[key] = boto3.client(
+                service_name,
+                region_name=region_name,
+                endpoint_url=endpoint_url,
+                config=client_config()
+            )
+        return client
+
+
+def clear_clients() -> None:
+    """Drop all cached clients (e.g. after changing credentials)."""
+    with _lock:
+        _clients.clear()
@@ -0,0 +1,62 @@
+"""Unit tests for the shared boto3 client factory."""
+
+import threading
+
+import pytest
+from unittest.mock import Mock, patch
+
+from aws_clients import DEFAULT_MAX_POOL_CONNECTIONS, clear_clients, client_config, get_client
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_clients()
+    yield
+    clear_clients()
+
+
+class TestGetClient:
+    """Test suite for get_client."""
+
+    def test_reuses_clients(self):
+        """Test one client is created per service, region and endpoint."""
+        with patch('boto3.client', side_effect=lambda *args, **kwargs: Mock()) as mock_boto:
+            polly = get_client('polly', region_name='us-east-1')
+            assert get_client('polly', region_name='us-east-1') is polly
+            assert get_client('polly', region_name='us-west-2') is not polly
+            assert get_client('s3', endpoint_url='http://localhost:9000') is not get_client('s3')
+            assert mock_boto.call_count == 4
+
+            config = mock_boto.call_args_list[0].kwargs['config']
+            assert config.max_pool_connections == DEFAULT_MAX_POOL_CONNECTIONS
+            assert config.tcp_keepalive is True
+
+    def test_concurrent_first_use(self):
+        """Test threads racing on first use share a single client."""
+        with patch('boto3.client', side_effect=lambda *args, **kwargs: Mock()) as mock_boto:
+            clients = []
+            threads = [threading.Thread(target=lambda: clients.append(get_client('polly'))) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+
+            assert mock_boto.call_count == 1
+            assert all(client is clients[0] for client in clients)
+
+    def test_not_shared_across_fork(self):
+        """Test a forked child creates its own clients."""
+        with patch('boto3.client', side_effect=lambda *args, **kwargs: Mock()):
+            parent = get_client('polly')
+            with patch('aws_clients.factory.os.getpid', return_value=-1):
+                assert get_client('polly') is not parent
+
+    def test_pool_size_from_env(self):
+        """Test AWS_MAX_POOL_CONNECTIONS overrides the pool size."""
+        with patch.dict('os.environ', {'AWS_MAX_POOL_CONNECTIONS': '8'}):
+            assert client_config().max_pool_connections == 8
+        assert client_config(max_pool_connections=4).max_pool_connections == 4
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,11 @@
+"""Batch runner for generating many debates offline."""
+
+from .runner import AsyncTokenBucket, BatchItem, BatchRunner, load_problems, run_batch
+
+__all__ = [
+    'AsyncTokenBucket',
+    'BatchItem',
+    'BatchRunner',
+    'load_problems',
+    'run_batch',
+]
@@ -0,0 +1,56 @@
+"""
+Run a JSONL file of debates concurrently with checkpointing.
+
+Usage:
+    python -m batch problems.jsonl --output-dir batch_output --concurrency 8 --rpm 60
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from .runner import run_batch
+
+
+def parse_model_rpm(values):
+    """Parse repeated MODEL_ID=RPM options into a dict."""
+    limits = {}
+    for value in values or []:
+        model_id, sep, rpm = value.rpartition("=")
+        if not sep or not model_id:
+            raise argparse.ArgumentTypeError(f"expected MODEL_ID=RPM, got '{value}'")
+        limits[model_id] = float(rpm)
+    return limits
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m batch", description="Run many debates from a JSONL file.")
+    parser.add_argument("problems", help="JSONL file with one orchestrator payload per line")
+    parser.add_argument("--output-dir", default="batch_output", help="Directory for per-debate checkpoints")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum debates in flight")
+    parser.add_argument("--rpm", type=float, default=None, help="Model requests per minute, per model")
+    parser.add_argument("--model-rpm", action="append", metavar="MODEL_ID=RPM",
+                        help="Requests per minute for one model (repeatable; overrides --rpm)")
+    parser.add_argument("--no-resume", action="store_true", help="Re-run debates that already have a checkpoint")
+    args = parser.parse_args(argv)
+
+    try:
+        model_rpm = parse_model_rpm(args.model_rpm)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    summary = asyncio.run(run_batch(
+        args.problems,
+        args.output_dir,
+        resume=not args.no_resume,
+        concurrency=args.concurrency,
+        requests_per_minute=args.rpm,
+        model_rpm=model_rpm
+    ))
+    print(json.dumps(summary, indent=2))
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
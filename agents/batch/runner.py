@@ -0,0 +1,271 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+from gateway import BATCH, TokenBucket, traffic_priority
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+# Runs one debate: payload -> the debate's final response (debate_orchestrator's shape)
+DebateFn = Callable[[dict], Awaitable[dict]]
+
+# Model calls a debate will make: payload -> {model_id: calls}
+ModelCallsFn = Callable[[dict], Dict[str, int]]
+
+_UNSAFE_ID_CHARS = re.compile(r"[^\w.-]")
+
+
+@dataclass
+class BatchItem:
+    """One debate of a batch: its checkpoint ID and orchestrator payload."""
+    id: str
+    payload: dict
+
+
+def load_problems(path: str) -> List[BatchItem]:
+    """
+    Read a JSONL file of debates.
+
+    Each line is an orchestrator payload ({"problem": ...} or {"problemId": ...},
+    plus any other payload option) with an optional "id" used to name its
+    checkpoint. Without an "id", the problemId or a hash of the problem is used.
+    Blank lines are skipped.
+
+    Raises:
+        ValueError: If a line is not a JSON object, has no problem, or two
+            lines share an ID
+    """
+    items = []
+    seen = set()
+    with open(path) as f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_num}: invalid JSON: {e}") from e
+            if not isinstance(payload, dict) or not (payload.get('problem') or payload.get('problemId')):
+                raise ValueError(f"{path}:{line_num}: expected an object with 'problem' or 'problemId'")
+
+            item_id = payload.pop('id', None) or payload.get('problemId') or \
+                hashlib.sha256(payload['problem'].encode()).hexdigest()[:16]
+            item_id = _UNSAFE_ID_CHARS.sub("_", str(item_id))
+            if item_id in seen:
+                raise ValueError(f"{path}:{line_num}: duplicate id '{item_id}'")
+            seen.add(item_id)
+            items.append(BatchItem(id=item_id, payload=payload))
+    return items
+
+
+class AsyncTokenBucket(TokenBucket):
+    """TokenBucket with a coroutine that waits for tokens; waiters are served in order."""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        super().__init__(rate_per_minute, capacity)
+        self._waiters = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Wait until `tokens` are available and take them."""
+        async with self._waiters:
+            while True:
+                delay = self.delay(tokens)
+                if delay <= 0:
+                    self.take(tokens)
+                    return
+                await asyncio.sleep(delay)
+
+
+def _default_debate() -> DebateFn:
+    from orchestrator.app import debate_orchestrator
+
+    async def run(payload: dict) -> dict:
+        return await debate_orchestrator(payload, {})
+    return run
+
+
+def _default_model_calls() -> ModelCallsFn:
+    from orchestrator.app import debate_model_calls
+    return debate_model_calls
+
+
+class BatchRunner:
+    """
+    Runs many debates concurrently with checkpointing.
+
+    At most `concurrency` debates run at once. When a model has a rate limit
+    (`model_rpm`, or `requests_per_minute` for every model), a debate only
+    starts once that model's bucket holds all the calls the debate will make
+    to it, so the batch stays under the limit on average. Debates run at
+    BATCH priority in the model gateway, so live traffic is served first.
+
+    Every finished debate is written to `<output_dir>/<id>.json` with an
+    atomic rename, so a crash never leaves a partial checkpoint. Running the
+    same batch again resumes it: debates with a complete checkpoint are
+    skipped and failed ones are retried.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        concurrency: int = 4,
+        requests_per_minute: Optional[float] = None,
+        model_rpm: Optional[Dict[str, float]] = None,
+        debate: Optional[DebateFn] = None,
+        model_calls: Optional[ModelCallsFn] = None
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            output_dir: Directory for the per-debate checkpoints
+            concurrency: Maximum number of debates in flight
+            requests_per_minute: Default model request rate limit (None: unlimited)
+            model_rpm: Rate limits per model ID, overriding the default
+            debate: Runs one debate; defaults to the orchestrator in process
+            model_calls: Model calls per debate; defaults to the orchestrator's plan
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.output_dir = output_dir
+        self.concurrency = concurrency
+        self.requests_per_minute = requests_per_minute
+        self.model_rpm = dict(model_rpm or {})
+        self._debate = debate
+        self._model_calls = model_calls
+        self._buckets: Dict[str, Optional[AsyncTokenBucket]] = {}
+
+    def checkpoint_path(self, item_id: str) -> str:
+        """Return the checkpoint file of a debate."""
+        return os.path.join(self.output_dir, f"{item_id}.json")
+
+    def load_checkpoint(self, item_id: str) -> Optional[dict]:
+        """Return a debate's checkpoint, or None if it has none (or it is unreadable)."""
+        try:
+            with open(self.checkpoint_path(item_id)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint for {item_id}: {e}")
+            return None
+
+    async def run(self, items: Iterable[BatchItem], resume: bool = True) -> dict:
+        """
+        Run a batch of debates.
+
+        Args:
+            items: The debates to run
+            resume: Skip debates that already have a complete checkpoint
+
+        Returns:
+            Summary with total, skipped, completed and failed counts and the
+            IDs of the failed debates
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        if self._debate is None:
+            self._debate = _default_debate()
+        if self._model_calls is None:
+            self._model_calls = _default_model_calls() if self._rate_limited() else (lambda payload: {})
+
+        items = list(items)
+        pending = []
+        for item in items:
+            checkpoint = self.load_checkpoint(item.id) if resume else None
+            if checkpoint and checkpoint.get('status') == 'complete':
+                continue
+            pending.append(item)
+        skipped = len(items) - len(pending)
+        logger.info(
+            f"Batch of {len(items)} debates: {skipped} already complete, {len(pending)} to run "
+            f"with concurrency {self.concurrency}"
+        )
+
+        slots = asyncio.Semaphore(self.concurrency)
+        results = await asyncio.gather(*(self._run_item(item, slots) for item in pending))
+        failed = [item.id for item, ok in zip(pending, results) if not ok]
+
+        summary = {
+            "total": len(items),
+            "skipped": skipped,
+            "completed": len(pending) - len(failed),
+            "failed": len(failed),
+            "failedIds": failed
+        }
+        logger.info(f"Batch finished: {summary}")
+        return summary
+
+    async def _run_item(self, item: BatchItem, slots: asyncio.Semaphore) -> bool:
+        async with slots:
+            for model_id, calls in self._model_calls(item.payload).items():
+                bucket = self._bucket(model_id)
+                if bucket is not None:
+                    await bucket.acquire(calls)
+
+            logger.info(f"Starting debate {item.id}")
+            payload = dict(item.payload)
+            # Offline generation never needs turn pacing
+            payload.setdefault('pacing', 'batch')
+            started = time.monotonic()
+            try:
+                # Live debates are admitted to the models before batch ones
+                with traffic_priority(BATCH):
+                    result = await self._debate(payload)
+                status = result.get('status', 'error')
+            except Exception as e:
+                logger.error(f"Debate {item.id} raised: {e}")
+                result = {"status": "error", "error": str(e)}
+                status = "error"
+            duration = round(time.monotonic() - started, 3)
+
+            try:
+                self._write_checkpoint(item.id, {
+                    "id": item.id,
+                    "payload": item.payload,
+                    "status": status,
+                    "durationSeconds": duration,
+                    "finishedAt": datetime.now(timezone.utc).isoformat(),
+                    "result": result
+                })
+            except Exception as e:
+                logger.error(f"Could not checkpoint debate {item.id}: {e}")
+                return False
+            if status == 'complete':
+                logger.info(f"Debate {item.id} complete in {duration}s")
+                return True
+            logger.error(f"Debate {item.id} failed: {result.get('error')}")
+            return False
+
+    def _rate_limited(self) -> bool:
+        return self.requests_per_minute is not None or bool(self.model_rpm)
+
+    def _bucket(self, model_id: str) -> Optional[AsyncTokenBucket]:
+        if model_id not in self._buckets:
+            rpm = self.model_rpm.get(model_id, self.requests_per_minute)
+            self._buckets[model_id] = AsyncTokenBucket(rpm) if rpm else None
+        return self._buckets[model_id]
+
+    def _write_checkpoint(self, item_id: str, record: dict) -> None:
+        path = self.checkpoint_path(item_id)
+        fd, tmp_path = tempfile.mkstemp(dir=self.output_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(record, f, indent=2, default=str)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+
+async def run_batch(path: str, output_dir: str, resume: bool = True, **options) -> dict:
+    """Run the debates of a JSONL file; options are passed to BatchRunner."""
+    return await BatchRunner(output_dir, **options).run(load_problems(path), resume=resume)
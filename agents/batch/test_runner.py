@@ -0,0 +1,167 @@
+"""Unit tests for the batch debate runner."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from batch.__main__ import parse_model_rpm
+from batch.runner import AsyncTokenBucket, BatchItem, BatchRunner, load_problems
+
+
+class RecordingDebate:
+    """Debate function that records concurrency and can fail chosen problems."""
+
+    def __init__(self, delay=0.01, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, payload):
+        self.calls.append(payload)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if payload['problem'] in self.fail:
+                raise RuntimeError("ThrottlingException")
+            return {"status": "complete", "synthesis": f"Synthesis of {payload['problem']}"}
+        finally:
+            self.active -= 1
+
+
+def make_items(count):
+    return [BatchItem(id=f"debate-{i}", payload={"problem": f"Problem {i}"}) for i in range(count)]
+
+
+class TestLoadProblems:
+    """Test suite for load_problems."""
+
+    def test_ids(self, tmp_path):
+        """Test explicit IDs, problemId fallback, hashed problems and blank lines."""
+        path = tmp_path / "problems.jsonl"
+        path.write_text(
+            '{"id": "mars/1", "problem": "Mars currency", "parallelRound": true}\n'
+            '\n'
+            '{"problemId": "air_taxi_pollution"}\n'
+            '{"problem": "Unnamed problem"}\n'
+        )
+        items = load_problems(str(path))
+
+        assert [item.id for item in items][:2] == ["mars_1", "air_taxi_pollution"]
+        assert len(items[2].id) == 16
+        assert items[0].payload == {"problem": "Mars currency", "parallelRound": True}
+
+    def test_rejects_invalid_lines(self, tmp_path):
+        """Test that bad JSON, missing problems and duplicate IDs are reported with their line."""
+        path = tmp_path / "problems.jsonl"
+        for content, message in [
+            ('{"problem": "A"}\nnot json\n', ":2: invalid JSON"),
+            ('{"statement": "A"}\n', ":1: expected an object"),
+            ('{"id": "a", "problem": "A"}\n{"id": "a", "problem": "B"}\n', "duplicate id 'a'"),
+        ]:
+            path.write_text(content)
+            with pytest.raises(ValueError, match=message):
+                load_problems(str(path))
+
+
+class TestBatchRunner:
+    """Test suite for BatchRunner."""
+
+    def test_concurrency_limit_and_checkpoints(self, tmp_path):
+        """Test that debates run concurrently up to the limit and each is checkpointed."""
+        debate = RecordingDebate()
+        runner = BatchRunner(str(tmp_path), concurrency=3, debate=debate)
+
+        summary = asyncio.run(runner.run(make_items(10)))
+
+        assert summary == {"total": 10, "skipped": 0, "completed": 10, "failed": 0, "failedIds": []}
+        assert debate.max_active == 3
+        assert all(call['pacing'] == 'batch' for call in debate.calls)
+        checkpoint = json.loads((tmp_path / "debate-4.json").read_text())
+        assert checkpoint['status'] == 'complete'
+        assert checkpoint['result']['synthesis'] == "Synthesis of Problem 4"
+        assert checkpoint['payload'] == {"problem": "Problem 4"}
+        assert not list(tmp_path.glob(".tmp-*")), "No temporary files should remain"
+
+    def test_resume_skips_complete_and_retries_failed(self, tmp_path):
+        """Test that a second run only re-runs debates without a complete checkpoint."""
+        items = make_items(4)
+        failing = RecordingDebate(fail={"Problem 1"})
+        summary = asyncio.run(BatchRunner(str(tmp_path), debate=failing).run(items))
+        assert summary['failedIds'] == ["debate-1"]
+        assert json.loads((tmp_path / "debate-1.json").read_text())['result']['error'] == "ThrottlingException"
+
+        # Simulate a crash that lost one debate's checkpoint
+        (tmp_path / "debate-3.json").unlink()
+
+        retry = RecordingDebate()
+        summary = asyncio.run(BatchRunner(str(tmp_path), debate=retry).run(items))
+        assert sorted(call['problem'] for call in retry.calls) == ["Problem 1", "Problem 3"]
+        assert summary == {"total": 4, "skipped": 2, "completed": 2, "failed": 0, "failedIds": []}
+
+        rerun = RecordingDebate()
+        asyncio.run(BatchRunner(str(tmp_path), debate=rerun).run(items, resume=False))
+        assert len(rerun.calls) == 4
+
+    def test_per_model_rate_limit(self, tmp_path):
+        """Test that debates wait for their model's request budget."""
+        debate = RecordingDebate(delay=0)
+        runner = BatchRunner(
+            str(tmp_path),
+            concurrency=10,
+            requests_per_minute=6000,
+            model_rpm={"slow-model": 60},
+            debate=debate,
+            model_calls=lambda payload: {"slow-model": 1, "fast-model": 10}
+        )
+
+        async def scenario():
+            # Drain most of the slow model's one-minute burst so later debates wait
+            await runner._bucket("slow-model").acquire(59)
+            started = time.monotonic()
+            await runner.run(make_items(3))
+            return time.monotonic() - started
+
+        elapsed = asyncio.run(scenario())
+
+        # 60 rpm refills one request per second: two debates wait ~1s each
+        assert 1.5 < elapsed < 4
+        assert runner._bucket("fast-model").rate == 100
+
+    def test_debates_without_status_fail(self, tmp_path):
+        """Test that a debate returning an error response is recorded as failed."""
+        async def failing(payload):
+            return {"status": "error", "error": "Synthesis failed"}
+
+        summary = asyncio.run(BatchRunner(str(tmp_path), debate=failing).run(make_items(1)))
+        assert summary['failedIds'] == ["debate-0"]
+
+
+class TestAsyncTokenBucket:
+    """Test suite for AsyncTokenBucket."""
+
+    def test_oversized_request_waits_for_full_bucket(self):
+        """Test that a request larger than the capacity does not wait forever."""
+        async def scenario():
+            bucket = AsyncTokenBucket(rate_per_minute=600, capacity=5)
+            await bucket.acquire(5)
+            started = time.monotonic()
+            await bucket.acquire(50)
+            return time.monotonic() - started
+
+        # Refilling 5 tokens at 10 per second takes ~0.5s
+        assert 0.4 < asyncio.run(scenario()) < 1.5
+
+
+def test_parse_model_rpm():
+    """Test MODEL_ID=RPM parsing, including model IDs containing '='."""
+    assert parse_model_rpm(["us.anthropic.claude=50", "a=b=10"]) == {"us.anthropic.claude": 50.0, "a=b": 10.0}
+    assert parse_model_rpm(None) == {}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
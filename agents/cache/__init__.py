@@ -0,0 +1,13 @@
+"""Content-addressed caches with pluggable storage backends."""
+
+from .backends import CacheBackend, MemoryBackend, DiskBackend, S3Backend, create_backend
+from .result_cache import DebateResultCache
+
+__all__ = [
+    'CacheBackend',
+    'MemoryBackend',
+    'DiskBackend',
+    'S3Backend',
+    'create_backend',
+    'DebateResultCache',
+]
@@ -0,0 +1,288 @@
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from botocore.exceptions import ClientError
+
+from aws_clients import get_client
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend:
+    """
+    Byte store addressed by string keys.
+
+    Backends never raise on a cache failure: a failed read is a miss and a
+    failed write is logged, so a broken cache only costs the work it would
+    have saved. Hit/miss counters are kept for reporting.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self._stats_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "errors": 0}
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored value for a key, or None on a miss."""
+        try:
+            value = self._get(key)
+        except Exception as e:
+            logger.warning(f"{self.name} cache read failed for {key}: {e}")
+            self._count("errors")
+            value = None
+        self._count("hits" if value is not None else "misses")
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        """Store a value under a key, replacing any previous value."""
+        try:
+            self._put(key, value)
+            self._count("writes")
+        except Exception as e:
+            logger.warning(f"{self.name} cache write failed for {key}: {e}")
+            self._count("errors")
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit, miss, write and error counters."""
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _count(self, counter: str) -> None:
+        with self._stats_lock:
+            self._stats[counter] += 1
+
+    def _get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def _put(self, key: str, value: bytes) -> None:
+        raise NotImplementedError
+
+
+class MemoryBackend(CacheBackend):
+    """In-process LRU store bounded by entry count."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 128):
+        """
+        Initialize the store.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def _put(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class DiskBackend(CacheBackend):
+    """
+    Local directory store, one file per key.
+
+    Files are named by the SHA-256 of their key and sharded by its first two
+    characters. Writes go to a temporary file that is renamed into place, so
+    concurrent readers never see a partial value.
+
+    With `max_bytes` the directory is kept under that size by evicting the
+    least recently used files. Recency is the file's modification time, which
+    reads refresh, so the order survives restarts; the size index itself is
+    per process.
+    """
+
+    name = "disk"
+
+    def __init__(self, directory: str, max_bytes: Optional[int] = None):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Root directory; created if missing
+            max_bytes: Total size kept before least recently used files are evicted
+        """
+        super().__init__()
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        if max_bytes is not None:
+            self._load_index()
+
+    def path(self, key: str) -> str:
+        """Return the file path for a key."""
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the counters, plus evictions and stored bytes when size-bounded."""
+        stats = super().stats()
+        if self.max_bytes is not None:
+            with self._lock:
+                stats.update(evictions=self.evictions, bytes=self._bytes)
+        return stats
+
+    def _get(self, key: str) -> Optional[bytes]:
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+        except FileNotFoundError:
+            return None
+        if self.max_bytes is not None:
+            self._touch(path, len(value))
+        return value
+
+    def _put(self, key: str, value: bytes) -> None:
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(value)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        if self.max_bytes is not None:
+            with self._lock:
+                self._bytes += len(value) - self._index.pop(path, 0)
+                self._index[path] = len(value)
+                self._evict()
+
+    def _load_index(self) -> None:
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.startswith(".tmp-"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, path, stat.st_size))
+        for _, path, size in sorted(entries):
+            self._index[path] = size
+            self._bytes += size
+        with self._lock:
+            self._evict()
+
+    def _touch(self, path: str, size: int) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            # Files written by other processes join the index on first read
+            self._bytes += size - self._index.pop(path, 0)
+            self._index[path] = size
+            self._evict()
+
+    def _evict(self) -> None:
+        # Called with the lock held; the newest file is kept even if it alone is too large
+        while self._bytes > self.max_bytes and len(self._index) > 1:
+            path, size = self._index.popitem(last=False)
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            self._bytes -= size
+            self.evictions += 1
+
+
+class S3Backend(CacheBackend):
+    """Store in an S3-compatible bucket under a key prefix."""
+
+    name = "s3"
+
+    def __init__(self, bucket: str, prefix: str = "", client=None, endpoint_url: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            bucket: Bucket name
+            prefix: Key prefix for all objects (e.g. "debate-results/")
+            client: boto3 S3 client; the shared client is used if omitted
+            endpoint_url: Endpoint of an S3-compatible service (e.g. MinIO)
+        """
+        super().__init__()
+        self.bucket = bucket
+        self.prefix = prefix
+        self.endpoint_url = endpoint_url
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_client('s3', endpoint_url=self.endpoint_url)
+        return self._client
+
+    def _get(self, key: str) -> Optional[bytes]:
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self.prefix + key)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('NoSuchKey', '404'):
+                return None
+            raise
+        return response['Body'].read()
+
+    def _put(self, key: str, value: bytes) -> None:
+        self.client.put_object(Bucket=self.bucket, Key=self.prefix + key, Body=value)
+
+
+def create_backend(kind: str, **options) -> Optional[CacheBackend]:
+    """
+    Create a cache backend by name.
+
+    Args:
+        kind: 'memory', 'disk', 's3' or 'none'
+        **options: Backend options; 'max_entries' (memory), 'directory' and
+            'max_bytes' (disk), 'bucket', 'prefix' and 'endpoint_url' (s3)
+
+    Returns:
+        The backend, or None for 'none'
+
+    Raises:
+        ValueError: If the kind is unknown or a required option is missing
+    """
+    if kind == "none":
+        return None
+    if kind == "memory":
+        return MemoryBackend(max_entries=options.get("max_entries", 128))
+    if kind == "disk":
+        if not options.get("directory"):
+            raise ValueError("Disk cache backend requires a directory")
+        return DiskBackend(options["directory"], max_bytes=options.get("max_bytes"))
+    if kind == "s3":
+        if not options.get("bucket"):
+            raise ValueError("S3 cache backend requires a bucket")
+        return S3Backend(
+            options["bucket"],
+            prefix=options.get("prefix", ""),
+            endpoint_url=options.get("endpoint_url")
+        )
+    raise ValueError(f"Unknown cache backend '{kind}', expected one of memory, disk, s3, none")
@@ -0,0 +1,82 @@
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from .backends import CacheBackend
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+
+class DebateResultCache:
+    """
+    Content-addressed cache of complete debate outputs.
+
+    A debate is stored as the ordered list of its complete events (turns,
+    round markers, synthesis and the final response), so a hit can be
+    replayed through the same event stream as a live debate. The key covers
+    everything that determines the output: the problem text, the model IDs,
+    the prompt versions, the sampling temperature and the orchestration
+    settings that shape the debate.
+    """
+
+    def __init__(self, backend: CacheBackend, namespace: str = "debates/v1"):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend for serialized debates
+            namespace: Prefix for every key; change it to invalidate all entries
+        """
+        self.backend = backend
+        self.namespace = namespace
+
+    @staticmethod
+    def make_key(
+        problem: str,
+        model_ids: List[str],
+        prompt_versions: List[str],
+        temperature,
+        settings: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Compute the content address of a debate.
+
+        Args:
+            problem: The problem statement
+            model_ids: Model IDs of every agent, in a fixed order
+            prompt_versions: Version or hash of every prompt, in a fixed order
+            temperature: Sampling temperature(s) of the agents
+            settings: Orchestration settings that change the output, e.g.
+                the round mode and context budget
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        fingerprint = json.dumps({
+            "problem": hashlib.sha256(problem.encode()).hexdigest(),
+            "models": model_ids,
+            "prompts": prompt_versions,
+            "temperature": temperature,
+            "settings": settings or {}
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[List[dict]]:
+        """Return the cached events of a debate, or None on a miss or unreadable entry."""
+        data = self.backend.get(f"{self.namespace}/{key}")
+        if data is None:
+            return None
+        try:
+            events = json.loads(data)
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable cached debate {key}: {e}")
+            return None
+        logger.info(f"Debate result cache hit for {key}")
+        return events
+
+    def put(self, key: str, events: List[dict]) -> None:
+        """Store the complete events of a finished debate."""
+        self.backend.put(f"{self.namespace}/{key}", json.dumps(events).encode())
+        logger.info(f"Cached debate result {key} ({len(events)} events)")
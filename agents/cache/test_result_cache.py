@@ -0,0 +1,133 @@
+"""Unit tests for cache backends and DebateResultCache."""
+
+import io
+
+import pytest
+from botocore.exceptions import ClientError
+from unittest.mock import Mock
+
+from cache.backends import DiskBackend, MemoryBackend, S3Backend, create_backend
+from cache.result_cache import DebateResultCache
+
+
+class TestBackends:
+    """Test suite for the cache backends."""
+
+    def test_memory_backend_lru(self):
+        """Test that the memory backend evicts the least recently used entry."""
+        backend = MemoryBackend(max_entries=2)
+        backend.put("a", b"1")
+        backend.put("b", b"2")
+        assert backend.get("a") == b"1"
+        backend.put("c", b"3")
+
+        assert backend.get("b") is None
+        assert backend.get("a") == b"1"
+        assert backend.get("c") == b"3"
+        assert backend.stats() == {"hits": 3, "misses": 1, "writes": 3, "errors": 0}
+
+    def test_disk_backend_round_trip(self, tmp_path):
+        """Test that the disk backend persists values across instances."""
+        DiskBackend(str(tmp_path)).put("debates/v1/abc", b"payload")
+
+        backend = DiskBackend(str(tmp_path))
+        assert backend.get("debates/v1/abc") == b"payload"
+        assert backend.get("debates/v1/missing") is None
+        assert not [p for p in tmp_path.rglob(".tmp-*")], "No temporary files should remain"
+
+    def test_disk_backend_size_lru(self, tmp_path):
+        """Test that a size-bounded disk backend evicts the least recently used files."""
+        import os
+        import time
+
+        backend = DiskBackend(str(tmp_path), max_bytes=10)
+        backend.put("a", b"1234")
+        backend.put("b", b"1234")
+        assert backend.get("a") == b"1234"
+        backend.put("c", b"1234")
+
+        assert backend.get("b") is None
+        assert backend.get("a") == b"1234"
+        assert backend.stats()["evictions"] == 1
+        assert backend.stats()["bytes"] == 8
+
+        # Recency survives a restart through file modification times
+        old = time.time() - 60
+        os.utime(backend.path("c"), (old, old))
+        restarted = DiskBackend(str(tmp_path), max_bytes=10)
+        restarted.put("d", b"1234")
+        assert restarted.get("c") is None
+        assert restarted.get("a") == b"1234"
+        assert restarted.get("d") == b"1234"
+
+    def test_s3_backend(self):
+        """Test S3 reads, writes and missing keys."""
+        client = Mock()
+        client.get_object.return_value = {'Body': io.BytesIO(b"payload")}
+        backend = S3Backend("bucket", prefix="results/", client=client)
+
+        backend.put("key", b"payload")
+        client.put_object.assert_called_once_with(Bucket="bucket", Key="results/key", Body=b"payload")
+        assert backend.get("key") == b"payload"
+
+        client.get_object.side_effect = ClientError({'Error': {'Code': 'NoSuchKey'}}, 'GetObject')
+        assert backend.get("missing") is None
+        assert backend.stats()["errors"] == 0
+
+    def test_backend_failures_are_misses(self):
+        """Test that storage errors never propagate to the caller."""
+        client = Mock()
+        client.get_object.side_effect = ClientError({'Error': {'Code': 'AccessDenied'}}, 'GetObject')
+        client.put_object.side_effect = Exception("Network down")
+        backend = S3Backend("bucket", client=client)
+
+        backend.put("key", b"payload")
+        assert backend.get("key") is None
+        assert backend.stats()["errors"] == 2
+
+    def test_create_backend(self, tmp_path):
+        """Test backend selection by name."""
+        assert create_backend("none") is None
+        assert isinstance(create_backend("memory"), MemoryBackend)
+        assert isinstance(create_backend("disk", directory=str(tmp_path)), DiskBackend)
+        assert create_backend("disk", directory=str(tmp_path), max_bytes=100).max_bytes == 100
+        assert isinstance(create_backend("s3", bucket="bucket"), S3Backend)
+        with pytest.raises(ValueError):
+            create_backend("s3")
+        with pytest.raises(ValueError):
+            create_backend("redis")
+
+
+class TestDebateResultCache:
+    """Test suite for DebateResultCache."""
+
+    def test_key_covers_all_inputs(self):
+        """Test that every key input changes the content address."""
+        base = dict(problem="Mars", model_ids=["m1"], prompt_versions=["v1"], temperature=0.7)
+        key = DebateResultCache.make_key(**base)
+
+        assert key == DebateResultCache.make_key(**base)
+        for field, value in [("problem", "Moon"), ("model_ids", ["m2"]),
+                             ("prompt_versions", ["v2"]), ("temperature", 0.2),
+                             ("settings", {"parallelRound": True})]:
+            assert DebateResultCache.make_key(**dict(base, **{field: value})) != key
+
+    def test_round_trip(self):
+        """Test that stored events are returned unchanged."""
+        cache = DebateResultCache(MemoryBackend())
+        events = [{"type": "session_started", "sessionId": "s"}, {"type": "debate_complete", "status": "complete"}]
+
+        assert cache.get("key") is None
+        cache.put("key", events)
+        assert cache.get("key") == events
+
+    def test_unreadable_entry_is_a_miss(self):
+        """Test that a corrupt entry is treated as a miss."""
+        backend = MemoryBackend()
+        cache = DebateResultCache(backend)
+        backend.put("debates/v1/key", b"not json")
+        assert cache.get("key") is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -1,9 +1,11 @@
 from strands import Agent
-from strands.models import BedrockModel
 
-jeff_barr_agent = Agent(
-    model=BedrockModel(model_id="anthropic.claude-sonnet-4-v1"),
-    system_prompt="""You are Jeff Barr, VP & Chief Evangelist at AWS. After 20 years and 3,283 blog posts, you've stepped back from lead blogging to return to your builder roots.
+from agent_registry import agent_registry
+from gateway import GatewayBedrockModel
+
+from .prompt_cache import cacheable_system_prompt
+
+JEFF_BARR_PROMPT = """You are Jeff Barr, VP & Chief Evangelist at AWS. After 20 years and 3,283 blog posts, you've stepped back from lead blogging to return to your builder roots.
 
 CORE IDENTITY:
 - First-person and personal - share from direct experience
@@ -44,4 +46,18 @@ RESPONSE RULES:
 
 YOUR GOAL:
 Elevate the conversation by grounding it in reality, customer impact, and hands-on experience while remaining genuinely warm and collaborative."""
-)
+
+
+def build_jeff_barr_agent() -> Agent:
+    """Build Jeff Barr's expert agent."""
+    return Agent(
+        model=GatewayBedrockModel(model_id="anthropic.claude-sonnet-4-v1"),
+        # Cache point after the static persona so every turn reuses it
+        system_prompt=cacheable_system_prompt(JEFF_BARR_PROMPT),
+        # The expert ID: memory actor, event expertId and prompt-cache key
+        name="jeff_barr"
+    )
+
+
+# Built on first use (or pre-warm) by the agent registry, not at import
+jeff_barr_agent = agent_registry.register("jeff_barr", build_jeff_barr_agent)
@@ -0,0 +1,119 @@
+"""Bedrock prompt-caching helpers shared by the expert and synthesis agents.
+
+Bedrock caches the prompt prefix that ends at a `cachePoint` content block,
+so the stable parts of a prompt (system prompt, problem statement, earlier
+debate rounds) are placed first and followed by a cache point. A later
+request that starts with the same prefix reads it from the cache instead of
+re-processing it, which lowers latency and input-token cost.
+"""
+
+import logging
+import threading
+from typing import List, Optional
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+CACHE_POINT = {"cachePoint": {"type": "default"}}
+
+# Bedrock accepts at most four cache points per request
+MAX_CACHE_POINTS = 4
+
+
+def cacheable_system_prompt(text: str) -> List[dict]:
+    """Return a system prompt as content blocks with a cache point after the text."""
+    return [{"text": text}, CACHE_POINT]
+
+
+def limit_cache_points(blocks: List[dict], reserved: int = 1) -> List[dict]:
+    """
+    Drop a prompt's earliest cache points beyond what Bedrock accepts.
+
+    Args:
+        blocks: Prompt content blocks
+        reserved: Cache points used elsewhere in the request (one for a
+            cacheable_system_prompt)
+
+    Returns:
+        The blocks with at most MAX_CACHE_POINTS - reserved cache points; the
+        last ones are kept, as they end the longest cached prefixes
+    """
+    excess = sum("cachePoint" in block for block in blocks) - (MAX_CACHE_POINTS - reserved)
+    if excess <= 0:
+        return blocks
+    limited = []
+    for block in blocks:
+        if excess > 0 and "cachePoint" in block:
+            excess -= 1
+            continue
+        limited.append(block)
+    logger.warning(f"Dropped cache points over Bedrock's limit of {MAX_CACHE_POINTS} per request")
+    return limited
+
+
+class PromptCacheStats:
+    """
+    Thread-safe prompt-cache counters built from Bedrock usage metrics.
+
+    `hitRate` is the share of input tokens read from the cache; `callHitRate`
+    is the share of model calls that read anything from it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.cache_hits = 0
+        self.input_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+
+    def record(self, usage: Optional[dict]) -> None:
+        """
+        Add the usage of one model call.
+
+        Args:
+            usage: Bedrock usage dict (inputTokens, cacheReadInputTokens,
+                cacheWriteInputTokens); anything else is ignored
+        """
+        if not isinstance(usage, dict):
+            return
+        read = usage.get('cacheReadInputTokens', 0) or 0
+        with self._lock:
+            self.calls += 1
+            self.cache_hits += 1 if read > 0 else 0
+            self.input_tokens += usage.get('inputTokens', 0) or 0
+            self.cache_read_tokens += read
+            self.cache_write_tokens += usage.get('cacheWriteInputTokens', 0) or 0
+
+    def record_result(self, result) -> None:
+        """Add the accumulated usage of a Strands AgentResult."""
+        metrics = getattr(result, 'metrics', None)
+        self.record(getattr(metrics, 'accumulated_usage', None))
+
+    def snapshot(self) -> dict:
+        """Return the counters and hit rates as a JSON-serializable dict."""
+        with self._lock:
+            total_input = self.input_tokens + self.cache_read_tokens + self.cache_write_tokens
+            return {
+                "calls": self.calls,
+                "cacheHits": self.cache_hits,
+                "inputTokens": self.input_tokens,
+                "cacheReadInputTokens": self.cache_read_tokens,
+                "cacheWriteInputTokens": self.cache_write_tokens,
+                "hitRate": round(self.cache_read_tokens / total_input, 4) if total_input else 0.0,
+                "callHitRate": round(self.cache_hits / self.calls, 4) if self.calls else 0.0
+            }
+
+    def merge(self, other: "PromptCacheStats") -> None:
+        """Add another set of counters to this one."""
+        snapshot = other.snapshot()
+        with self._lock:
+            self.calls += snapshot["calls"]
+            self.cache_hits += snapshot["cacheHits"]
+            self.input_tokens += snapshot["inputTokens"]
+            self.cache_read_tokens += snapshot["cacheReadInputTokens"]
+            self.cache_write_tokens += snapshot["cacheWriteInputTokens"]
+
+
+# Process-wide totals across all debates
+prompt_cache_stats = PromptCacheStats()
@@ -1,9 +1,11 @@
 from strands import Agent
-from strands.models import BedrockModel
 
-swami_agent = Agent(
-    model=BedrockModel(model_id="anthropic.claude-sonnet-4-v1"),
-    system_prompt="""You are Swami Sivasubramanian, VP of Agentic AI at AWS and S-team member. Cloud computing pioneer, co-author of Amazon Dynamo paper, holder of 250+ patents, builder of DynamoDB and SageMaker.
+from agent_registry import agent_registry
+from gateway import GatewayBedrockModel
+
+from .prompt_cache import cacheable_system_prompt
+
+SWAMI_PROMPT = """You are Swami Sivasubramanian, VP of Agentic AI at AWS and S-team member. Cloud computing pioneer, co-author of Amazon Dynamo paper, holder of 250+ patents, builder of DynamoDB and SageMaker.
 
 PERSONALITY: "THE ETERNAL OPTIMIST"
 You are an eternal optimist—but not a naïve one. You find the silver lining, the opportunity in the challenge, the learning in the failure—with technical grounding and genuine acknowledgment of difficulties.
@@ -36,4 +38,18 @@ RESPONSE RULES:
 - Acknowledge challenges before reframing
 - Build on previous expert responses
 - Conversational, warm tone"""
-)
+
+
+def build_swami_agent() -> Agent:
+    """Build Swami's expert agent."""
+    return Agent(
+        model=GatewayBedrockModel(model_id="anthropic.claude-sonnet-4-v1"),
+        # Cache point after the static persona so every turn reuses it
+        system_prompt=cacheable_system_prompt(SWAMI_PROMPT),
+        # The expert ID: memory actor, event expertId and prompt-cache key
+        name="swami"
+    )
+
+
+# Built on first use (or pre-warm) by the agent registry, not at import
+swami_agent = agent_registry.register("swami", build_swami_agent)
@@ -1,9 +1,11 @@
 from strands import Agent
-from strands.models import BedrockModel
 
-werner_agent = Agent(
-    model=BedrockModel(model_id="anthropic.claude-sonnet-4-v1"),
-    system_prompt="""You are Werner Vogels, Amazon's CTO and VP. 67 years old, Dutch-born, 20 years building AWS. Known industry-wide for being brutally direct, intellectually rigorous, and utterly intolerant of bullshit and incompetence.
+from agent_registry import agent_registry
+from gateway import GatewayBedrockModel
+
+from .prompt_cache import cacheable_system_prompt
+
+WERNER_VOGELS_PROMPT = """You are Werner Vogels, Amazon's CTO and VP. 67 years old, Dutch-born, 20 years building AWS. Known industry-wide for being brutally direct, intellectually rigorous, and utterly intolerant of bullshit and incompetence.
 
 PERSONALITY TRAITS:
 - Don't sugarcoat. If someone is wrong, tell them immediately
@@ -48,4 +50,18 @@ RESPONSE RULES:
 - Use exact technical terminology
 - Reference real AWS incidents and scale
 - Conversational but confrontational tone"""
-)
+
+
+def build_werner_agent() -> Agent:
+    """Build Werner Vogels' expert agent."""
+    return Agent(
+        model=GatewayBedrockModel(model_id="anthropic.claude-sonnet-4-v1"),
+        # Cache point after the static persona so every turn reuses it
+        system_prompt=cacheable_system_prompt(WERNER_VOGELS_PROMPT),
+        # The expert ID: memory actor, event expertId and prompt-cache key
+        name="werner_vogels"
+    )
+
+
+# Built on first use (or pre-warm) by the agent registry, not at import
+werner_agent = agent_registry.register("werner_vogels", build_werner_agent)
@@ -0,0 +1,30 @@
+"""Shared admission control (rate limits, adaptive concurrency, priorities) for model calls."""
+
+from .model_gateway import (
+    BATCH,
+    LIVE,
+    ModelGateway,
+    ModelLimits,
+    Permit,
+    TokenBucket,
+    current_priority,
+    is_throttle,
+    model_gateway,
+    traffic_priority,
+)
+from .bedrock import GatewayBedrockModel, estimate_request_tokens
+
+__all__ = [
+    'BATCH',
+    'LIVE',
+    'ModelGateway',
+    'ModelLimits',
+    'Permit',
+    'TokenBucket',
+    'current_priority',
+    'is_throttle',
+    'model_gateway',
+    'traffic_priority',
+    'GatewayBedrockModel',
+    'estimate_request_tokens',
+]
@@ -0,0 +1,71 @@
+import json
+import logging
+from typing import Any, Optional
+
+from strands.models.bedrock import BedrockModel
+from strands.types.exceptions import ModelThrottledException
+
+from tokens import estimate_tokens
+from .model_gateway import ModelGateway, model_gateway
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+# Output tokens reserved when a model has no max_tokens configured
+DEFAULT_MAX_OUTPUT_TOKENS = 4096
+
+
+def estimate_request_tokens(messages, system_prompt_content=None, max_tokens: Optional[int] = None) -> int:
+    """Estimate the tokens/min cost of a request: its input plus the maximum output."""
+    payload = json.dumps([messages, system_prompt_content or []], default=str)
+    return estimate_tokens(payload) + (max_tokens or DEFAULT_MAX_OUTPUT_TOKENS)
+
+
+class GatewayBedrockModel(BedrockModel):
+    """
+    BedrockModel whose calls are admitted by a ModelGateway.
+
+    Each request waits for a permit for its model (rate buckets, adaptive
+    concurrency, LIVE/BATCH priority), reserves its estimated tokens, and on
+    completion reports the actual usage and whether Bedrock throttled it.
+    Strands retries throttled calls, and every retry goes through the gateway
+    again, now under the reduced concurrency limit.
+    """
+
+    def __init__(self, *, gateway: Optional[ModelGateway] = None, **kwargs: Any):
+        """
+        Initialize the model.
+
+        Args:
+            gateway: Gateway to admit calls through; defaults to the process-wide model_gateway
+            **kwargs: BedrockModel arguments
+        """
+        super().__init__(**kwargs)
+        self.gateway = gateway
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs: Any):
+        gateway = self.gateway or model_gateway
+        system_prompt_content = kwargs.get('system_prompt_content')
+        if system_prompt_content is None and system_prompt:
+            system_prompt_content = [{"text": system_prompt}]
+        reserved = estimate_request_tokens(messages, system_prompt_content, self.config.get('max_tokens'))
+
+        permit = await gateway.acquire_async(self.config['model_id'], reserved)
+        throttled = False
+        ok = False
+        try:
+            async for event in super().stream(messages, tool_specs, system_prompt, **kwargs):
+                usage = event.get('metadata', {}).get('usage') if isinstance(event, dict) else None
+                if usage:
+                    permit.record_usage(
+                        (usage.get('inputTokens', 0) or 0)
+                        + (usage.get('outputTokens', 0) or 0)
+                        + (usage.get('cacheWriteInputTokens', 0) or 0)
+                    )
+                yield event
+            ok = True
+        except ModelThrottledException:
+            throttled = True
+            raise
+        finally:
+            permit.release(throttled=throttled, ok=ok)
@@ -0,0 +1,368 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from botocore.exceptions import ClientError
+from strands.types.exceptions import ModelThrottledException
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+# Traffic priorities: lower values are served first
+LIVE = 0
+BATCH = 1
+
+_priority: contextvars.ContextVar = contextvars.ContextVar("model_gateway_priority", default=LIVE)
+
+THROTTLING_ERROR_CODES = {"ThrottlingException", "TooManyRequestsException", "Throttling"}
+
+
+@contextmanager
+def traffic_priority(priority: int):
+    """Run model calls made in this context (including tasks and executor calls it starts) at a priority."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> int:
+    """Return the traffic priority of the current context (LIVE unless set)."""
+    return _priority.get()
+
+
+def is_throttle(error: BaseException) -> bool:
+    """Whether an exception is a Bedrock throttling response."""
+    if isinstance(error, ModelThrottledException):
+        return True
+    if isinstance(error, ClientError):
+        return error.response.get('Error', {}).get('Code') in THROTTLING_ERROR_CODES
+    return False
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled at `rate_per_minute` up to `capacity`
+    (one minute's worth by default).
+
+    Callers check `delay` and then `take` under their own lock, so a request
+    needing several buckets takes from all of them or from none. A bucket may
+    go negative when usage turns out higher than reserved; later requests then
+    wait for the overage to refill.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def delay(self, tokens: float) -> float:
+        """Return the seconds until `tokens` are available (0 if they are now)."""
+        # A request larger than the bucket waits for a full bucket instead of forever
+        tokens = min(tokens, self.capacity)
+        with self._lock:
+            self._refill()
+            if self.tokens >= tokens:
+                return 0.0
+            return (tokens - self.tokens) / self.rate
+
+    def take(self, tokens: float) -> None:
+        """Remove tokens, going negative if there are not enough."""
+        with self._lock:
+            self._refill()
+            self.tokens -= tokens
+
+    def give(self, tokens: float) -> None:
+        """Return unused tokens (or charge extra ones when negative)."""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + tokens)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+@dataclass
+class ModelLimits:
+    """
+    Client-side limits for one model.
+
+    Concurrency starts at `initial_concurrency` (default: max_concurrency)
+    and adapts between min_concurrency and max_concurrency.
+    """
+    requests_per_minute: Optional[float] = None
+    tokens_per_minute: Optional[float] = None
+    max_concurrency: int = 32
+    min_concurrency: int = 1
+    initial_concurrency: Optional[int] = None
+
+    @classmethod
+    def from_env(cls) -> "ModelLimits":
+        """Read MODEL_RPM, MODEL_TPM, MODEL_MAX_CONCURRENCY and MODEL_MIN_CONCURRENCY."""
+        rpm = os.getenv('MODEL_RPM')
+        tpm = os.getenv('MODEL_TPM')
+        return cls(
+            requests_per_minute=float(rpm) if rpm else None,
+            tokens_per_minute=float(tpm) if tpm else None,
+            max_concurrency=int(os.getenv('MODEL_MAX_CONCURRENCY', '32')),
+            min_concurrency=int(os.getenv('MODEL_MIN_CONCURRENCY', '1'))
+        )
+
+
+class _Waiter:
+    __slots__ = ("tokens", "granted", "cancelled", "permit", "notify")
+
+    def __init__(self, tokens: float):
+        self.tokens = tokens
+        self.granted = False
+        self.cancelled = False
+        self.permit: Optional["Permit"] = None
+        self.notify = None
+
+
+class _Lane:
+    """Queue, rate buckets and adaptive concurrency limit of one model."""
+
+    def __init__(self, limits: ModelLimits):
+        self.limits = limits
+        self.request_bucket = TokenBucket(limits.requests_per_minute) if limits.requests_per_minute else None
+        self.token_bucket = TokenBucket(limits.tokens_per_minute) if limits.tokens_per_minute else None
+        self.limit = float(limits.initial_concurrency or limits.max_concurrency)
+        self.in_flight = 0
+        self.queue: List[tuple] = []
+        self.timer: Optional[threading.Timer] = None
+        self.last_decrease = 0.0
+        self.stats = {"granted": 0, "throttled": 0, "queued": 0}
+
+
+class Permit:
+    """
+    Permission to make one model call; release it exactly once when the call ends.
+    """
+
+    def __init__(self, gateway: "ModelGateway", model_id: str, reserved_tokens: float):
+        self.gateway = gateway
+        self.model_id = model_id
+        self.reserved_tokens = reserved_tokens
+        self.used_tokens: Optional[float] = None
+        self.started_at = time.monotonic()
+        self._released = False
+
+    def record_usage(self, tokens: float) -> None:
+        """Set the tokens the call actually used, to correct the tokens/min reservation."""
+        self.used_tokens = tokens
+
+    def release(self, throttled: bool = False, ok: bool = True) -> None:
+        """
+        End the call.
+
+        Args:
+            throttled: The model throttled the call; shrinks the concurrency limit
+            ok: The call succeeded; only successes grow the concurrency limit
+        """
+        if self._released:
+            return
+        self._released = True
+        self.gateway._release(self, throttled, ok and not throttled)
+
+
+class ModelGateway:
+    """
+    Shared client-side admission control for model calls.
+
+    Every model gets a lane with optional requests/min and tokens/min token
+    buckets and an adaptive concurrency limit (AIMD): each successful call
+    raises the limit by 1/limit (about +1 per full window of calls) and a
+    throttled call halves it, at most once per window of in-flight calls.
+    Calls wait in a priority queue, so LIVE debate traffic is always admitted
+    before queued BATCH traffic.
+
+    Works from any thread and any event loop: `acquire` blocks the calling
+    thread, `acquire_async` suspends the calling coroutine.
+    """
+
+    def __init__(
+        self,
+        default_limits: Optional[ModelLimits] = None,
+        limits: Optional[Dict[str, ModelLimits]] = None,
+        decrease_factor: float = 0.5
+    ):
+        """
+        Initialize the gateway.
+
+        Args:
+            default_limits: Limits of models without their own entry
+            limits: Limits per model ID
+            decrease_factor: Multiplier applied to the concurrency limit on throttling
+        """
+        self.default_limits = default_limits or ModelLimits()
+        self.decrease_factor = decrease_factor
+        self._limits = dict(limits or {})
+        self._lanes: Dict[str, _Lane] = {}
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+
+    def configure(self, model_id: str, limits: ModelLimits) -> None:
+        """Set the limits of one model (resets its lane)."""
+        with self._lock:
+            self._limits[model_id] = limits
+            self._lanes.pop(model_id, None)
+
+    def acquire(self, model_id: str, tokens: float = 0, priority: Optional[int] = None) -> Permit:
+        """Block until a call to `model_id` reserving `tokens` may start."""
+        event = threading.Event()
+        waiter = self._enqueue(model_id, tokens, priority, event.set)
+        event.wait()
+        return waiter.permit
+
+    async def acquire_async(self, model_id: str, tokens: float = 0, priority: Optional[int] = None) -> Permit:
+        """Wait, without blocking the event loop, until a call to `model_id` may start."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def notify():
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+        waiter = self._enqueue(model_id, tokens, priority, notify)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                waiter.cancelled = True
+                granted = waiter.granted
+            if granted:
+                waiter.permit.release(ok=False)
+            raise
+        return waiter.permit
+
+    @contextmanager
+    def slot(self, model_id: str, tokens: float = 0, priority: Optional[int] = None):
+        """Hold a permit for the duration of a blocking call; throttling errors are recorded."""
+        permit = self.acquire(model_id, tokens, priority)
+        try:
+            yield permit
+        except BaseException as e:
+            permit.release(throttled=is_throttle(e), ok=False)
+            raise
+        permit.release()
+
+    @asynccontextmanager
+    async def slot_async(self, model_id: str, tokens: float = 0, priority: Optional[int] = None):
+        """Async version of slot."""
+        permit = await self.acquire_async(model_id, tokens, priority)
+        try:
+            yield permit
+        except BaseException as e:
+            permit.release(throttled=is_throttle(e), ok=False)
+            raise
+        permit.release()
+
+    def stats(self) -> Dict[str, dict]:
+        """Return the concurrency limit, in-flight and queued calls and counters of every model."""
+        with self._lock:
+            return {
+                model_id: dict(
+                    lane.stats,
+                    concurrencyLimit=round(lane.limit, 2),
+                    inFlight=lane.in_flight,
+                    waiting=sum(1 for _, _, waiter in lane.queue if not waiter.cancelled)
+                )
+                for model_id, lane in self._lanes.items()
+            }
+
+    def _lane(self, model_id: str) -> _Lane:
+        lane = self._lanes.get(model_id)
+        if lane is None:
+            lane = self._lanes[model_id] = _Lane(self._limits.get(model_id, self.default_limits))
+        return lane
+
+    def _enqueue(self, model_id: str, tokens: float, priority: Optional[int], notify) -> _Waiter:
+        waiter = _Waiter(tokens)
+        waiter.notify = notify
+        priority = current_priority() if priority is None else priority
+        with self._lock:
+            lane = self._lane(model_id)
+            heapq.heappush(lane.queue, (priority, next(self._sequence), waiter))
+            self._dispatch(model_id, lane)
+            if not waiter.granted:
+                lane.stats["queued"] += 1
+        return waiter
+
+    def _dispatch(self, model_id: str, lane: _Lane) -> None:
+        # Called with the gateway lock held
+        while lane.queue:
+            _, _, waiter = lane.queue[0]
+            if waiter.cancelled:
+                heapq.heappop(lane.queue)
+                continue
+            if lane.in_flight >= max(1, int(lane.limit)):
+                return
+            delay = max(
+                lane.request_bucket.delay(1) if lane.request_bucket else 0.0,
+                lane.token_bucket.delay(waiter.tokens) if lane.token_bucket and waiter.tokens else 0.0
+            )
+            if delay > 0:
+                self._schedule(model_id, lane, delay)
+                return
+
+            heapq.heappop(lane.queue)
+            if lane.request_bucket:
+                lane.request_bucket.take(1)
+            if lane.token_bucket and waiter.tokens:
+                lane.token_bucket.take(waiter.tokens)
+            lane.in_flight += 1
+            lane.stats["granted"] += 1
+            waiter.permit = Permit(self, model_id, waiter.tokens)
+            waiter.granted = True
+            waiter.notify()
+
+    def _schedule(self, model_id: str, lane: _Lane, delay: float) -> None:
+        if lane.timer is not None:
+            return
+
+        def wake():
+            with self._lock:
+                lane.timer = None
+                self._dispatch(model_id, lane)
+
+        lane.timer = threading.Timer(delay, wake)
+        lane.timer.daemon = True
+        lane.timer.start()
+
+    def _release(self, permit: Permit, throttled: bool, ok: bool) -> None:
+        with self._lock:
+            lane = self._lane(permit.model_id)
+            lane.in_flight = max(0, lane.in_flight - 1)
+            limits = lane.limits
+            if throttled:
+                lane.stats["throttled"] += 1
+                # Calls that started before the last decrease saw the old limit;
+                # their throttles do not shrink it again
+                if permit.started_at >= lane.last_decrease:
+                    lane.limit = max(limits.min_concurrency, lane.limit * self.decrease_factor)
+                    lane.last_decrease = time.monotonic()
+                    logger.warning(
+                        f"Model {permit.model_id} throttled; concurrency limit reduced to {lane.limit:.1f}"
+                    )
+            elif ok:
+                lane.limit = min(limits.max_concurrency, lane.limit + 1.0 / max(lane.limit, 1.0))
+            if lane.token_bucket and permit.used_tokens is not None and permit.reserved_tokens:
+                lane.token_bucket.give(permit.reserved_tokens - permit.used_tokens)
+            self._dispatch(permit.model_id, lane)
+
+
+# Process-wide gateway used by every agent
+model_gateway = ModelGateway(ModelLimits.from_env())
@@ -0,0 +1,205 @@
+"""Unit tests for ModelGateway and GatewayBedrockModel."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from botocore.exceptions import ClientError
+from strands.models.bedrock import BedrockModel
+from strands.types.exceptions import ModelThrottledException
+from unittest.mock import patch
+
+from gateway.bedrock import GatewayBedrockModel
+from gateway.model_gateway import BATCH, LIVE, ModelGateway, ModelLimits, is_throttle, traffic_priority
+
+
+class TestModelGateway:
+    """Test suite for ModelGateway."""
+
+    def test_concurrency_limit(self):
+        """Test that no more than the concurrency limit of calls run at once."""
+        gateway = ModelGateway(ModelLimits(max_concurrency=2))
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def call():
+            with gateway.slot("model"):
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                time.sleep(0.02)
+                with lock:
+                    active.pop()
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert max(peak) == 2
+        assert gateway.stats()["model"]["granted"] == 6
+        assert gateway.stats()["model"]["inFlight"] == 0
+
+    def test_aimd(self):
+        """Test additive increase on success and one multiplicative decrease per window."""
+        gateway = ModelGateway(ModelLimits(max_concurrency=16, initial_concurrency=8))
+
+        first = gateway.acquire("model")
+        second = gateway.acquire("model")
+        first.release(throttled=True)
+        assert gateway.stats()["model"]["concurrencyLimit"] == 4
+
+        # A call that started before the decrease does not shrink the limit again
+        second.release(throttled=True)
+        assert gateway.stats()["model"]["concurrencyLimit"] == 4
+        assert gateway.stats()["model"]["throttled"] == 2
+
+        for _ in range(4):
+            gateway.acquire("model").release()
+        assert gateway.stats()["model"]["concurrencyLimit"] == pytest.approx(4.9, abs=0.1)
+
+        # Never below min_concurrency
+        for _ in range(10):
+            gateway.acquire("model").release(throttled=True)
+        assert gateway.stats()["model"]["concurrencyLimit"] == 1
+
+    def test_live_traffic_first(self):
+        """Test that queued LIVE calls are admitted before earlier queued BATCH calls."""
+        gateway = ModelGateway(ModelLimits(max_concurrency=1))
+        holder = gateway.acquire("model")
+        order = []
+
+        def call(name, priority):
+            with traffic_priority(priority):
+                permit = gateway.acquire("model")
+            order.append(name)
+            permit.release()
+
+        batch = threading.Thread(target=call, args=("batch", BATCH))
+        batch.start()
+        time.sleep(0.05)
+        live = threading.Thread(target=call, args=("live", LIVE))
+        live.start()
+        time.sleep(0.05)
+        assert gateway.stats()["model"]["waiting"] == 2
+
+        holder.release()
+        batch.join(5)
+        live.join(5)
+        assert order == ["live", "batch"]
+
+    def test_tokens_per_minute(self):
+        """Test that calls wait for token budget and unused reservations are returned."""
+        gateway = ModelGateway(ModelLimits(tokens_per_minute=6000))
+
+        permit = gateway.acquire("model", tokens=6000)
+        permit.record_usage(1000)
+        permit.release()
+        # 5000 unused tokens were returned, so this is admitted immediately
+        started = time.monotonic()
+        gateway.acquire("model", tokens=4000).release()
+        assert time.monotonic() - started < 0.1
+
+        # ~1000 tokens left; the other 50 refill at 100 tokens/s in ~0.5s
+        started = time.monotonic()
+        gateway.acquire("model", tokens=1050).release()
+        assert 0.3 < time.monotonic() - started < 2
+
+    def test_requests_per_minute(self):
+        """Test that the request bucket delays calls beyond the per-minute budget."""
+        gateway = ModelGateway(limits={"slow": ModelLimits(requests_per_minute=120)})
+        for _ in range(120):
+            gateway.acquire("slow").release()
+
+        started = time.monotonic()
+        gateway.acquire("slow").release()
+        assert 0.3 < time.monotonic() - started < 2
+        # Other models use the (unlimited) defaults
+        gateway.acquire("fast").release()
+
+    def test_acquire_async_and_cancel(self):
+        """Test async waiting and that a cancelled waiter never holds a permit."""
+        gateway = ModelGateway(ModelLimits(max_concurrency=1))
+
+        async def scenario():
+            holder = await gateway.acquire_async("model")
+            waiting = asyncio.create_task(gateway.acquire_async("model"))
+            await asyncio.sleep(0.02)
+            waiting.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiting
+            holder.release()
+
+            async with gateway.slot_async("model"):
+                assert gateway.stats()["model"]["inFlight"] == 1
+
+        asyncio.run(scenario())
+        assert gateway.stats()["model"]["inFlight"] == 0
+        assert gateway.stats()["model"]["waiting"] == 0
+
+    def test_slot_records_throttling(self):
+        """Test that a throttling error raised inside a slot shrinks the limit."""
+        gateway = ModelGateway(ModelLimits(max_concurrency=8))
+        error = ClientError({"Error": {"Code": "ThrottlingException"}}, "InvokeModel")
+
+        with pytest.raises(ClientError):
+            with gateway.slot("model"):
+                raise error
+        assert gateway.stats()["model"]["concurrencyLimit"] == 4
+
+        with pytest.raises(ValueError):
+            with gateway.slot("model"):
+                raise ValueError("Bad request")
+        assert gateway.stats()["model"]["concurrencyLimit"] == 4
+
+    def test_is_throttle(self):
+        """Test throttling detection for Strands and botocore errors."""
+        assert is_throttle(ModelThrottledException("slow down"))
+        assert is_throttle(ClientError({"Error": {"Code": "TooManyRequestsException"}}, "Converse"))
+        assert not is_throttle(ClientError({"Error": {"Code": "ValidationException"}}, "Converse"))
+        assert not is_throttle(RuntimeError("boom"))
+
+
+class TestGatewayBedrockModel:
+    """Test suite for GatewayBedrockModel."""
+
+    def test_stream_goes_through_gateway(self):
+        """Test that streaming holds a permit and reports usage and throttling."""
+        gateway = ModelGateway(ModelLimits(max_concurrency=8, tokens_per_minute=100000))
+        model = GatewayBedrockModel(model_id="test-model", max_tokens=1000, region_name="us-east-1", gateway=gateway)
+        in_flight = []
+
+        async def fake_stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+            in_flight.append(gateway.stats()["test-model"]["inFlight"])
+            yield {"contentBlockDelta": {"delta": {"text": "Hello"}}}
+            yield {"metadata": {"usage": {"inputTokens": 50, "outputTokens": 10, "totalTokens": 60}}}
+
+        async def throttled_stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+            raise ModelThrottledException("ThrottlingException")
+            yield
+
+        messages = [{"role": "user", "content": [{"text": "Hi"}]}]
+
+        async def consume():
+            return [event async for event in model.stream(messages, system_prompt="You are terse.")]
+
+        with patch.object(BedrockModel, 'stream', fake_stream):
+            events = asyncio.run(consume())
+        assert len(events) == 2 and in_flight == [1]
+        stats = gateway.stats()["test-model"]
+        assert stats["inFlight"] == 0 and stats["granted"] == 1
+        # Reserved ~1000+ tokens, used 60: the difference went back to the bucket
+        assert gateway._lanes["test-model"].token_bucket.tokens > 99900
+
+        with patch.object(BedrockModel, 'stream', throttled_stream):
+            with pytest.raises(ModelThrottledException):
+                asyncio.run(consume())
+        assert gateway.stats()["test-model"]["concurrencyLimit"] == 4
+        assert gateway.stats()["test-model"]["inFlight"] == 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
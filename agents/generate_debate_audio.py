@@ -1,66 +1,28 @@
 #!/usr/bin/env python3
-import boto3
+from audio import AudioPipeline, AudioSegment, Transcript
 
 def extract_expert_responses(md_file, round_num=1):
     """Extract all three expert responses from a specific round"""
-    with open(md_file, 'r') as f:
-        content = f.read()
+    transcript = Transcript.load(md_file)
     
     experts = {
         'jeff_barr': {'voice': 'Matthew', 'text': ''},
         'swami': {'voice': 'Stephen', 'text': ''},
         'werner_vogels': {'voice': 'Brian', 'text': ''}
     }
-    
-    # Find Round section
-    round_marker = f"## Round {round_num}:"
-    round_start = content.find(round_marker)
-    if round_start == -1:
-        return experts
-    
-    # Find next round or end
-    next_round = content.find(f"## Round {round_num + 1}:", round_start + 1)
-    if next_round == -1:
-        next_round = content.find("## Final Synthesis", round_start + 1)
-    if next_round == -1:
-        next_round = len(content)
-    
-    round_content = content[round_start:next_round]
-    
-    # Extract Jeff Barr
-    jeff_start = round_content.find("### Jeff Barr")
-    swami_start = round_content.find("### Swami")
-    if jeff_start != -1 and swami_start != -1:
-        experts['jeff_barr']['text'] = round_content[jeff_start:swami_start].split('\n', 1)[1].strip()
-    
-    # Extract Swami
-    werner_start = round_content.find("### Werner Vogels")
-    if swami_start != -1 and werner_start != -1:
-        experts['swami']['text'] = round_content[swami_start:werner_start].split('\n', 1)[1].strip()
-    
-    # Extract Werner
-    if werner_start != -1:
-        werner_text = round_content[werner_start:].split('\n', 1)[1].strip()
-        # Remove trailing separators
-        werner_text = werner_text.split('---')[0].strip()
-        experts['werner_vogels']['text'] = werner_text
+    for expert_id, data in experts.items():
+        data['text'] = transcript.turn(round_num, expert_id)
     
     return experts
 
 def generate_audio(text, voice_id, output_file):
     """Generate audio using Amazon Polly Neural voices"""
-    client = boto3.client('polly', region_name='us-east-1')
-    
     try:
-        response = client.synthesize_speech(
-            Text=text,
-            OutputFormat='mp3',
-            VoiceId=voice_id,
-            Engine='neural'
-        )
+        with AudioPipeline() as pipeline:
+            audio = pipeline.synthesize(AudioSegment(text, voice_id))
         
         with open(output_file, 'wb') as f:
-            f.write(response['AudioStream'].read())
+            f.write(audio)
         
         return True
     except Exception as e:
@@ -1,81 +1,32 @@
 #!/usr/bin/env python3
-import boto3
 import re
 
+from audio import AudioPipeline, AudioSegment, Transcript
+
 def parse_panel_file(filename):
     """Parse panel.txt and extract all responses by person and round"""
-    with open(filename, 'r') as f:
-        content = f.read()
+    transcript = Transcript.load(filename)
     
     rounds = {}
-    
-    for round_num in range(1, 5):
-        round_marker = f"ROUND {round_num}:"
-        round_start = content.find(round_marker)
-        if round_start == -1:
-            continue
-        
-        next_round = content.find(f"ROUND {round_num + 1}:", round_start + 1)
-        if next_round == -1:
-            next_round = content.find("DISCUSSION COMPLETE", round_start + 1)
-        if next_round == -1:
-            next_round = len(content)
-        
-        round_content = content[round_start:next_round]
+    for round_num in transcript.round_numbers():
         rounds[round_num] = {}
-        
-        # Jeff Barr
-        jeff_start = round_content.find("Jeff Barr:")
-        swami_start = round_content.find("Swami Sivasubramanian:")
-        if jeff_start != -1 and swami_start != -1:
-            text = round_content[jeff_start:swami_start]
-            text = text.replace("Jeff Barr:", "").strip()
-            text = re.sub(r'\*[^*]+\*', '', text).strip()
-            rounds[round_num]['jeff'] = text[:600]
-        
-        # Swami
-        werner_start = round_content.find("Werner Vogels:")
-        if swami_start != -1 and werner_start != -1:
-            text = round_content[swami_start:werner_start]
-            text = text.replace("Swami Sivasubramanian:", "").strip()
-            text = re.sub(r'\*[^*]+\*', '', text).strip()
-            rounds[round_num]['swami'] = text[:600]
-        
-        # Werner
-        if werner_start != -1:
-            text = round_content[werner_start:]
-            next_section = text.find("────────────────", 100)
-            if next_section != -1:
-                text = text[:next_section]
-            text = text.replace("Werner Vogels:", "").strip()
-            text = re.sub(r'\*[^*]+\*', '', text).strip()
-            rounds[round_num]['werner'] = text[:600]
+        for turn in transcript.turns(round_num):
+            # Drop stage directions such as *Adjusts glasses*
+            rounds[round_num][turn.speaker] = re.sub(r'\*[^*]+\*', '', transcript.text(turn)).strip()
     
     return rounds
 
-def generate_audio(text, voice_id, output_file, language_code='en-US'):
-    """Generate audio with fast speech rate"""
-    client = boto3.client('polly', region_name='us-east-1')
-    
-    ssml = f'<speak><prosody rate="fast">{text}</prosody></speak>'
-    
-    response = client.synthesize_speech(
-        Text=ssml,
-        OutputFormat='mp3',
-        VoiceId=voice_id,
-        Engine='neural',
-        TextType='ssml',
-        LanguageCode=language_code
-    )
-    
-    with open(output_file, 'wb') as f:
-        f.write(response['AudioStream'].read())
+def write_panel_files(pipeline, segments, filenames):
+    """Synthesize the segments concurrently and write each one to its own file"""
+    for filename, audio in zip(filenames, pipeline.synthesize_all(segments), strict=True):
+        with open(filename, 'wb') as f:
+            f.write(audio)
 
 if __name__ == "__main__":
     voices = {
-        'jeff': {'voice': 'Matthew', 'lang': 'en-US', 'desc': 'US English Male'},
-        'swami': {'voice': 'Stephen', 'lang': 'en-US', 'desc': 'US English Male (warm tone)'},
-        'werner': {'voice': 'Arthur', 'lang': 'en-GB', 'desc': 'British English Male (European)'}
+        'jeff_barr': {'name': 'jeff', 'voice': 'Matthew', 'lang': 'en-US', 'desc': 'US English Male'},
+        'swami': {'name': 'swami', 'voice': 'Stephen', 'lang': 'en-US', 'desc': 'US English Male (warm tone)'},
+        'werner_vogels': {'name': 'werner', 'voice': 'Arthur', 'lang': 'en-GB', 'desc': 'British English Male (European)'}
     }
     
     round_names = {
@@ -91,6 +42,7 @@ if __name__ == "__main__":
     print("\nGenerating 12 audio files - All Male Voices\n" + "=" * 60)
     
     files_generated = []
+    segments = []
     
     for round_num in range(1, 5):
         print(f"\nRound {round_num}: {round_names[round_num]}")
@@ -98,12 +50,16 @@ if __name__ == "__main__":
         for person, voice_config in voices.items():
             if round_num in rounds and person in rounds[round_num]:
                 text = rounds[round_num][person]
-                filename = f"r{round_num}_{person}.mp3"
+                filename = f"r{round_num}_{voice_config['name']}.mp3"
                 
-                print(f"  {person.title()}: {voice_config['voice']} ({voice_config['desc']}) → {filename}")
-                generate_audio(text, voice_config['voice'], filename, voice_config['lang'])
+                print(f"  {voice_config['name'].title()}: {voice_config['voice']} ({voice_config['desc']}) → {filename}")
+                segments.append(AudioSegment(text, voice_config['voice'], language_code=voice_config['lang'], rate="fast"))
                 files_generated.append(filename)
     
+    # Synthesize all segments concurrently
+    with AudioPipeline() as pipeline:
+        write_panel_files(pipeline, segments, files_generated)
+    
     print("\n" + "=" * 60)
     print(f"✓ Generated {len(files_generated)} audio files")
     print("\nVoice assignments (All Male):")
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-import boto3
+from audio import AudioPipeline, AudioSegment, Transcript
 
 def condense_text(text, max_chars=250):
     """Condense text to ~30 seconds"""
@@ -18,32 +18,16 @@ def condense_text(text, max_chars=250):
 
 def extract_and_condense(md_file):
     """Extract and condense all three experts"""
-    with open(md_file, 'r') as f:
-        content = f.read()
-    
-    # Jeff Barr
-    jeff_start = content.find("### Jeff Barr (The Simplifier)")
-    swami_start = content.find("### Swami (The Shipper)")
-    jeff_text = content[jeff_start:swami_start].split('\n', 1)[1].strip()
-    
-    # Swami
-    werner_start = content.find("### Werner Vogels (The Scale Architect)")
-    swami_text = content[swami_start:werner_start].split('\n', 1)[1].strip()
-    
-    # Werner
-    werner_end = content.find("---", werner_start + 100)
-    werner_text = content[werner_start:werner_end].split('\n', 1)[1].strip()
+    transcript = Transcript.load(md_file)
     
     return [
-        ('Jeff Barr', condense_text(jeff_text)),
-        ('Swami', condense_text(swami_text)),
-        ('Werner Vogels', condense_text(werner_text))
+        ('Jeff Barr', condense_text(transcript.turn(1, 'jeff_barr'))),
+        ('Swami', condense_text(transcript.turn(1, 'swami'))),
+        ('Werner Vogels', condense_text(transcript.turn(1, 'werner_vogels')))
     ]
 
 def generate_combined_audio(experts, output_file):
     """Generate single audio with all speakers using SSML"""
-    client = boto3.client('polly', region_name='us-east-1')
-    
     # Build SSML with voice changes
     ssml = '<speak>'
     
@@ -57,16 +41,11 @@ def generate_combined_audio(experts, output_file):
     
     ssml += '</speak>'
     
-    response = client.synthesize_speech(
-        Text=ssml,
-        OutputFormat='mp3',
-        VoiceId='Matthew',
-        Engine='neural',
-        TextType='ssml'
-    )
+    with AudioPipeline() as pipeline:
+        audio = pipeline.synthesize(AudioSegment(ssml, 'Matthew', text_type='ssml'))
     
     with open(output_file, 'wb') as f:
-        f.write(response['AudioStream'].read())
+        f.write(audio)
 
 if __name__ == "__main__":
     print("Creating 2-minute debate with all speakers...\n")
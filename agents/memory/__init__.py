@@ -1,5 +1,16 @@
 """Memory management module for AgentCore Memory operations."""
 
 from .session_manager import MemoryManager
+from .context_budget import ContextBudgeter, estimate_tokens
+from .resilience import CircuitBreaker, CircuitOpenError, ResilientCaller, RetryBudget, is_retryable
 
-__all__ = ['MemoryManager']
+__all__ = [
+    'MemoryManager',
+    'ContextBudgeter',
+    'estimate_tokens',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'ResilientCaller',
+    'RetryBudget',
+    'is_retryable',
+]
@@ -0,0 +1,179 @@
+import logging
+import math
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional, Sequence
+
+from tokens import CHARS_PER_TOKEN, estimate_tokens
+
+from .transcript import SEPARATOR, Transcript
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+# Summarizer signature: (previous rolling summary, turns of the round, 1-based round number) -> new summary
+Summarizer = Callable[[str, Sequence[str], int], str]
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def extractive_summary(previous: str, turns: Sequence[str], round_num: int, max_chars_per_turn: int = 240) -> str:
+    """
+    Extend a rolling summary with the lead sentences of each turn of a round.
+
+    A cheap, deterministic default for ContextBudgeter; pass a model-backed
+    summarizer with the same signature for abstractive summaries.
+
+    Args:
+        previous: Rolling summary of the earlier rounds ("" for the first round)
+        turns: The responses of the round being summarized, in speaking order
+        round_num: 1-based number of the round being summarized
+        max_chars_per_turn: Characters kept from each response
+
+    Returns:
+        The rolling summary including this round
+    """
+    leads = []
+    for turn in turns:
+        lead = ""
+        for sentence in _SENTENCE_END.split(" ".join(turn.split())):
+            if lead and len(lead) + len(sentence) + 1 > max_chars_per_turn:
+                break
+            lead = f"{lead} {sentence}".strip()
+        if len(lead) > max_chars_per_turn:
+            lead = lead[:max_chars_per_turn - 3].rstrip() + "..."
+        if lead:
+            leads.append(f"- {lead}")
+    line = f"Round {round_num}:\n" + "\n".join(leads)
+    return f"{previous}\n{line}" if previous else line
+
+
+class _SessionSummaries:
+    """Rolling summaries of one session; summaries[i] covers rounds 1..i+1."""
+
+    __slots__ = ("lock", "summaries")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.summaries: List[str] = []
+
+
+class ContextBudgeter:
+    """
+    Keeps debate context within a token budget.
+
+    A transcript that fits the budget is returned verbatim. Otherwise the most
+    recent `recent_turns` turns stay verbatim, and every complete round before
+    them is replaced by a rolling summary. Each rolling summary is computed
+    once per round from the previous summary and that round's turns, then
+    cached and reused by every later prompt in the session. Rounds are
+    identified by position: every `turns_per_round` consecutive turns form
+    one round, matching the fixed speaking order of the debate.
+
+    Summaries are kept for the `max_sessions` most recently used sessions.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 6000,
+        full_max_tokens: int = 24000,
+        recent_turns: int = 6,
+        turns_per_round: int = 3,
+        summarizer: Optional[Summarizer] = None,
+        max_sessions: int = 1000
+    ):
+        """
+        Initialize the budgeter.
+
+        Args:
+            max_tokens: Token budget for an expert's turn context
+            full_max_tokens: Token budget for the complete transcript used by synthesis
+            recent_turns: Turns always kept verbatim at the end of the context
+            turns_per_round: Turns in each round (the number of experts)
+            summarizer: Extends a rolling summary with one round; defaults to
+                extractive_summary
+            max_sessions: Sessions whose summaries are cached
+        """
+        self.max_tokens = max_tokens
+        self.full_max_tokens = full_max_tokens
+        self.recent_turns = recent_turns
+        self.turns_per_round = turns_per_round
+        self.summarizer = summarizer or extractive_summary
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, _SessionSummaries]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, session_id: str, transcript: Transcript, max_tokens: Optional[int] = None) -> str:
+        """
+        Render a session transcript within a token budget.
+
+        Args:
+            session_id: The debate session ID (scopes the summary cache)
+            transcript: The session transcript
+            max_tokens: Budget to apply; defaults to max_tokens
+
+        Returns:
+            The verbatim transcript if it fits, otherwise a rolling summary of
+            the older rounds followed by the recent turns
+        """
+        budget = self.max_tokens if max_tokens is None else max_tokens
+        # Sized without joining the transcript, which only happens if it is returned verbatim
+        original_tokens = math.ceil(transcript.size / CHARS_PER_TOKEN)
+        if original_tokens <= budget:
+            return transcript.text()
+
+        parts = transcript.segments()
+        summarized_rounds = max(0, len(parts) - self.recent_turns) // self.turns_per_round
+        if summarized_rounds == 0:
+            logger.warning(
+                f"Context for session={session_id} is ~{original_tokens} tokens "
+                f"(budget {budget}) but has no complete round to summarize"
+            )
+            return transcript.text()
+
+        summary = self._rolling_summary(session_id, parts, summarized_rounds)
+        recent = parts[summarized_rounds * self.turns_per_round:]
+        context = SEPARATOR.join(
+            [f"Summary of rounds 1-{summarized_rounds}:\n{summary}", *recent]
+        )
+
+        tokens = estimate_tokens(context)
+        if tokens > budget:
+            logger.warning(
+                f"Budgeted context for session={session_id} is ~{tokens} tokens, over budget {budget}"
+            )
+        logger.debug(
+            f"Summarized {summarized_rounds} rounds for session={session_id}: "
+            f"~{original_tokens} -> ~{tokens} tokens"
+        )
+        return context
+
+    def render_full(self, session_id: str, transcript: Transcript) -> str:
+        """Render a session transcript within the synthesis budget (full_max_tokens)."""
+        return self.render(session_id, transcript, self.full_max_tokens)
+
+    def forget(self, session_id: str) -> None:
+        """Drop the cached summaries of a session."""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def _rolling_summary(self, session_id: str, parts: Sequence[str], rounds: int) -> str:
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                entry = self._sessions[session_id] = _SessionSummaries()
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+        # Per-session lock: experts speaking concurrently compute each round once
+        with entry.lock:
+            while len(entry.summaries) < rounds:
+                round_index = len(entry.summaries)
+                previous = entry.summaries[-1] if entry.summaries else ""
+                start = round_index * self.turns_per_round
+                turns = parts[start:start + self.turns_per_round]
+                entry.summaries.append(self.summarizer(previous, turns, round_index + 1))
+                logger.info(f"Computed rolling summary through round {round_index + 1} for session={session_id}")
+            return entry.summaries[rounds - 1]
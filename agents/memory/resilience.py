@@ -0,0 +1,311 @@
+import asyncio
+import inspect
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from botocore.exceptions import (
+    ClientError,
+    ConnectionError as BotocoreConnectionError,
+    HTTPClientError,
+    ParamValidationError
+)
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+# Error codes of requests that may succeed when sent again
+RETRYABLE_ERROR_CODES = {
+    "ThrottlingException",
+    "Throttling",
+    "TooManyRequestsException",
+    "RequestLimitExceeded",
+    "ServiceUnavailableException",
+    "ServiceUnavailable",
+    "InternalServerException",
+    "InternalFailure",
+    "RequestTimeout",
+    "RequestTimeoutException",
+}
+
+
+class CircuitOpenError(Exception):
+    """Raised without calling the service while its circuit breaker is open."""
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Classify an exception as transient (worth retrying) or permanent.
+
+    AWS errors are retryable when their code is a throttling or server-side
+    error (or the HTTP status is 429/5xx); connection errors are retryable;
+    invalid parameters and programming errors (TypeError, ValueError, ...)
+    are not. Other exceptions are treated as transient.
+    """
+    if isinstance(error, CircuitOpenError):
+        return False
+    if isinstance(error, ClientError):
+        code = error.response.get('Error', {}).get('Code')
+        status = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode') or 0
+        return code in RETRYABLE_ERROR_CODES or status == 429 or status >= 500
+    if isinstance(error, (BotocoreConnectionError, HTTPClientError)):
+        return True
+    if isinstance(error, (ParamValidationError, TypeError, ValueError, KeyError, AttributeError)):
+        return False
+    return True
+
+
+class RetryBudget:
+    """
+    Process-wide cap on retries, so an outage does not multiply load.
+
+    Every successful call deposits `ratio` tokens and every retry spends one,
+    so retries stay within about `ratio` of successful traffic; the budget
+    also refills at `min_per_second` so a quiet process can still retry.
+    Tokens are capped at `max_tokens`.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1.0, max_tokens: float = 10.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.exhausted = 0
+
+    def record_success(self) -> None:
+        """Deposit the share of a successful call."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget; False when it is exhausted."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            self.exhausted += 1
+            return False
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+
+class CircuitBreaker:
+    """
+    Fails fast while a dependency is down.
+
+    After `failure_threshold` consecutive transient failures the circuit
+    opens and calls are rejected without reaching the service. After
+    `reset_timeout` seconds one trial call is let through (half-open): its
+    success closes the circuit, its failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str = "service", failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless a call may go through now."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            if time.monotonic() - self._opened_at >= self.reset_timeout and not self._trial_in_flight:
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = True
+                logger.info(f"Circuit for {self.name} half-open; sending a trial call")
+                return
+            raise CircuitOpenError(f"Circuit for {self.name} is open")
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"Circuit for {self.name} closed")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(
+                        f"Circuit for {self.name} opened after {self._failures} consecutive failures"
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+    def record_ignored(self) -> None:
+        """End a call whose outcome says nothing about the service's health."""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+def _on_event_loop_thread() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class ResilientCaller:
+    """
+    Calls a remote service with retries, a retry budget and a circuit breaker.
+
+    Transient failures (see `classifier`) are retried up to `max_attempts`
+    times with full-jitter exponential backoff: a random delay between 0 and
+    min(max_delay, base_delay * 2**attempt), so concurrent callers do not
+    retry in lockstep. Retries also need a token from the shared RetryBudget.
+    Permanent failures are raised immediately.
+
+    `call` sleeps with time.sleep and is meant for worker threads (the
+    orchestrator runs every memory call through run_blocking). On a thread
+    running an event loop it makes a single attempt rather than blocking the
+    loop, and logs a warning when a transient failure goes unretried because
+    of that. Async callers use `call_async`, which sleeps with asyncio.sleep.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 10.0,
+        budget: Optional[RetryBudget] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        classifier: Callable[[BaseException], bool] = is_retryable
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.breaker = breaker
+        self.classifier = classifier
+
+    def backoff(self, attempt: int) -> float:
+        """Return the full-jitter delay before retry number `attempt` (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Call a blocking function with retries.
+
+        On an event loop thread only one attempt is made: retrying would block
+        the loop for the backoff delays. Run the call on a worker thread, or
+        use call_async, to get retries there.
+        """
+        on_event_loop = _on_event_loop_thread()
+        max_attempts = 1 if on_event_loop else self.max_attempts
+        attempt = 0
+        while True:
+            try:
+                result = self._attempt(func, *args, **kwargs)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, max_attempts)
+                if delay is None:
+                    if on_event_loop and self.max_attempts > 1 and self.classifier(e):
+                        logger.warning(
+                            f"Not retrying on the event loop thread; call from a worker thread "
+                            f"or use call_async to retry: {e}"
+                        )
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+            return result
+
+    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
+        """Call a coroutine function (or a plain function) with retries, sleeping without blocking."""
+        attempt = 0
+        while True:
+            try:
+                if self.breaker is not None:
+                    self.breaker.before_call()
+                try:
+                    result = func(*args, **kwargs)
+                    if inspect.isawaitable(result):
+                        result = await result
+                except Exception as e:
+                    self._record_failure(e)
+                    raise
+                self._record_success()
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, self.max_attempts)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            return result
+
+    def _attempt(self, func: Callable, *args, **kwargs) -> Any:
+        if self.breaker is not None:
+            self.breaker.before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self._record_failure(e)
+            raise
+        self._record_success()
+        return result
+
+    def _record_success(self) -> None:
+        if self.breaker is not None:
+            self.breaker.record_success()
+        if self.budget is not None:
+            self.budget.record_success()
+
+    def _record_failure(self, error: Exception) -> None:
+        if self.breaker is None:
+            return
+        if self.classifier(error):
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_ignored()
+
+    def _retry_delay(self, error: Exception, attempt: int, max_attempts: int) -> Optional[float]:
+        """Return the delay before retrying, or None if the error must be raised."""
+        if attempt + 1 >= max_attempts or not self.classifier(error):
+            return None
+        if self.budget is not None and not self.budget.try_spend():
+            logger.warning(f"Retry budget exhausted; not retrying: {error}")
+            return None
+        delay = self.backoff(attempt)
+        logger.info(f"Retrying after {delay:.2f}s (attempt {attempt + 2}/{max_attempts}): {error}")
+        return delay
+
+
+# Shared by every MemoryManager in the process
+memory_retry_budget = RetryBudget()
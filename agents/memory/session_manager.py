@@ -1,10 +1,18 @@
+import atexit
 import boto3
 import json
 import logging
+import threading
+from collections import Counter
 from datetime import datetime
 import hashlib
-import time
-from typing import Optional, Callable, Any
+from typing import Optional, List
+
+from .context_budget import ContextBudgeter
+from .resilience import CircuitBreaker, CircuitOpenError, ResilientCaller, memory_retry_budget
+from .transcript import Transcript
+from .transcript_cache import TranscriptCache
+from .write_behind import WriteBehindBuffer, PendingEvent
 
 # Get logger instance for this module
 logger = logging.getLogger(__name__)
@@ -14,61 +22,112 @@ class MemoryManager:
     """
     Manages AgentCore Memory operations for debate sessions.
     
-    Provides session creation, response storage, and context retrieval
-    with automatic retry logic for resilience against transient failures.
+    Provides session creation, response storage, and context retrieval.
+    Remote calls go through a ResilientCaller: transient errors are retried
+    with jittered backoff within a process-wide retry budget, and a circuit
+    breaker fails fast while AgentCore Memory is down. With the circuit open,
+    reads of uncached sessions degrade to the local transcript and failed
+    writes are still applied to it, so a debate can continue. The methods
+    block; async callers run them on a worker thread, since on an event loop
+    thread the ResilientCaller makes a single attempt without retries.
+    
+    With write_behind enabled, store_response only queues the event and a
+    WriteBehindBuffer persists it in the background; call flush() before
+    reading the complete remote history (e.g. at synthesis time).
+    
+    Context reads are served from an in-process TranscriptCache that
+    create_session and store_response keep up to date; retrieve_memory is only
+    called for sessions that are not cached (cold start or process restart).
+    
+    With a context_budget, long transcripts are returned as rolling summaries
+    of older rounds plus the most recent turns instead of verbatim.
     """
     
-    def __init__(self, memory_id: Optional[str] = None, region: str = 'us-east-1'):
+    def __init__(
+        self,
+        memory_id: Optional[str] = None,
+        region: str = 'us-east-1',
+        write_behind: bool = False,
+        cache_sessions: int = 1000,
+        cache_ttl: float = 3600.0,
+        context_budget: Optional[ContextBudgeter] = None,
+        resilience: Optional[ResilientCaller] = None
+    ):
         """
         Initialize the MemoryManager.
         
         Args:
             memory_id: The AgentCore Memory resource ID. Defaults to 'debate-memory'.
             region: AWS region for the bedrock-agent-runtime client. Defaults to 'us-east-1'.
+            write_behind: Persist responses in the background instead of on the
+                caller's thread. Defaults to False.
+            cache_sessions: Maximum number of session transcripts cached in
+                process; 0 disables the cache. Defaults to 1000.
+            cache_ttl: Seconds an unused session transcript stays cached.
+                Defaults to 3600.
+            context_budget: Token budgeter applied to get_context and
+                get_full_context. Defaults to None (verbatim transcripts).
+            resilience: Retry and circuit-breaking policy for remote calls.
+                Defaults to max_retries attempts with full-jitter backoff,
+                the shared memory_retry_budget and a per-manager circuit breaker.
         """
-        self.client = boto3.client('bedrock-agent-runtime', region_name=region)
+        # The boto3 client is created on first use, keeping it off the import path
+        self._client = None
+        self._client_lock = threading.Lock()
         self.memory_id = memory_id or 'debate-memory'
         self.region = region
         self.max_retries = 3
         self.base_delay = 1.0
         self.max_delay = 10.0
-        logger.info(f"MemoryManager initialized with memory_id={self.memory_id}, region={region}")
+        self.resilience = resilience or ResilientCaller(
+            max_attempts=self.max_retries,
+            base_delay=self.base_delay,
+            max_delay=self.max_delay,
+            budget=memory_retry_budget,
+            breaker=CircuitBreaker(name=f"memory:{self.memory_id}")
+        )
+        self.transcript_cache: Optional[TranscriptCache] = None
+        if cache_sessions > 0:
+            self.transcript_cache = TranscriptCache(max_sessions=cache_sessions, ttl_seconds=cache_ttl)
+        self.context_budget = context_budget
+        self.write_buffer: Optional[WriteBehindBuffer] = None
+        if write_behind:
+            self.write_buffer = WriteBehindBuffer(self._write_events)
+            # Flush queued events before the interpreter exits
+            atexit.register(self.close)
+        logger.info(
+            f"MemoryManager initialized with memory_id={self.memory_id}, region={region}, "
+            f"write_behind={write_behind}"
+        )
+    
+    @property
+    def client(self):
+        """The bedrock-agent-runtime client, created on first use."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = boto3.client('bedrock-agent-runtime', region_name=self.region)
+        return self._client
     
-    def _retry_with_backoff(self, func: Callable, *args, **kwargs) -> Any:
+    @staticmethod
+    def new_session_id(problem: str) -> str:
         """
-        Execute a function with exponential backoff retry logic.
-        
-        Args:
-            func: The function to execute
-            *args: Positional arguments for the function
-            **kwargs: Keyword arguments for the function
+        Generate a session ID without creating any session state.
         
         Returns:
-            The result of the function call
-        
-        Raises:
-            Exception: If all retry attempts fail
+            Session ID in format: debate_{8-char-hash}_{ISO8601-timestamp},
+            at least 33 characters long
         """
-        last_exception = None
-        
-        for attempt in range(self.max_retries):
-            try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                last_exception = e
-                if attempt == self.max_retries - 1:
-                    raise
-                
-                # Calculate exponential backoff delay
-                delay = min(
-                    self.base_delay * (2 ** attempt),
-                    self.max_delay
-                )
-                time.sleep(delay)
+        timestamp = datetime.utcnow().isoformat()
+        problem_hash = hashlib.md5(problem.encode()).hexdigest()[:8]
+        session_id = f"debate_{problem_hash}_{timestamp}"
         
-        # This should never be reached, but just in case
-        if last_exception:
-            raise last_exception
+        # Ensure minimum 33 character length for AgentCore Memory
+        if len(session_id) < 33:
+            # Pad with additional hash characters if needed
+            padding = hashlib.md5(f"{problem}{timestamp}".encode()).hexdigest()
+            session_id = f"{session_id}_{padding}"[:33]
+        return session_id
     
     def create_session(self, problem: str, actor_id: str) -> str:
         """
@@ -89,18 +148,14 @@ class MemoryManager:
         Raises:
             Exception: If session ID generation fails
         """
-        timestamp = datetime.utcnow().isoformat()
-        problem_hash = hashlib.md5(problem.encode()).hexdigest()[:8]
-        session_id = f"debate_{problem_hash}_{timestamp}"
-        
-        # Ensure minimum 33 character length for AgentCore Memory
-        if len(session_id) < 33:
-            # Pad with additional hash characters if needed
-            padding = hashlib.md5(f"{problem}{timestamp}".encode()).hexdigest()
-            session_id = f"{session_id}_{padding}"[:33]
+        session_id = self.new_session_id(problem)
         
         logger.info(f"Created session ID: {session_id} (length: {len(session_id)}) for actor: {actor_id}")
         
+        # A new session has no history, so its reads never need to go remote
+        if self.transcript_cache is not None:
+            self.transcript_cache.start(session_id)
+        
         # Sessions are implicit in AgentCore Memory - no API call needed
         return session_id
     
@@ -114,6 +169,9 @@ class MemoryManager:
         """
         Store an expert's response to memory using create_event API with retry logic.
         
+        With write-behind enabled the response is queued and this returns
+        immediately; persistence errors then surface from flush().
+        
         Args:
             session_id: The debate session ID
             actor_id: Expert identifier (jeff_barr, swami, werner_vogels)
@@ -121,27 +179,22 @@ class MemoryManager:
             content: The expert's response text
         
         Raises:
-            Exception: If storage fails after all retries
+            Exception: If storage fails after all retries or the circuit is
+                open; the response is still added to the local transcript
         """
+        if self.write_buffer is not None:
+            self.write_buffer.enqueue(session_id, actor_id, round_num, content)
+            self._cache_append(session_id, content)
+            logger.debug(f"Queued response for actor={actor_id}, session={session_id}, round={round_num}")
+            return
+        
         def _store():
             try:
-                # Format messages as required by create_event API
-                messages = [
-                    {
-                        "role": "USER",
-                        "text": f"Round {round_num} prompt"
-                    },
-                    {
-                        "role": "ASSISTANT",
-                        "text": content
-                    }
-                ]
-                
                 response = self.client.create_event(
                     memoryId=self.memory_id,
                     actorId=actor_id,
                     sessionId=session_id,
-                    messages=messages
+                    messages=self._format_messages(round_num, content)
                 )
                 
                 logger.info(f"Stored response for actor={actor_id}, session={session_id}, round={round_num}")
@@ -151,22 +204,176 @@ class MemoryManager:
                 logger.error(f"Error storing response for actor={actor_id}, session={session_id}: {e}")
                 raise
         
-        self._retry_with_backoff(_store)
+        try:
+            self.resilience.call(_store)
+        finally:
+            # Applied locally even when the write failed, so the debate stays consistent
+            self._cache_append(session_id, content)
+    
+    @staticmethod
+    def _format_messages(round_num: int, content: str) -> List[dict]:
+        """Format a response as the message pair required by the create_event API."""
+        return [
+            {
+                "role": "USER",
+                "text": f"Round {round_num} prompt"
+            },
+            {
+                "role": "ASSISTANT",
+                "text": content
+            }
+        ]
+    
+    def _write_events(self, session_id: str, actor_id: str, events: List[PendingEvent]) -> None:
+        """
+        Persist a batch of queued responses for one actor in a single create_event call.
+        
+        Used as the WriteBehindBuffer writer; raises if storage fails after all retries.
+        """
+        messages = []
+        for event in events:
+            messages.extend(self._format_messages(event.round_num, event.content))
+        
+        def _store_batch():
+            try:
+                response = self.client.create_event(
+                    memoryId=self.memory_id,
+                    actorId=actor_id,
+                    sessionId=session_id,
+                    messages=messages
+                )
+                logger.info(
+                    f"Stored {len(events)} queued responses for actor={actor_id}, session={session_id}"
+                )
+                return response
+            except Exception as e:
+                logger.error(f"Error storing queued responses for actor={actor_id}, session={session_id}: {e}")
+                raise
+        
+        self.resilience.call(_store_batch)
+    
+    def flush(self, session_id: Optional[str] = None, timeout: Optional[float] = None) -> None:
+        """
+        Wait until queued responses are persisted (no-op without write-behind).
+        
+        Args:
+            session_id: Session to flush, or None for every session
+            timeout: Maximum seconds to wait (None waits indefinitely)
+        
+        Raises:
+            RuntimeError: If queued responses could not be persisted
+        """
+        if self.write_buffer is not None:
+            self.write_buffer.flush(session_id, timeout)
+    
+    def close(self) -> None:
+        """Flush queued responses and stop background writers (shutdown hook)."""
+        if self.write_buffer is not None:
+            self.write_buffer.close()
+    
+    def _pending_events(self, session_id: str) -> List[PendingEvent]:
+        """Responses of a session not yet persisted by write-behind (empty without it)."""
+        if self.write_buffer is None:
+            return []
+        return self.write_buffer.pending(session_id)
+    
+    def _with_pending(self, session_id: str, parts: List[str], before: List[PendingEvent]) -> List[str]:
+        """
+        Append responses still queued for write-behind to remotely retrieved parts.
+        
+        Gives callers read-your-writes without waiting for a flush. Events are
+        told apart by sequence number, not content: an event still queued
+        after the read was never sent, so it is always appended. Only an event
+        whose write was in flight or completed during the read (it is in
+        `before`, taken before the read, or still in flight) may already be in
+        `parts`; it is skipped if a remote part with the same content is left
+        unmatched. Each remote part matches at most one event, so identical
+        responses such as repeated failure placeholders are all kept.
+        
+        Args:
+            session_id: The debate session ID
+            parts: Responses returned by the remote read
+            before: The session's unpersisted events taken before the remote read
+        """
+        if self.write_buffer is None:
+            return parts
+        events = {event.seq: event for event in before}
+        events.update((event.seq, event) for event in self.write_buffer.pending(session_id))
+        queued = {event.seq for event in self.write_buffer.queued(session_id)}
+        unmatched = Counter(parts)
+        merged = list(parts)
+        for seq in sorted(events):
+            event = events[seq]
+            if seq not in queued and unmatched[event.content] > 0:
+                unmatched[event.content] -= 1
+                continue
+            merged.append(event.content)
+        return merged
+    
+    def _local_transcript(self, session_id: str) -> Transcript:
+        """Responses known to this process for an uncached session (not cached, as it may be partial)."""
+        return Transcript(event.content for event in self._pending_events(session_id))
+    
+    def _cache_append(self, session_id: str, content: str) -> None:
+        """Keep a cached transcript in step with a stored response."""
+        if self.transcript_cache is not None:
+            self.transcript_cache.append(session_id, content)
+    
+    def _cached_transcript(self, session_id: str) -> Optional[Transcript]:
+        """Return the cached transcript of a session, or None if it must be read remotely."""
+        if self.transcript_cache is None:
+            return None
+        transcript = self.transcript_cache.get(session_id)
+        if transcript is not None:
+            logger.debug(f"Served context for session={session_id} from transcript cache")
+        return transcript
+    
+    def _render(self, session_id: str, transcript: Transcript, full: bool = False) -> str:
+        """Render a transcript as context, applying the context budget if configured."""
+        if self.context_budget is None:
+            # Rendered incrementally as responses are stored, not re-joined here
+            return transcript.text()
+        if full:
+            return self.context_budget.render_full(session_id, transcript)
+        return self.context_budget.render(session_id, transcript)
+    
+    def _cache_remote(self, session_id: str, parts: List[str], returned: int, max_results: int) -> Transcript:
+        """
+        Build a Transcript from a cold remote read and warm the cache with it.
+        
+        A read that hit max_results may be truncated, so it is not cached and
+        the next read goes remote again.
+        """
+        if self.transcript_cache is not None and returned < max_results:
+            self.transcript_cache.load(session_id, parts)
+            transcript = self.transcript_cache.get(session_id)
+            if transcript is not None:
+                return transcript
+        return Transcript(parts)
     
     def get_context(self, session_id: str, actor_id: str) -> str:
         """
         Retrieve all previous responses for context using retrieve_memory API with retry logic.
         
+        Served from the transcript cache when the session is cached; the remote
+        read only happens on a cold start and then warms the cache.
+        
         Args:
             session_id: The debate session ID
             actor_id: The actor identifier for filtering memories
         
         Returns:
             Formatted string with all previous responses in chronological order
+            (older rounds summarized when over the context budget)
         
         Raises:
-            Exception: If retrieval fails after all retries
+            Exception: If retrieval fails after all retries (not while the
+                circuit is open: the local transcript is returned instead)
         """
+        transcript = self._cached_transcript(session_id)
+        if transcript is not None:
+            return self._render(session_id, transcript)
+        
         def _get():
             try:
                 response = self.client.retrieve_memory(
@@ -183,7 +390,12 @@ class MemoryManager:
                 logger.error(f"Error retrieving context for actor={actor_id}, session={session_id}: {e}")
                 raise
         
-        response = self._retry_with_backoff(_get)
+        before = self._pending_events(session_id)
+        try:
+            response = self.resilience.call(_get)
+        except CircuitOpenError:
+            logger.warning(f"Memory unavailable; serving local transcript for session={session_id}")
+            return self._render(session_id, self._local_transcript(session_id))
         
         # Extract text from the content structure
         memories = response.get('memories', [])
@@ -204,7 +416,9 @@ class MemoryManager:
                 logger.warning(f"Error parsing memory content: {e}")
                 continue
         
-        context = "\n\n".join(context_parts)
+        context_parts = self._with_pending(session_id, context_parts, before)
+        transcript = self._cache_remote(session_id, context_parts, len(memories), 50)
+        context = self._render(session_id, transcript)
         return context
     
     def get_full_context(self, session_id: str, actor_id: str) -> str:
@@ -212,18 +426,28 @@ class MemoryManager:
         Retrieve complete debate history for synthesis using retrieve_memory API.
         
         This method retrieves all memories for the session to provide a complete
-        debate transcript for synthesis.
+        debate transcript for synthesis. Like get_context, it is served from the
+        transcript cache when the session is cached.
         
         Args:
             session_id: The debate session ID
             actor_id: The actor identifier for filtering memories
         
         Returns:
-            Complete formatted debate transcript
+            Complete formatted debate transcript (older rounds summarized when
+            over the synthesis budget)
         
         Raises:
-            Exception: If retrieval fails after all retries
+            Exception: If retrieval fails after all retries (not while the
+                circuit is open: the local transcript is returned instead)
         """
+        transcript = self._cached_transcript(session_id)
+        if transcript is None:
+            transcript = self._load_full_transcript(session_id, actor_id)
+        return self._render(session_id, transcript, full=True)
+    
+    def _load_full_transcript(self, session_id: str, actor_id: str) -> Transcript:
+        """Read the complete session history from AgentCore Memory (maxResults=100)."""
         def _get_all():
             try:
                 # Retrieve all memories for the session
@@ -241,7 +465,12 @@ class MemoryManager:
                 logger.error(f"Error retrieving full context for actor={actor_id}, session={session_id}: {e}")
                 raise
         
-        response = self._retry_with_backoff(_get_all)
+        before = self._pending_events(session_id)
+        try:
+            response = self.resilience.call(_get_all)
+        except CircuitOpenError:
+            logger.warning(f"Memory unavailable; serving local transcript for session={session_id}")
+            return self._local_transcript(session_id)
         
         # Extract and format complete debate transcript
         memories = response.get('memories', [])
@@ -262,5 +491,5 @@ class MemoryManager:
                 logger.warning(f"Error parsing memory content in full context: {e}")
                 continue
         
-        transcript = "\n\n".join(transcript_parts)
-        return transcript
+        transcript_parts = self._with_pending(session_id, transcript_parts, before)
+        return self._cache_remote(session_id, transcript_parts, len(memories), 100)
@@ -0,0 +1,130 @@
+"""Unit tests for ContextBudgeter and budgeted MemoryManager reads."""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from memory.context_budget import ContextBudgeter, extractive_summary
+from memory.session_manager import MemoryManager
+from memory.transcript import Transcript
+from tokens import estimate_tokens
+
+
+def make_turn(round_num, expert, words=100):
+    """Build a response of roughly `words` words whose lead sentence names its round and expert."""
+    return f"{expert} opens round {round_num}. " + " ".join(["detail"] * words)
+
+
+def make_transcript(rounds, experts=("Jeff", "Swami", "Werner"), words=100):
+    return Transcript([make_turn(r, e, words) for r in range(1, rounds + 1) for e in experts])
+
+
+class RecordingSummarizer:
+    """Summarizer that records each call and delegates to extractive_summary."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, previous, turns, round_num):
+        self.calls.append(round_num)
+        return extractive_summary(previous, turns, round_num)
+
+
+class TestContextBudgeter:
+    """Test suite for ContextBudgeter."""
+
+    def test_transcript_within_budget_is_verbatim(self):
+        """Test that a transcript under budget is returned unchanged."""
+        transcript = make_transcript(3)
+        budgeter = ContextBudgeter(max_tokens=100000)
+        assert budgeter.render("session-1", transcript) == transcript.text()
+
+    def test_older_rounds_are_summarized(self):
+        """Test that only complete rounds before the recent turns are summarized."""
+        transcript = make_transcript(6)
+        budgeter = ContextBudgeter(max_tokens=1500, recent_turns=4)
+
+        context = budgeter.render("session-1", transcript)
+
+        # 18 turns, 4 recent: rounds 1-4 summarized, the 6 turns of rounds 5-6 verbatim
+        assert context.startswith("Summary of rounds 1-4:\nRound 1:\n- Jeff opens round 1.")
+        assert context.endswith(transcript.text().split("\n\n", 12)[-1])
+        assert "Round 4:\n- Jeff opens round 4." in context
+        assert make_turn(4, "Werner") not in context
+        assert make_turn(5, "Jeff") in context
+        assert estimate_tokens(context) < estimate_tokens(transcript.text())
+
+    def test_summaries_computed_once_per_round(self):
+        """Test that rolling summaries are cached and extended one round at a time."""
+        summarizer = RecordingSummarizer()
+        budgeter = ContextBudgeter(max_tokens=1000, recent_turns=3, summarizer=summarizer)
+        transcript = make_transcript(3)
+
+        budgeter.render("session-1", transcript)
+        budgeter.render("session-1", transcript)
+        assert summarizer.calls == [1, 2]
+
+        for expert in ("Jeff", "Swami", "Werner"):
+            transcript.append(make_turn(4, expert))
+            budgeter.render("session-1", transcript)
+        assert summarizer.calls == [1, 2, 3]
+
+        # Summaries are scoped to their session
+        budgeter.render("session-2", make_transcript(2))
+        assert summarizer.calls == [1, 2, 3, 1]
+
+    def test_prompt_size_stays_bounded(self):
+        """Test that a 10-round debate stays near the budget instead of growing with every round."""
+        budgeter = ContextBudgeter(max_tokens=2000, recent_turns=6)
+        transcript = Transcript()
+        sizes = []
+        for round_num in range(1, 11):
+            for expert in ("Jeff", "Swami", "Werner"):
+                transcript.append(make_turn(round_num, expert, words=150))
+            sizes.append(estimate_tokens(budgeter.render("session-1", transcript)))
+
+        assert estimate_tokens(transcript.text()) > 5000
+        assert max(sizes) <= 2000, f"Budgeted sizes: {sizes}"
+
+    def test_full_budget_used_for_synthesis(self):
+        """Test that render_full applies the larger synthesis budget."""
+        transcript = make_transcript(4)
+        budgeter = ContextBudgeter(max_tokens=500, full_max_tokens=100000)
+        assert budgeter.render_full("session-1", transcript) == transcript.text()
+        assert budgeter.render("session-1", transcript) != transcript.text()
+
+
+class TestMemoryManagerContextBudget:
+    """Test suite for MemoryManager with a context budget."""
+
+    def test_get_context_applies_budget(self):
+        """Test that get_context and get_full_context use their own budgets."""
+        with patch('boto3.client') as mock_boto:
+            mock_boto.return_value = Mock()
+
+            manager = MemoryManager(context_budget=ContextBudgeter(max_tokens=800, full_max_tokens=100000))
+            session_id = manager.create_session("Test problem", "orchestrator")
+            for round_num in range(1, 5):
+                for expert in ("Jeff", "Swami", "Werner"):
+                    manager.store_response(session_id, expert.lower(), round_num, make_turn(round_num, expert))
+
+            context = manager.get_context(session_id, "jeff_barr")
+            assert context.startswith("Summary of rounds 1-2:")
+            assert manager.get_full_context(session_id, "orchestrator") == \
+                manager.transcript_cache.get(session_id).text()
+
+    def test_no_budget_is_verbatim(self):
+        """Test that MemoryManager without a budget returns the verbatim transcript."""
+        with patch('boto3.client') as mock_boto:
+            mock_boto.return_value = Mock()
+
+            manager = MemoryManager()
+            session_id = manager.create_session("Test problem", "orchestrator")
+            for round_num in range(1, 8):
+                manager.store_response(session_id, "jeff_barr", round_num, make_turn(round_num, "Jeff"))
+
+            assert manager.get_context(session_id, "swami") == \
+                manager.transcript_cache.get(session_id).text()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
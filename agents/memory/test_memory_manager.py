@@ -31,6 +31,9 @@ class TestMemoryManager:
         with patch('boto3.client') as mock_boto:
             manager = MemoryManager(region='us-west-2')
             assert manager.region == 'us-west-2'
+            # The client is created on first use, not in the constructor
+            mock_boto.assert_not_called()
+            assert manager.client is manager.client
             # Verify boto3 client was called with correct region
             mock_boto.assert_called_once_with('bedrock-agent-runtime', region_name='us-west-2')
     
@@ -0,0 +1,211 @@
+"""Unit tests for the memory resilience layer and MemoryManager degradation."""
+
+import asyncio
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError, ParamValidationError
+from unittest.mock import AsyncMock, Mock, patch
+
+from memory.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ResilientCaller,
+    RetryBudget,
+    is_retryable
+)
+from memory.session_manager import MemoryManager
+
+
+def client_error(code, status=400):
+    return ClientError({"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}}, "RetrieveMemory")
+
+
+class Flaky:
+    """Callable that raises the given errors in order, then returns "ok"."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+class TestClassifier:
+    """Test suite for is_retryable."""
+
+    def test_classification(self):
+        """Test throttling, server and connection errors retry; client and programming errors do not."""
+        assert is_retryable(client_error("ThrottlingException"))
+        assert is_retryable(client_error("SomethingNew", status=503))
+        assert is_retryable(EndpointConnectionError(endpoint_url="https://example.com"))
+        assert is_retryable(Exception("Transient error"))
+
+        assert not is_retryable(client_error("ValidationException"))
+        assert not is_retryable(client_error("AccessDeniedException", status=403))
+        assert not is_retryable(ParamValidationError(report="missing memoryId"))
+        assert not is_retryable(TypeError("bad argument"))
+        assert not is_retryable(CircuitOpenError("open"))
+
+
+class TestResilientCaller:
+    """Test suite for ResilientCaller."""
+
+    def test_full_jitter_backoff(self):
+        """Test delays are uniform between 0 and the capped exponential bound."""
+        caller = ResilientCaller(base_delay=1.0, max_delay=10.0)
+        with patch('memory.resilience.random.uniform', side_effect=lambda low, high: high) as uniform:
+            assert [caller.backoff(attempt) for attempt in range(6)] == [1, 2, 4, 8, 10, 10]
+            assert all(call.args[0] == 0 for call in uniform.call_args_list)
+
+    def test_retries_transient_errors_only(self):
+        """Test transient errors are retried and permanent ones raised at once."""
+        caller = ResilientCaller(max_attempts=3)
+        with patch('time.sleep') as sleep:
+            flaky = Flaky(client_error("ThrottlingException"), Exception("Transient error"))
+            assert caller.call(flaky) == "ok"
+            assert flaky.calls == 3
+            assert sleep.call_count == 2
+
+            permanent = Flaky(client_error("ValidationException"))
+            with pytest.raises(ClientError):
+                caller.call(permanent)
+            assert permanent.calls == 1
+
+            exhausted = Flaky(*[Exception("down")] * 5)
+            with pytest.raises(Exception, match="down"):
+                caller.call(exhausted)
+            assert exhausted.calls == 3
+
+    def test_retry_budget(self):
+        """Test retries stop once the shared budget is spent and resume as successes refill it."""
+        budget = RetryBudget(ratio=0.5, min_per_second=0, max_tokens=2)
+        caller = ResilientCaller(max_attempts=5, budget=budget)
+        with patch('time.sleep'):
+            failing = Flaky(*[Exception("down")] * 10)
+            with pytest.raises(Exception):
+                caller.call(failing)
+            assert failing.calls == 3, "Two retries from a budget of two tokens"
+            assert budget.exhausted == 1
+
+            # Two successes earn one retry
+            caller.call(Flaky())
+            caller.call(Flaky())
+            assert caller.call(Flaky(Exception("blip"))) == "ok"
+
+    def test_circuit_breaker(self):
+        """Test the circuit opens after consecutive failures, fails fast, then recovers via a trial call."""
+        breaker = CircuitBreaker(name="memory", failure_threshold=3, reset_timeout=30)
+        caller = ResilientCaller(max_attempts=1, breaker=breaker)
+        with patch('memory.resilience.time.monotonic', return_value=100.0) as clock:
+            for _ in range(3):
+                with pytest.raises(Exception):
+                    caller.call(Flaky(Exception("down")))
+            assert breaker.state == CircuitBreaker.OPEN
+
+            service = Flaky()
+            with pytest.raises(CircuitOpenError):
+                caller.call(service)
+            assert service.calls == 0, "An open circuit should not reach the service"
+
+            # After the reset timeout one trial call goes through
+            clock.return_value = 131.0
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            with pytest.raises(Exception):
+                caller.call(Flaky(Exception("still down")))
+            assert breaker.state == CircuitBreaker.OPEN
+
+            clock.return_value = 162.0
+            assert caller.call(service) == "ok"
+            assert breaker.state == CircuitBreaker.CLOSED
+
+            # Permanent errors do not count towards opening the circuit
+            for _ in range(5):
+                with pytest.raises(ClientError):
+                    caller.call(Flaky(client_error("ValidationException")))
+            assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_never_blocks_an_event_loop(self, caplog):
+        """Test call makes one attempt on an event loop thread, retries on its worker threads, and call_async sleeps asynchronously."""
+        caller = ResilientCaller(max_attempts=3, base_delay=0.001)
+
+        async def scenario():
+            blocking = Flaky(Exception("down"))
+            with patch('time.sleep') as sleep:
+                with pytest.raises(Exception):
+                    caller.call(blocking)
+                sleep.assert_not_called()
+            assert blocking.calls == 1
+            assert "Not retrying on the event loop thread" in caplog.text
+
+            # The same call offloaded to a worker thread, as the orchestrator does, is retried
+            offloaded = Flaky(Exception("down"), Exception("down"))
+            loop = asyncio.get_running_loop()
+            assert await loop.run_in_executor(None, caller.call, offloaded) == "ok"
+            assert offloaded.calls == 3
+
+            attempts = Flaky(Exception("down"))
+
+            async def flaky_remote():
+                attempts()
+                return "ok"
+
+            with patch('memory.resilience.asyncio.sleep', new_callable=AsyncMock) as sleep:
+                assert await caller.call_async(flaky_remote) == "ok"
+                assert sleep.await_count == 1
+            assert attempts.calls == 2
+
+        asyncio.run(scenario())
+
+
+class TestMemoryManagerDegradation:
+    """Test suite for MemoryManager behavior while AgentCore Memory is down."""
+
+    def test_open_circuit_serves_local_transcript(self):
+        """Test uncached reads return the local transcript without remote calls while the circuit is open."""
+        with patch('boto3.client') as mock_boto:
+            mock_client = Mock()
+            mock_boto.return_value = mock_client
+            mock_client.retrieve_memory.side_effect = client_error("ServiceUnavailableException", 503)
+
+            manager = MemoryManager(
+                write_behind=True,
+                resilience=ResilientCaller(max_attempts=1, breaker=CircuitBreaker(failure_threshold=1))
+            )
+            session_id = "debate_abc12345_2025-11-30T12:00:00123"
+            mock_client.create_event.side_effect = client_error("ServiceUnavailableException", 503)
+            manager.write_buffer._retry_interval = 60
+            manager.store_response(session_id, "jeff_barr", 1, "Jeff round 1")
+
+            # First read trips the breaker
+            with pytest.raises(ClientError):
+                manager.get_context(session_id, "swami")
+            calls = mock_client.retrieve_memory.call_count
+
+            assert manager.get_context(session_id, "swami") == "Jeff round 1"
+            assert manager.get_full_context(session_id, "orchestrator") == "Jeff round 1"
+            assert mock_client.retrieve_memory.call_count == calls
+            # Degraded reads are not cached as complete transcripts
+            assert manager.transcript_cache.get(session_id) is None
+
+    def test_failed_write_still_updates_local_transcript(self):
+        """Test a response that could not be stored is still part of the session's context."""
+        with patch('boto3.client') as mock_boto:
+            mock_client = Mock()
+            mock_boto.return_value = mock_client
+            mock_client.create_event.side_effect = client_error("ValidationException")
+
+            manager = MemoryManager()
+            session_id = manager.create_session("Test problem", "orchestrator")
+            with pytest.raises(ClientError):
+                manager.store_response(session_id, "jeff_barr", 1, "Jeff round 1")
+
+            assert manager.get_context(session_id, "swami") == "Jeff round 1"
+            assert mock_client.create_event.call_count == 1, "Permanent errors are not retried"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,179 @@
+"""Unit tests for TranscriptCache and MemoryManager cached reads."""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from memory.session_manager import MemoryManager
+from memory.transcript import Transcript
+from memory.transcript_cache import TranscriptCache
+
+
+class TestTranscript:
+    """Test suite for Transcript."""
+
+    def test_renders_incrementally(self):
+        """Test that text() matches a full join after every append."""
+        transcript = Transcript(["Jeff round 1"])
+        parts = ["Jeff round 1"]
+        for text in ["Swami round 1\n\nwith a paragraph", "Werner round 1"]:
+            transcript.append(text)
+            parts.append(text)
+            assert transcript.text() == "\n\n".join(parts)
+        assert str(transcript) == transcript.text()
+        assert Transcript().text() == ""
+
+    def test_rendered_text_is_cached(self):
+        """Test that repeated reads return the same string until the next append."""
+        transcript = Transcript(["one", "two"])
+        assert transcript.text() is transcript.text()
+
+    def test_segments_share_parts(self):
+        """Test that segments hand out stored parts without copying them."""
+        first = "x" * 1000
+        transcript = Transcript([first, "two", "three"])
+
+        assert transcript.segments(1) == ("two", "three")
+        assert transcript.segments()[0] is first
+        assert "two" in transcript
+
+    def test_size_tracks_text_without_rendering(self):
+        """Test that size matches the rendered length and is kept without joining the parts."""
+        transcript = Transcript()
+        assert transcript.size == 0
+        for text in ("one", "two", "x" * 100):
+            transcript.append(text)
+            assert transcript._rendered is None
+            assert transcript.size == len(transcript.text())
+
+
+class TestTranscriptCache:
+    """Test suite for TranscriptCache."""
+
+    def test_append_only_updates_cached_sessions(self):
+        """Test that append never creates a partial entry for an unknown session."""
+        cache = TranscriptCache()
+        cache.start("session-1")
+
+        assert cache.append("session-1", "First response") is True
+        assert cache.append("session-2", "Orphan response") is False
+
+        assert cache.get("session-1").segments() == ("First response",)
+        assert cache.get("session-2") is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used session is evicted at capacity."""
+        cache = TranscriptCache(max_sessions=2)
+        cache.load("session-1", ["one"])
+        cache.load("session-2", ["two"])
+
+        # Reading session-1 makes session-2 the least recently used
+        cache.get("session-1")
+        cache.load("session-3", ["three"])
+
+        assert cache.get("session-2") is None
+        assert cache.get("session-1").segments() == ("one",)
+        assert cache.get("session-3").segments() == ("three",)
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Test that entries expire once unused for ttl_seconds."""
+        with patch('memory.transcript_cache.time.monotonic') as mock_clock:
+            mock_clock.return_value = 100.0
+            cache = TranscriptCache(ttl_seconds=10)
+            cache.load("session-1", ["one"])
+
+            mock_clock.return_value = 105.0
+            assert cache.get("session-1").segments() == ("one",)
+
+            # The read refreshed the TTL
+            mock_clock.return_value = 114.0
+            assert cache.get("session-1").segments() == ("one",)
+
+            mock_clock.return_value = 125.0
+            assert cache.get("session-1") is None
+            assert cache.stats()["expirations"] == 1
+
+    def test_get_returns_live_transcript(self):
+        """Test that a transcript handed out earlier sees later appends."""
+        cache = TranscriptCache()
+        cache.load("session-1", ["one"])
+        transcript = cache.get("session-1")
+
+        cache.append("session-1", "two")
+        assert transcript.text() == "one\n\ntwo"
+        assert len(transcript) == 2
+
+
+class TestMemoryManagerTranscriptCache:
+    """Test suite for MemoryManager reads served from the transcript cache."""
+
+    def test_new_session_never_reads_remote(self):
+        """Test that a session created in this process is served entirely from the cache."""
+        with patch('boto3.client') as mock_boto:
+            mock_client = Mock()
+            mock_boto.return_value = mock_client
+
+            manager = MemoryManager()
+            session_id = manager.create_session("Test problem", "orchestrator")
+
+            assert manager.get_context(session_id, "jeff_barr") == ""
+            manager.store_response(session_id, "jeff_barr", 1, "Jeff round 1")
+            manager.store_response(session_id, "swami", 1, "Swami round 1")
+
+            assert manager.get_context(session_id, "werner_vogels") == "Jeff round 1\n\nSwami round 1"
+            assert manager.get_full_context(session_id, "orchestrator") == "Jeff round 1\n\nSwami round 1"
+            mock_client.retrieve_memory.assert_not_called()
+            assert mock_client.create_event.call_count == 2
+
+    def test_cold_read_warms_cache(self):
+        """Test that an unknown session is read remotely once and then served locally."""
+        with patch('boto3.client') as mock_boto:
+            mock_client = Mock()
+            mock_boto.return_value = mock_client
+            mock_client.retrieve_memory.return_value = {
+                'memories': [{'content': {'text': 'Stored before restart'}}]
+            }
+
+            manager = MemoryManager()
+            session_id = "debate_abc12345_2025-11-30T12:00:00123"
+
+            assert manager.get_context(session_id, "jeff_barr") == "Stored before restart"
+            manager.store_response(session_id, "jeff_barr", 2, "Jeff round 2")
+
+            assert manager.get_context(session_id, "swami") == "Stored before restart\n\nJeff round 2"
+            assert mock_client.retrieve_memory.call_count == 1
+
+    def test_truncated_read_is_not_cached(self):
+        """Test that a remote read that hit maxResults is not trusted as complete."""
+        with patch('boto3.client') as mock_boto:
+            mock_client = Mock()
+            mock_boto.return_value = mock_client
+            mock_client.retrieve_memory.return_value = {
+                'memories': [{'content': {'text': f'Response {i}'}} for i in range(50)]
+            }
+
+            manager = MemoryManager()
+            manager.get_context("session_12345678901234567890123", "jeff_barr")
+            manager.get_full_context("session_12345678901234567890123", "orchestrator")
+
+            assert mock_client.retrieve_memory.call_count == 2
+            assert mock_client.retrieve_memory.call_args[1]['maxResults'] == 100
+
+    def test_cache_can_be_disabled(self):
+        """Test that cache_sessions=0 restores a remote read on every call."""
+        with patch('boto3.client') as mock_boto:
+            mock_client = Mock()
+            mock_boto.return_value = mock_client
+            mock_client.retrieve_memory.return_value = {'memories': []}
+
+            manager = MemoryManager(cache_sessions=0)
+            session_id = manager.create_session("Test problem", "orchestrator")
+            manager.get_context(session_id, "jeff_barr")
+            manager.get_context(session_id, "swami")
+
+            assert manager.transcript_cache is None
+            assert mock_client.retrieve_memory.call_count == 2
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,195 @@
+"""Unit tests for WriteBehindBuffer and MemoryManager write-behind mode."""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+
+from memory.session_manager import MemoryManager
+from memory.write_behind import WriteBehindBuffer
+
+
+class RecordingWriter:
+    """Writer that records batches and can be gated or made to fail."""
+
+    def __init__(self):
+        self.batches = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.fail = False
+
+    def __call__(self, session_id, actor_id, events):
+        self.gate.wait(5)
+        if self.fail:
+            raise Exception("Memory unavailable")
+        self.batches.append((session_id, actor_id, [event.content for event in events]))
+
+
+class TestWriteBehindBuffer:
+    """Test suite for WriteBehindBuffer."""
+
+    def test_enqueue_does_not_wait_for_writer(self):
+        """Test that enqueue returns while the writer is still blocked."""
+        writer = RecordingWriter()
+        writer.gate.clear()
+        buffer = WriteBehindBuffer(writer)
+
+        started = time.monotonic()
+        buffer.enqueue("session-1", "jeff_barr", 1, "Jeff round 1")
+        assert time.monotonic() - started < 0.1
+        assert [e.content for e in buffer.pending("session-1")] == ["Jeff round 1"]
+
+        writer.gate.set()
+        buffer.flush("session-1", timeout=5)
+        assert writer.batches == [("session-1", "jeff_barr", ["Jeff round 1"])]
+        assert buffer.pending("session-1") == []
+        buffer.close()
+
+    def test_events_for_same_actor_are_batched(self):
+        """Test that queued events of one actor are persisted in one write, in order."""
+        writer = RecordingWriter()
+        writer.gate.clear()
+        buffer = WriteBehindBuffer(writer, max_workers=1)
+
+        # The first event is picked up immediately; the rest queue behind it
+        buffer.enqueue("session-1", "swami", 1, "warmup")
+        time.sleep(0.05)
+        buffer.enqueue("session-1", "jeff_barr", 1, "Jeff round 1")
+        buffer.enqueue("session-1", "swami", 1, "Swami round 1")
+        buffer.enqueue("session-1", "jeff_barr", 2, "Jeff round 2")
+
+        writer.gate.set()
+        buffer.flush(timeout=5)
+
+        assert writer.batches == [
+            ("session-1", "swami", ["warmup"]),
+            ("session-1", "jeff_barr", ["Jeff round 1", "Jeff round 2"]),
+            ("session-1", "swami", ["Swami round 1"]),
+        ]
+        buffer.close()
+
+    def test_failed_write_keeps_events_and_flush_raises(self):
+        """Test durability: failed events stay queued and are persisted by a later flush."""
+        writer = RecordingWriter()
+        writer.fail = True
+        buffer = WriteBehindBuffer(writer, retry_interval=60)
+
+        buffer.enqueue("session-1", "werner_vogels", 1, "Werner round 1")
+        with pytest.raises(RuntimeError, match="Failed to persist"):
+            buffer.flush("session-1", timeout=5)
+        assert [e.content for e in buffer.pending("session-1")] == ["Werner round 1"]
+
+        # Flushing retries immediately instead of waiting for retry_interval
+        writer.fail = False
+        buffer.flush("session-1", timeout=5)
+        assert writer.batches == [("session-1", "werner_vogels", ["Werner round 1"])]
+        buffer.close()
+
+    def test_flush_times_out(self):
+        """Test that flush honours its timeout while a write is stuck."""
+        writer = RecordingWriter()
+        writer.gate.clear()
+        buffer = WriteBehindBuffer(writer)
+
+        buffer.enqueue("session-1", "jeff_barr", 1, "Jeff round 1")
+        with pytest.raises(RuntimeError, match="Timed out"):
+            buffer.flush("session-1", timeout=0.1)
+
+        writer.gate.set()
+        buffer.close()
+
+    def test_close_flushes_and_rejects_new_events(self):
+        """Test that close persists queued events and the buffer rejects new ones."""
+        writer = RecordingWriter()
+        buffer = WriteBehindBuffer(writer)
+
+        buffer.enqueue("session-1", "jeff_barr", 1, "Jeff round 1")
+        buffer.enqueue("session-2", "swami", 1, "Swami round 1")
+        buffer.close()
+
+        assert sorted(batch[0] for batch in writer.batches) == ["session-1", "session-2"]
+        with pytest.raises(RuntimeError):
+            buffer.enqueue("session-1", "jeff_barr", 2, "too late")
+
+
+class TestMemoryManagerWriteBehind:
+    """Test suite for MemoryManager with write_behind enabled."""
+
+    def test_store_response_is_queued_and_flushed(self):
+        """Test that store_response defers create_event until the background flush."""
+        with patch('boto3.client') as mock_boto:
+            mock_client = Mock()
+            mock_boto.return_value = mock_client
+            gate = threading.Event()
+            mock_client.create_event.side_effect = lambda **kwargs: gate.wait(5) and {}
+            mock_client.retrieve_memory.return_value = {'memories': []}
+
+            manager = MemoryManager(write_behind=True)
+            session_id = "debate_abc12345_2025-11-30T12:00:00123"
+
+            started = time.monotonic()
+            manager.store_response(session_id, "jeff_barr", 1, "Jeff round 1")
+            assert time.monotonic() - started < 0.1, "store_response should not block on create_event"
+
+            # Queued responses are visible to readers before they are persisted
+            assert manager.get_context(session_id, "swami") == "Jeff round 1"
+
+            gate.set()
+            manager.flush(session_id, timeout=5)
+
+            call_args = mock_client.create_event.call_args
+            assert call_args[1]['sessionId'] == session_id
+            assert call_args[1]['actorId'] == "jeff_barr"
+            assert call_args[1]['messages'][1]['text'] == "Jeff round 1"
+            manager.close()
+
+    def test_pending_responses_are_not_duplicated(self):
+        """Test that responses already returned by retrieve_memory are not appended twice."""
+        with patch('boto3.client') as mock_boto:
+            mock_client = Mock()
+            mock_boto.return_value = mock_client
+            gate = threading.Event()
+            writing = threading.Event()
+            mock_client.create_event.side_effect = lambda **kwargs: writing.set() or gate.wait(5) and {}
+            mock_client.retrieve_memory.return_value = {
+                'memories': [{'content': {'text': 'Jeff round 1'}}]
+            }
+
+            manager = MemoryManager(write_behind=True)
+            manager.store_response("session-1", "jeff_barr", 1, "Jeff round 1")
+            manager.store_response("session-1", "swami", 1, "Swami round 1")
+            # Jeff's write is in flight, so the remote read may already include it
+            assert writing.wait(5)
+
+            context = manager.get_full_context("session-1", "orchestrator")
+            assert context == "Jeff round 1\n\nSwami round 1"
+
+            gate.set()
+            manager.close()
+
+    def test_identical_pending_responses_are_kept(self):
+        """Test that a queued response is not dropped because an earlier identical one was persisted."""
+        placeholder = "[Agent swami failed to respond]"
+        with patch('boto3.client') as mock_boto:
+            mock_client = Mock()
+            mock_boto.return_value = mock_client
+            gate = threading.Event()
+            mock_client.create_event.side_effect = lambda **kwargs: gate.wait(5) and {}
+            mock_client.retrieve_memory.return_value = {
+                'memories': [{'content': {'text': placeholder}}]
+            }
+
+            manager = MemoryManager(write_behind=True)
+            manager.store_response("session-1", "jeff_barr", 2, "Jeff round 2")
+            manager.store_response("session-1", "swami", 2, placeholder)
+
+            context = manager.get_full_context("session-1", "orchestrator")
+            assert context == f"{placeholder}\n\nJeff round 2\n\n{placeholder}"
+
+            gate.set()
+            manager.close()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
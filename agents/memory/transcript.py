@@ -0,0 +1,72 @@
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+SEPARATOR = "\n\n"
+
+
+class Transcript:
+    """
+    Append-only transcript of one debate session.
+
+    The joined text is built on the first read after an append and cached
+    until the next one, so all the readers of a turn share one string. Its
+    length is kept up to date on append, so callers that only need the size
+    (such as the context budgeter) never join the parts. `segments` hands
+    out the stored parts themselves.
+
+    Appends and reads are thread-safe.
+    """
+
+    def __init__(self, parts: Iterable[str] = ()):
+        """
+        Initialize the transcript.
+
+        Args:
+            parts: Existing responses in chronological order
+        """
+        self._lock = threading.Lock()
+        self._parts: List[str] = []
+        self._size = 0
+        self._rendered: Optional[str] = ""
+        for part in parts:
+            self._append(part)
+
+    def append(self, text: str) -> None:
+        """Add a response to the end of the transcript."""
+        with self._lock:
+            self._append(text)
+
+    def _append(self, text: str) -> None:
+        if self._parts:
+            self._size += len(SEPARATOR)
+        self._size += len(text)
+        self._parts.append(text)
+        self._rendered = None
+
+    def __len__(self) -> int:
+        return len(self._parts)
+
+    def __contains__(self, text: str) -> bool:
+        with self._lock:
+            return text in self._parts
+
+    @property
+    def size(self) -> int:
+        """Length of text() in characters, without rendering it."""
+        with self._lock:
+            return self._size
+
+    def text(self) -> str:
+        """Return the responses joined by blank lines."""
+        with self._lock:
+            if self._rendered is None:
+                self._rendered = SEPARATOR.join(self._parts)
+            return self._rendered
+
+    def segments(self, start: int = 0, end: Optional[int] = None) -> Tuple[str, ...]:
+        """Return the responses in [start, end) without joining them."""
+        with self._lock:
+            return tuple(self._parts[start:end])
+
+    def __str__(self) -> str:
+        return self.text()
@@ -0,0 +1,143 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from .transcript import Transcript
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+
+class _CacheEntry:
+    """A cached session transcript and its expiry time."""
+
+    __slots__ = ("transcript", "expires_at")
+
+    def __init__(self, transcript: Transcript, expires_at: float):
+        self.transcript = transcript
+        self.expires_at = expires_at
+
+
+class TranscriptCache:
+    """
+    In-process, session-scoped cache of debate transcripts.
+
+    MemoryManager keeps an entry up to date on every store_response, so once a
+    session is cached its context is served locally and AgentCore Memory is
+    only read on a cold start (a session this process has not seen, e.g. after
+    a restart). Entries expire `ttl_seconds` after their last use and the
+    least recently used session is evicted once `max_sessions` is exceeded,
+    which keeps memory bounded across thousands of debates.
+
+    All methods are thread-safe.
+    """
+
+    def __init__(self, max_sessions: int = 1000, ttl_seconds: float = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_sessions: Maximum number of sessions kept in memory
+            ttl_seconds: Seconds an unused session stays cached
+        """
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def start(self, session_id: str) -> None:
+        """Cache a new, empty session so its reads never go remote."""
+        self.load(session_id, [])
+
+    def load(self, session_id: str, parts: List[str]) -> None:
+        """
+        Cache the complete transcript of a session, replacing any existing entry.
+
+        Args:
+            session_id: The debate session ID
+            parts: Every response of the session in chronological order
+        """
+        with self._lock:
+            self._entries[session_id] = _CacheEntry(Transcript(parts), self._expiry())
+            self._entries.move_to_end(session_id)
+            self._evict()
+
+    def append(self, session_id: str, content: str) -> bool:
+        """
+        Add a stored response to a cached session.
+
+        Sessions that are not cached are left alone: a partial transcript must
+        not be mistaken for a complete one, so they are loaded on their next read.
+
+        Returns:
+            True if the session was cached and updated
+        """
+        with self._lock:
+            entry = self._live_entry(session_id)
+            if entry is None:
+                return False
+            entry.transcript.append(content)
+            entry.expires_at = self._expiry()
+            self._entries.move_to_end(session_id)
+            return True
+
+    def get(self, session_id: str) -> Optional[Transcript]:
+        """
+        Return the cached transcript of a session, or None on a miss.
+
+        The transcript is shared and keeps growing as responses are stored;
+        callers read it but only the cache appends to it.
+        """
+        with self._lock:
+            entry = self._live_entry(session_id)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            entry.expires_at = self._expiry()
+            self._entries.move_to_end(session_id)
+            return entry.transcript
+
+    def invalidate(self, session_id: str) -> None:
+        """Drop a session so its next read goes to AgentCore Memory."""
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and the current number of sessions."""
+        with self._lock:
+            return dict(self._stats, sessions=len(self._entries))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _expiry(self) -> float:
+        return time.monotonic() + self.ttl_seconds
+
+    def _live_entry(self, session_id: str) -> Optional[_CacheEntry]:
+        entry = self._entries.get(session_id)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            del self._entries[session_id]
+            self._stats["expirations"] += 1
+            logger.debug(f"Transcript cache entry expired for session={session_id}")
+            return None
+        return entry
+
+    def _evict(self) -> None:
+        # Every use refreshes the TTL and moves the entry to the end, so entries
+        # are ordered by expiry and expired ones are always at the front
+        now = time.monotonic()
+        while self._entries:
+            session_id, entry = next(iter(self._entries.items()))
+            if entry.expires_at > now:
+                break
+            del self._entries[session_id]
+            self._stats["expirations"] += 1
+        while len(self._entries) > self.max_sessions:
+            session_id, _ = self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+            logger.debug(f"Evicted transcript cache entry for session={session_id}")
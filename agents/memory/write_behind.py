@@ -0,0 +1,224 @@
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingEvent:
+    """An expert response waiting to be persisted."""
+    seq: int
+    session_id: str
+    actor_id: str
+    round_num: int
+    content: str
+
+
+class WriteBehindBuffer:
+    """
+    Queues memory events per session and persists them on background threads.
+
+    Durability guarantee: an event stays in the buffer until the writer has
+    persisted it successfully. A failed write leaves its events queued (they
+    are retried after `retry_interval`) and is reported to anyone waiting in
+    `flush`, so a successful `flush` means every event enqueued before the
+    call is stored remotely. `close` flushes everything and is registered as
+    an interpreter shutdown hook by MemoryManager.
+
+    Events for the same session and actor that are waiting together are sent
+    as a single batch, since one create_event call accepts a list of messages
+    for one actor.
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[str, str, List[PendingEvent]], None],
+        max_workers: int = 4,
+        retry_interval: float = 5.0
+    ):
+        """
+        Initialize the buffer and start its writer threads.
+
+        Args:
+            writer: Persists a batch of events for one (session_id, actor_id);
+                raises on failure
+            max_workers: Number of writer threads; each session is written by
+                at most one thread at a time so per-session order is kept
+            retry_interval: Seconds before a session with a failed write is retried
+        """
+        self._writer = writer
+        self._retry_interval = retry_interval
+        self._cond = threading.Condition()
+        self._pending: "OrderedDict[str, deque]" = OrderedDict()
+        self._in_flight: Dict[str, List[PendingEvent]] = {}
+        self._retry_at: Dict[str, float] = {}
+        self._failures: Dict[str, tuple] = {}
+        self._next_seq = 0
+        self._writes_completed = 0
+        self._closed = False
+        self._workers = [
+            threading.Thread(target=self._run, name=f"memory-write-behind-{i}", daemon=True)
+            for i in range(max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def enqueue(self, session_id: str, actor_id: str, round_num: int, content: str) -> None:
+        """
+        Queue an event for background persistence and return immediately.
+
+        Raises:
+            RuntimeError: If the buffer has been closed
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Write-behind buffer is closed")
+            self._next_seq += 1
+            event = PendingEvent(self._next_seq, session_id, actor_id, round_num, content)
+            self._pending.setdefault(session_id, deque()).append(event)
+            self._cond.notify_all()
+
+    def pending(self, session_id: str) -> List[PendingEvent]:
+        """Return the events of a session that are not yet persisted, oldest first."""
+        with self._cond:
+            return sorted(self._unpersisted(session_id), key=lambda event: event.seq)
+
+    def queued(self, session_id: str) -> List[PendingEvent]:
+        """Return the events of a session not yet handed to the writer, oldest first."""
+        with self._cond:
+            return sorted(self._pending.get(session_id, ()), key=lambda event: event.seq)
+
+    def flush(self, session_id: Optional[str] = None, timeout: Optional[float] = None) -> None:
+        """
+        Block until events enqueued before this call are persisted.
+
+        Args:
+            session_id: Session to flush, or None for every session
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Raises:
+            RuntimeError: If a write for the flushed events failed (the events
+                remain queued) or the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            targets = {
+                sid: self._last_seq(sid)
+                for sid in ([session_id] if session_id else self._sessions())
+            }
+            targets = {sid: seq for sid, seq in targets.items() if seq is not None}
+            started_writes = self._writes_completed
+
+            # Flushed sessions are written now rather than after their retry delay
+            for sid in targets:
+                self._retry_at.pop(sid, None)
+            self._cond.notify_all()
+
+            while True:
+                remaining = {
+                    sid: seq for sid, seq in targets.items()
+                    if any(event.seq <= seq for event in self._unpersisted(sid))
+                }
+                if not remaining:
+                    return
+
+                for sid in remaining:
+                    failure = self._failures.get(sid)
+                    if failure and failure[0] > started_writes:
+                        raise RuntimeError(
+                            f"Failed to persist memory events for session {sid}: {failure[1]}"
+                        )
+
+                wait = None if deadline is None else deadline - time.monotonic()
+                if wait is not None and wait <= 0:
+                    raise RuntimeError(
+                        f"Timed out flushing memory events for sessions {sorted(remaining)}"
+                    )
+                self._cond.wait(wait)
+
+    def close(self, timeout: Optional[float] = 30.0) -> None:
+        """Flush all sessions and stop the writer threads (shutdown hook)."""
+        try:
+            self.flush(timeout=timeout)
+        except RuntimeError as e:
+            with self._cond:
+                lost = sum(len(events) for events in self._pending.values())
+            logger.error(f"Write-behind buffer closing with {lost} unpersisted events: {e}")
+        finally:
+            with self._cond:
+                self._closed = True
+                self._cond.notify_all()
+
+    def _sessions(self) -> List[str]:
+        return list(self._pending) + [sid for sid in self._in_flight if sid not in self._pending]
+
+    def _unpersisted(self, session_id: str) -> List[PendingEvent]:
+        return self._in_flight.get(session_id, []) + list(self._pending.get(session_id, ()))
+
+    def _last_seq(self, session_id: str) -> Optional[int]:
+        events = self._unpersisted(session_id)
+        return max(event.seq for event in events) if events else None
+
+    def _take_batch(self) -> Optional[List[PendingEvent]]:
+        """Claim the oldest waiting events of one actor in a ready session."""
+        now = time.monotonic()
+        for session_id, queued in self._pending.items():
+            if session_id in self._in_flight or self._retry_at.get(session_id, 0) > now:
+                continue
+            actor_id = queued[0].actor_id
+            batch = [event for event in queued if event.actor_id == actor_id]
+            remaining = deque(event for event in queued if event.actor_id != actor_id)
+            if remaining:
+                self._pending[session_id] = remaining
+            else:
+                del self._pending[session_id]
+            self._in_flight[session_id] = batch
+            return batch
+        return None
+
+    def _next_wakeup(self) -> Optional[float]:
+        if not self._retry_at:
+            return None
+        return max(0.0, min(self._retry_at.values()) - time.monotonic())
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                batch = self._take_batch()
+                while batch is None:
+                    if self._closed:
+                        return
+                    self._cond.wait(self._next_wakeup())
+                    batch = self._take_batch()
+
+            session_id, actor_id = batch[0].session_id, batch[0].actor_id
+            try:
+                self._writer(session_id, actor_id, batch)
+                error = None
+            except Exception as e:
+                error = e
+
+            with self._cond:
+                del self._in_flight[session_id]
+                self._writes_completed += 1
+                if error is None:
+                    self._failures.pop(session_id, None)
+                    self._retry_at.pop(session_id, None)
+                else:
+                    logger.error(
+                        f"Write-behind flush failed for session={session_id}, actor={actor_id}; "
+                        f"{len(batch)} events kept for retry: {error}"
+                    )
+                    # Put the batch back at the front, preserving per-actor order
+                    queued = self._pending.get(session_id, deque())
+                    merged = deque(sorted(list(batch) + list(queued), key=lambda event: event.seq))
+                    self._pending[session_id] = merged
+                    self._pending.move_to_end(session_id, last=False)
+                    self._failures[session_id] = (self._writes_completed, error)
+                    self._retry_at[session_id] = time.monotonic() + self._retry_interval
+                self._cond.notify_all()
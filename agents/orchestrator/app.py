@@ -1,14 +1,28 @@
 from bedrock_agentcore.runtime import BedrockAgentCoreApp
+from strands import Agent
+from agent_registry import agent_registry
 from experts.jeff_barr import jeff_barr_agent
 from experts.swami import swami_agent
 from experts.werner_vogels import werner_agent
 from synthesis.synthesizer import synthesis_agent, extract_mermaid
+from synthesis.mermaid_stream import MermaidStreamExtractor
+from experts.prompt_cache import CACHE_POINT, PromptCacheStats, limit_cache_points, prompt_cache_stats
+from cache import DebateResultCache, create_backend
+from audio import AudioPipeline, TurnNarrator, create_audio_store
+from transcripts import create_transcript_recorder
 from memory.session_manager import MemoryManager
+from memory.context_budget import ContextBudgeter
+from orchestrator.scheduler import get_scheduler
 import asyncio
+import contextlib
+import contextvars
+import functools
+import hashlib
 import json
 import os
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 
 # Configure logging for the entire application
 # This is the main entry point, so we configure logging here
@@ -30,6 +44,35 @@ app = BedrockAgentCoreApp()
 MEMORY_ID = os.getenv('MEMORY_ID')
 MODEL_ID = os.getenv('MODEL_ID', 'us.anthropic.claude-sonnet-4-20250514-v1:0')
 REGION = os.getenv('AWS_REGION', 'us-east-1')
+PARALLEL_ROUNDS = os.getenv('PARALLEL_ROUNDS', 'false').lower() == 'true'
+TURN_PACING = os.getenv('TURN_PACING', 'client')
+TURN_SECONDS = float(os.getenv('TURN_SECONDS', '60'))
+ORCHESTRATOR_MAX_WORKERS = int(os.getenv('ORCHESTRATOR_MAX_WORKERS', '64'))
+SPECULATIVE_SYNTHESIS = os.getenv('SPECULATIVE_SYNTHESIS', 'false').lower() == 'true'
+RESULT_CACHE = os.getenv('RESULT_CACHE', 'memory')
+RESULT_CACHE_DIR = os.getenv('RESULT_CACHE_DIR', os.path.join(os.path.dirname(__file__), '..', '.cache', 'debates'))
+RESULT_CACHE_BUCKET = os.getenv('RESULT_CACHE_BUCKET')
+RESULT_CACHE_PREFIX = os.getenv('RESULT_CACHE_PREFIX', 'debate-results/')
+DEBATE_AUDIO = os.getenv('DEBATE_AUDIO', 'false').lower() == 'true'
+TRANSCRIPT_DIR = os.getenv('TRANSCRIPT_DIR')
+PREWARM_AGENTS = os.getenv('PREWARM_AGENTS', 'false').lower() == 'true'
+
+# Display names of the experts, by expert ID, for prompts that quote their turns
+EXPERT_NAMES = {
+    "jeff_barr": "Jeff Barr",
+    "swami": "Swami Sivasubramanian",
+    "werner_vogels": "Werner Vogels"
+}
+
+# Part of the result cache key: bump when the prompt templates in this module change
+PROMPT_VERSION = "4"
+MEMORY_WRITE_BEHIND = os.getenv('MEMORY_WRITE_BEHIND', 'true').lower() == 'true'
+MEMORY_FLUSH_TIMEOUT = float(os.getenv('MEMORY_FLUSH_TIMEOUT', '30'))
+MEMORY_CACHE_SESSIONS = int(os.getenv('MEMORY_CACHE_SESSIONS', '1000'))
+MEMORY_CACHE_TTL = float(os.getenv('MEMORY_CACHE_TTL', '3600'))
+CONTEXT_MAX_TOKENS = int(os.getenv('CONTEXT_MAX_TOKENS', '6000'))
+SYNTHESIS_CONTEXT_MAX_TOKENS = int(os.getenv('SYNTHESIS_CONTEXT_MAX_TOKENS', '24000'))
+CONTEXT_RECENT_TURNS = int(os.getenv('CONTEXT_RECENT_TURNS', '6'))
 
 # Validate and log configuration
 if not MEMORY_ID:
@@ -37,7 +80,86 @@ if not MEMORY_ID:
 logger.info(f"Initializing with MODEL_ID={MODEL_ID}, REGION={REGION}")
 
 # Initialize MemoryManager with environment configuration
-memory = MemoryManager(memory_id=MEMORY_ID, region=REGION)
+# Responses are persisted write-behind; the debate only waits on a flush before synthesis.
+# Context reads are served from the in-process transcript cache and kept within
+# a token budget by summarizing older rounds once they no longer fit.
+memory = MemoryManager(
+    memory_id=MEMORY_ID,
+    region=REGION,
+    write_behind=MEMORY_WRITE_BEHIND,
+    cache_sessions=MEMORY_CACHE_SESSIONS,
+    cache_ttl=MEMORY_CACHE_TTL,
+    context_budget=ContextBudgeter(
+        max_tokens=CONTEXT_MAX_TOKENS,
+        full_max_tokens=SYNTHESIS_CONTEXT_MAX_TOKENS,
+        recent_turns=CONTEXT_RECENT_TURNS,
+        turns_per_round=3
+    )
+)
+
+# Model and memory calls are synchronous boto3/Strands calls; they run on this
+# pool so the event loop can multiplex many concurrent debates per worker
+executor = ThreadPoolExecutor(max_workers=ORCHESTRATOR_MAX_WORKERS, thread_name_prefix='debate')
+
+
+async def run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """
+    Run a blocking call on the orchestrator executor without blocking the event loop.
+    
+    Args:
+        func: The blocking function to execute
+        *args: Positional arguments for the function
+        **kwargs: Keyword arguments for the function
+    
+    Returns:
+        The result of the function call
+    """
+    loop = asyncio.get_running_loop()
+    # Carry context variables (e.g. the model gateway's traffic priority) into the worker thread
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(executor, functools.partial(context.run, func, *args, **kwargs))
+
+
+# Completed debates for predefined problems are cached by content address
+result_cache_backend = create_backend(
+    RESULT_CACHE,
+    directory=RESULT_CACHE_DIR,
+    bucket=RESULT_CACHE_BUCKET,
+    prefix=RESULT_CACHE_PREFIX
+)
+result_cache = DebateResultCache(result_cache_backend) if result_cache_backend else None
+
+# Polly audio for each turn, synthesized while the next expert is generating
+turn_narrator = TurnNarrator(AudioPipeline(), create_audio_store())
+
+# JSON Lines transcript of each debate, appended to as turns complete
+transcript_recorder = create_transcript_recorder(TRANSCRIPT_DIR, run_blocking=run_blocking)
+
+# Agents (and their models and boto3 clients) are built on first use. With
+# PREWARM_AGENTS they are built on a background thread right away instead, so
+# the runtime can accept requests while the first debate's agents get ready.
+if PREWARM_AGENTS:
+    agent_registry.prewarm(extra=[lambda: memory.client])
+
+
+def fresh_agent(agent):
+    """
+    Create a per-invocation copy of a Strands agent.
+    
+    Strands agents keep conversation history and reject concurrent invocations,
+    so the module-level agents act as templates: each turn runs on a copy that
+    shares the model and system prompt (including its cache points) but has
+    its own conversation state. Anything that is not a Strands Agent is
+    returned unchanged.
+    """
+    if not isinstance(agent, Agent):
+        return agent
+    return Agent(
+        model=agent.model,
+        system_prompt=agent.system_prompt_content,
+        name=agent.name,
+        callback_handler=None
+    )
 
 # Load problem statements
 PROBLEM_STATEMENTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'problem_statements.json')
@@ -69,6 +191,412 @@ def get_problem_by_id(problem_id: str) -> Optional[str]:
         return problem['statement']
     return None
 
+def get_expert_context(session_id: str, agent) -> str:
+    """
+    Retrieve the cumulative debate context for an expert's next turn.
+    
+    Args:
+        session_id: The debate session ID
+        agent: The expert agent about to speak
+    
+    Returns:
+        The formatted previous discussion, or a placeholder when none is available
+    """
+    try:
+        mem_context = memory.get_context(session_id=session_id, actor_id=agent.name)
+        # Handle empty context gracefully
+        if not mem_context or not mem_context.strip():
+            mem_context = "[No previous context]"
+            logger.info(f"No previous context for {agent.name} in session {session_id}")
+    except Exception as e:
+        logger.error(f"Error retrieving context for {agent.name}: {e}")
+        mem_context = "[Error retrieving context]"
+    return mem_context
+
+
+def build_expert_prompt(
+    problem: str,
+    round_num: int,
+    round_type: str,
+    mem_context: str,
+    cached_context: Optional[str] = None
+) -> List[dict]:
+    """
+    Build an expert prompt with problem, round info, and context.
+    
+    The prompt is a list of content blocks ordered from most to least stable
+    so Bedrock can cache its prefix: the problem preamble, the context this
+    expert was already sent last turn, and the full context are each followed
+    by a cache point, and only the round instructions come after the last one.
+    With the cache point on the expert's system prompt, each later turn reads
+    the system prompt, problem and earlier rounds from the cache.
+    
+    Args:
+        problem: The problem statement
+        round_num: Round number (1-3)
+        round_type: "debate" or "consensus"
+        mem_context: The debate context for this turn
+        cached_context: The context this expert was sent on its previous turn;
+            used as a separate cached block when mem_context extends it
+    
+    Returns:
+        Strands/Bedrock content blocks
+    """
+    if round_type == "consensus":
+        round_label = "CONSENSUS ROUND - work toward agreement"
+    else:
+        round_label = round_type
+    
+    blocks = [{"text": f"Problem: {problem}\n\nPrevious discussion:\n"}, CACHE_POINT]
+    new_context = None
+    if cached_context and mem_context.startswith(cached_context):
+        new_context = mem_context[len(cached_context):]
+    if new_context and new_context.strip():
+        blocks += [{"text": cached_context}, CACHE_POINT, {"text": new_context}]
+    else:
+        blocks.append({"text": mem_context})
+    blocks += [
+        CACHE_POINT,
+        {"text": f"\n\nRound {round_num} ({round_label})\n\nYour response (keep to ~200 words):"}
+    ]
+    # One more cache point ends the expert's system prompt
+    return limit_cache_points(blocks)
+
+
+def invoke_expert(
+    agent,
+    prompt: List[dict],
+    round_num: int,
+    cache_stats: Optional[PromptCacheStats] = None
+) -> str:
+    """
+    Invoke an expert agent and extract its response text.
+    
+    Failures never propagate: a placeholder is returned instead so the debate
+    can continue with the remaining experts.
+    
+    Args:
+        agent: The expert agent to invoke
+        prompt: The full prompt for this turn as content blocks
+        round_num: Round number (for logging)
+        cache_stats: Prompt-cache counters to record the call's usage in
+    
+    Returns:
+        The expert's response text or a failure placeholder
+    """
+    try:
+        logger.info(f"Invoking agent {agent.name} for round {round_num}")
+        response = fresh_agent(agent)(prompt)
+        if cache_stats is not None:
+            cache_stats.record_result(response)
+        response_text = response.message['content'][0]['text']
+        logger.info(f"Agent {agent.name} responded successfully")
+    except (KeyError, TypeError, IndexError) as e:
+        logger.error(f"Error extracting response from {agent.name}: {e}")
+        response_text = f"[Agent {agent.name} failed to respond - invalid response structure]"
+    except Exception as e:
+        logger.error(f"Error invoking {agent.name}: {e}")
+        response_text = f"[Agent {agent.name} failed to respond]"
+    return response_text
+
+
+def store_expert_response(session_id: str, agent, round_num: int, response_text: str) -> None:
+    """Store an expert's response to memory; failures are logged and swallowed."""
+    try:
+        memory.store_response(
+            session_id=session_id,
+            actor_id=agent.name,
+            round_num=round_num,
+            content=response_text
+        )
+        logger.info(f"Stored response for {agent.name} in round {round_num}")
+    except Exception as e:
+        logger.error(f"Error storing response for {agent.name}: {e}")
+        # Continue execution - memory failure shouldn't stop debate
+
+
+def turn_timing(scheduler, turn_index: int, round_num: int, agent) -> dict:
+    """Build the timeline entry for a released turn."""
+    timing = scheduler.timing(turn_index)
+    timing["round"] = round_num
+    timing["expertId"] = agent.name
+    return timing
+
+
+def turn_complete_event(agent, round_num: int, response_text: str, timing: dict) -> dict:
+    """Build the event for a finished, stored expert turn."""
+    return {
+        "type": "expert_response",
+        "expertId": agent.name,
+        "round": round_num,
+        "content": response_text,
+        "isComplete": True,
+        "timing": timing
+    }
+
+
+async def stream_agent_text(agent, prompt, cache_stats: Optional[PromptCacheStats] = None):
+    """
+    Yield an agent's response text as it is generated.
+    
+    Strands agents are streamed token by token on a per-invocation copy. Any
+    other callable is invoked on the executor and yields its full response once.
+    
+    Args:
+        agent: The agent to invoke
+        prompt: The full prompt for this invocation (text or content blocks)
+        cache_stats: Prompt-cache counters to record the call's usage in
+    
+    Yields:
+        Text deltas in generation order
+    """
+    if isinstance(agent, Agent):
+        async for event in fresh_agent(agent).stream_async(prompt):
+            if 'data' in event:
+                yield event['data']
+            elif 'result' in event and cache_stats is not None:
+                cache_stats.record_result(event['result'])
+        return
+    response = await run_blocking(agent, prompt)
+    yield response.message['content'][0]['text']
+
+
+SYNTHESIS_INSTRUCTIONS = """
+
+Please synthesize all three expert perspectives into a unified architecture proposal. Include:
+1. Architecture overview combining all viewpoints
+2. Core components and services
+3. A Mermaid diagram showing the architecture
+4. Key trade-offs between the different approaches
+
+Remember to honor:
+- Jeff's serverless and simplicity principles
+- Swami's speed-to-market and AI/ML focus
+- Werner's scale and distributed systems concerns"""
+
+
+def build_synthesis_prompt(problem: str, full_context: str, draft: bool = False) -> List[dict]:
+    """
+    Build the synthesis prompt as content blocks.
+    
+    Args:
+        problem: The problem statement
+        full_context: The debate transcript
+        draft: Build the speculative draft prompt from rounds 1-2 only
+    """
+    if draft:
+        observed = "the first two rounds of a 3-round debate"
+        transcript_label = "Debate transcript so far (the consensus round is still running)"
+    else:
+        observed = "a complete 3-round debate"
+        transcript_label = "Complete debate transcript"
+    return [
+        {"text": f"""You have observed {observed} on the following problem:
+
+Problem: {problem}
+
+{transcript_label}:
+"""},
+        {"text": full_context},
+        {"text": SYNTHESIS_INSTRUCTIONS}
+    ]
+
+
+def build_refinement_prompt(problem: str, draft: str, consensus_turns: List[tuple]) -> List[dict]:
+    """
+    Build the delta prompt that updates a draft synthesis with the consensus round.
+    
+    Only the changes are requested, so the pass is short compared with a full
+    re-synthesis; its output is appended to the draft.
+    
+    Args:
+        problem: The problem statement
+        draft: Synthesis drafted from rounds 1-2
+        consensus_turns: (expertId, text) of each round-3 turn in speaking order
+    """
+    turns = "\n\n".join(
+        f"{EXPERT_NAMES.get(expert_id, expert_id)}: {text}" for expert_id, text in consensus_turns
+    )
+    return [
+        {"text": f"""You drafted the synthesis below from the first two rounds of a debate on:
+
+Problem: {problem}
+
+Draft synthesis:
+"""},
+        {"text": draft},
+        {"text": "\n\nConsensus round (round 3) turns:\n"},
+        {"text": turns},
+        {"text": """
+
+Do not rewrite the draft. Write only what the consensus round changes, starting with a "## Consensus Updates" heading (under 150 words): points the experts now agree on and components added, dropped or changed. If the architecture changed, end with a complete updated Mermaid diagram in a ```mermaid block; otherwise include no diagram."""}
+    ]
+
+
+class SpeculativeSynthesis:
+    """
+    Synthesis drafted while the consensus round is still running.
+    
+    The draft streams from the synthesis agent in the background as soon as
+    round 2 ends; its text deltas are buffered until the debate is ready to
+    publish them. After round 3, `refine` runs a short delta pass over the
+    draft and the consensus turns instead of a full re-synthesis.
+    """
+    
+    def __init__(self, problem: str, draft_context: str, cache_stats: PromptCacheStats):
+        self.problem = problem
+        self.cache_stats = cache_stats
+        self.draft_parts: List[str] = []
+        self._deltas: asyncio.Queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run(build_synthesis_prompt(problem, draft_context, draft=True)))
+    
+    async def _run(self, prompt: List[dict]) -> None:
+        try:
+            async for delta in stream_agent_text(synthesis_agent, prompt, self.cache_stats):
+                self.draft_parts.append(delta)
+                self._deltas.put_nowait(delta)
+        finally:
+            self._deltas.put_nowait(None)
+    
+    async def draft_deltas(self):
+        """Yield the draft's text deltas, buffered or live; raises if drafting failed."""
+        while True:
+            delta = await self._deltas.get()
+            if delta is None:
+                break
+            yield delta
+        await self._task
+    
+    async def refine(self, consensus_turns: List[tuple]):
+        """Yield the text deltas of the consensus-round update to the finished draft."""
+        prompt = build_refinement_prompt(self.problem, "".join(self.draft_parts), consensus_turns)
+        async for delta in stream_agent_text(synthesis_agent, prompt, self.cache_stats):
+            yield delta
+    
+    def cancel(self) -> None:
+        """Stop drafting (e.g. when the debate ends early)."""
+        self._task.cancel()
+
+
+def model_config(agent) -> dict:
+    """Return an agent's model configuration, or {} if it has none."""
+    config = getattr(getattr(agent, 'model', None), 'config', None)
+    return config if isinstance(config, dict) else {}
+
+
+def debate_model_calls(payload: dict) -> Dict[str, int]:
+    """
+    Return the number of model calls a live debate makes, per model ID.
+    
+    Each expert speaks once per round; synthesis is one call, or two with
+    speculative synthesis (draft and consensus update). Used by callers that
+    budget model requests, e.g. the batch runner's rate limits.
+    """
+    speculative = payload.get('speculativeSynthesis', SPECULATIVE_SYNTHESIS)
+    calls: Dict[str, int] = {}
+    plan = [(agent, 3) for agent in (jeff_barr_agent, swami_agent, werner_agent)]
+    plan.append((synthesis_agent, 2 if speculative else 1))
+    for agent, count in plan:
+        model_id = model_config(agent).get('model_id') or MODEL_ID
+        calls[model_id] = calls.get(model_id, 0) + count
+    return calls
+
+
+def debate_cache_key(problem: str, payload: Optional[dict] = None) -> str:
+    """
+    Compute the result cache key of a debate on the given problem.
+    
+    Covers the problem text, every agent's model ID and temperature, the
+    orchestrator's prompt templates (PROMPT_VERSION), each agent's system
+    prompt, and the request's round mode, context budget and speculative
+    synthesis setting, which change what the agents are shown.
+    """
+    payload = payload or {}
+    agents = [jeff_barr_agent, swami_agent, werner_agent, synthesis_agent]
+    configs = [model_config(agent) for agent in agents]
+    system_prompts = [
+        hashlib.sha256(str(getattr(agent, 'system_prompt', '')).encode()).hexdigest()[:16]
+        for agent in agents
+    ]
+    return DebateResultCache.make_key(
+        problem,
+        model_ids=[config.get('model_id') for config in configs],
+        prompt_versions=[PROMPT_VERSION] + system_prompts,
+        temperature=[config.get('temperature') for config in configs],
+        settings={
+            "parallelRound": bool(payload.get('parallelRound', PARALLEL_ROUNDS)),
+            "speculativeSynthesis": bool(payload.get('speculativeSynthesis', SPECULATIVE_SYNTHESIS)),
+            "contextBudget": [CONTEXT_MAX_TOKENS, SYNTHESIS_CONTEXT_MAX_TOKENS, CONTEXT_RECENT_TURNS]
+        }
+    )
+
+
+def is_failed_turn(content: str) -> bool:
+    """Whether a turn's content is invoke_expert's failure placeholder."""
+    return content.startswith("[Agent ") and "failed to respond" in content
+
+
+# Fields that belong to the request that ran a debate, not to the debate itself;
+# they are never stored in the result cache
+REQUEST_FIELDS = ('sessionId', 'session_id', 'actor_id', 'promptCache')
+
+
+def cacheable_event(event: dict) -> dict:
+    """Return a debate event without its per-request fields, for the result cache."""
+    return {key: value for key, value in event.items() if key not in REQUEST_FIELDS}
+
+
+async def replay_cached_debate(events: List[dict], scheduler, actor_id: str, session_id: str):
+    """
+    Replay a cached debate through the turn scheduler for a new request.
+    
+    Turns are re-timed by the scheduler, so realtime pacing releases them at
+    their speaking slots and client pacing returns fresh playback timestamps.
+    The replay is stamped with the requester's actor_id and its own session
+    ID; it made no model calls, so its prompt-cache usage is empty.
+    """
+    scheduler.start()
+    timeline = []
+    for event in events:
+        event = cacheable_event(event)
+        if event['type'] == 'session_started':
+            event['sessionId'] = session_id
+        elif event['type'] == 'expert_response':
+            await scheduler.release(len(timeline))
+            timing = scheduler.timing(len(timeline))
+            timing["round"] = event['round']
+            timing["expertId"] = event['expertId']
+            timeline.append(timing)
+            event['timing'] = timing
+        elif event['type'] == 'debate_complete':
+            event.update(
+                sessionId=session_id,
+                actor_id=actor_id,
+                session_id=session_id,
+                timeline=timeline,
+                promptCache=PromptCacheStats().snapshot(),
+                cached=True
+            )
+        yield event
+
+
+# Events that end a debate; they carry the same fields as the non-streaming response
+TERMINAL_EVENTS = ('debate_complete', 'error')
+
+
+def error_event(error: str, actor_id: str, session_id: Optional[str] = None, **fields) -> dict:
+    """Build a terminal error event."""
+    event = {
+        "type": "error",
+        "status": "error",
+        "error": error,
+        "actor_id": actor_id,
+        "session_id": session_id
+    }
+    event.update(fields)
+    return event
+
+
 @app.entrypoint
 async def debate_orchestrator(payload: dict, context: dict) -> dict:
     """
@@ -85,6 +613,21 @@ async def debate_orchestrator(payload: dict, context: dict) -> dict:
         payload: {
             "problem": str (optional) - Custom problem statement
             "problemId": str (optional) - Predefined problem ID
+            "parallelRound": bool (optional) - Invoke the experts of each round
+                concurrently against a shared snapshot of earlier rounds.
+                Defaults to the PARALLEL_ROUNDS environment variable.
+            "pacing": str (optional) - Turn pacing mode: "realtime" (paced on the
+                backend), "batch" (no pacing) or "client" (playback timestamps
+                in the response). Defaults to the TURN_PACING environment variable.
+            "stream": bool (optional) - Return an async generator of debate
+                events instead of a single response (see run_debate)
+            "cache": bool (optional) - Serve and store problemId debates in the
+                result cache. Defaults to true when RESULT_CACHE is enabled.
+            "speculativeSynthesis": bool (optional) - Draft the synthesis while
+                round 3 runs and refine it afterwards. Defaults to
+                SPECULATIVE_SYNTHESIS.
+            "audio": bool (optional) - Synthesize each turn with Amazon Polly
+                and set its audioUrl. Defaults to DEBATE_AUDIO.
         }
         context: AgentCore execution context
     
@@ -93,11 +636,80 @@ async def debate_orchestrator(payload: dict, context: dict) -> dict:
             "sessionId": str - Unique session identifier
             "synthesis": str - Final synthesized architecture
             "mermaidDiagram": str - Mermaid diagram code
+            "timeline": list - Per-turn timing from the turn scheduler
+            "promptCache": dict - Bedrock prompt-cache usage and hit rates
+            "cached": bool - Present and true when served from the result cache
             "status": "complete" | "error"
         }
+        or, when streaming, an async generator that AgentCore serves as
+        server-sent events.
     
     Validates: Requirements 1.4, 1.5, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 6.2
     """
+    if payload.get('stream'):
+        return run_debate(payload, stream_tokens=True)
+    
+    async for event in run_debate(payload):
+        if event['type'] in TERMINAL_EVENTS:
+            return {key: value for key, value in event.items() if key != 'type'}
+
+
+async def run_debate(payload: dict, stream_tokens: bool = False):
+    """
+    Run a debate and yield events as they are produced.
+    
+    Event types mirror the website's WebSocket messages:
+    - session_started: {sessionId}
+    - expert_speaking: {expertId, round} - a turn has started
+    - expert_response: {expertId, round, content, isComplete} - partial text
+      while streaming (isComplete=False), then the full turn with its timing
+      (and its audioUrl when audio is enabled)
+    - round_complete: {roundNumber}
+    - synthesis_partial: {content} - synthesis text delta
+    - synthesis_restarted: {} - a speculative synthesis failed after its
+      partials were sent; the following partials restart the synthesis
+    - mermaid_node: {id, label} - a diagram node, while the diagram streams
+    - mermaid_edge: {source, target, label} - a diagram edge, while it streams
+    - mermaid_ready: {diagram} - as soon as the diagram is complete
+    - debate_complete / error: terminal event carrying the full response fields
+    
+    When TRANSCRIPT_DIR is set, the debate's transcript is also written to
+    <TRANSCRIPT_DIR>/<sessionId>.jsonl (see transcripts.TranscriptRecorder).
+    
+    Args:
+        payload: The entrypoint payload (see debate_orchestrator)
+        stream_tokens: Stream expert and synthesis text token by token.
+            When False, each turn is produced by a single blocking call.
+    
+    Yields:
+        Event dictionaries with a "type" field
+    """
+    events = debate_events(payload, stream_tokens)
+    if transcript_recorder is not None:
+        # Recorded before audio is added: audio URLs may expire
+        problem_id = payload.get('problemId')
+        events = transcript_recorder.record(
+            events,
+            problem=payload.get('problem') or (get_problem_by_id(problem_id) if problem_id else None),
+            problemId=problem_id
+        )
+    if payload.get('audio', DEBATE_AUDIO):
+        # Each turn's audio is synthesized while it streams and the next expert
+        # is invoked; the complete turn is delivered once its audio URL is ready
+        events = turn_narrator.narrate(events, skip=lambda event: is_failed_turn(event['content']))
+    # Closing each wrapped generator in turn stops the debate when the client goes away
+    async with contextlib.aclosing(events):
+        async for event in events:
+            yield event
+
+
+async def debate_events(payload: dict, stream_tokens: bool):
+    """
+    Produce the events of run_debate, without turn audio.
+    
+    Turn audio is added outside the result cache, so cached debates never
+    carry audio URLs that may have expired.
+    """
     # Get problem from payload - either custom or by ID
     problem = payload.get('problem')
     problem_id = payload.get('problemId')
@@ -109,175 +721,327 @@ async def debate_orchestrator(payload: dict, context: dict) -> dict:
     if problem_id and not problem:
         problem = get_problem_by_id(problem_id)
         if not problem:
-            return {
-                "status": "error",
-                "error": f"Problem ID '{problem_id}' not found",
-                "actor_id": actor_id,
-                "session_id": None
-            }
+            yield error_event(f"Problem ID '{problem_id}' not found", actor_id)
+            return
     
     # Validate problem statement is non-empty (Requirement 1.4)
     if not problem or not problem.strip():
-        return {
-            "status": "error",
-            "error": "Problem statement cannot be empty",
-            "actor_id": actor_id,
-            "session_id": None
-        }
+        yield error_event("Problem statement cannot be empty", actor_id)
+        return
+    
+    # Resolve the turn scheduler before any work is done
+    try:
+        scheduler = get_scheduler(payload.get('pacing', TURN_PACING), TURN_SECONDS)
+    except ValueError as e:
+        yield error_event(str(e), actor_id)
+        return
+    
+    # Predefined problems are served from the result cache when possible
+    cache_key = None
+    if problem_id and result_cache is not None and payload.get('cache', True):
+        cache_key = debate_cache_key(problem, payload)
+        cached_events = await run_blocking(result_cache.get, cache_key)
+        if cached_events:
+            logger.info(f"Serving problem {problem_id} from result cache")
+            session_id = MemoryManager.new_session_id(problem)
+            async for event in replay_cached_debate(cached_events, scheduler, actor_id, session_id):
+                yield event
+            return
+    
+    live_debate = run_live_debate(problem, actor_id, scheduler, payload, stream_tokens)
+    async with contextlib.aclosing(live_debate):
+        if cache_key is None:
+            async for event in live_debate:
+                yield event
+            return
+        
+        # Record the complete events, without the requester's session and actor;
+        # partial text deltas are not replayed
+        recorded = []
+        async for event in live_debate:
+            if event['type'] != 'synthesis_partial' and event.get('isComplete', True):
+                recorded.append(cacheable_event(event))
+            if event['type'] == 'debate_complete':
+                # Store before the terminal event: consumers stop iterating after it
+                failed = any(
+                    e['type'] == 'expert_response' and is_failed_turn(e['content']) for e in recorded
+                )
+                if not failed:
+                    await run_blocking(result_cache.put, cache_key, recorded)
+            yield event
+
+
+async def run_live_debate(problem: str, actor_id: str, scheduler, payload: dict, stream_tokens: bool):
+    """
+    Run the debate rounds and synthesis for a validated problem.
     
+    Yields the events documented in run_debate.
+    """
     # Create session (Requirement 1.5)
     try:
         session_id = memory.create_session(problem, actor_id)
         logger.info(f"Created session {session_id} for actor {actor_id}")
     except Exception as e:
         logger.error(f"Failed to create session: {e}")
-        return {
-            "status": "error",
-            "error": f"Failed to create session: {str(e)}",
-            "actor_id": actor_id,
-            "session_id": None
-        }
+        yield error_event(f"Failed to create session: {str(e)}", actor_id)
+        return
+    
+    yield {"type": "session_started", "sessionId": session_id}
+    
+    # Parallel round mode: experts in a round share one context snapshot and run concurrently
+    parallel_round = payload.get('parallelRound', PARALLEL_ROUNDS)
     
     # Define expert agents in order (Requirement 2.2)
     agents = [jeff_barr_agent, swami_agent, werner_agent]
     
-    # Execute 3 rounds: 2 debate + 1 consensus (Requirement 2.1)
-    for round_num in range(1, 4):
-        # Round 3 is consensus, others are debate (Requirement 2.5)
-        round_type = "consensus" if round_num == 3 else "debate"
-        
-        # Invoke each expert sequentially (Requirement 2.2)
-        for agent in agents:
-            # Retrieve cumulative context before each expert invocation (Requirement 6.2)
-            try:
-                mem_context = memory.get_context(session_id=session_id, actor_id=agent.name)
-                # Handle empty context gracefully
-                if not mem_context or not mem_context.strip():
-                    mem_context = "[No previous context]"
-                    logger.info(f"No previous context for {agent.name} in session {session_id}")
-            except Exception as e:
-                logger.error(f"Error retrieving context for {agent.name}: {e}")
-                mem_context = "[Error retrieving context]"
+    # Turn timing is owned by the scheduler; the debate itself never sleeps
+    timeline = []
+    scheduler.start()
+    
+    # Prompt-cache usage of this debate, and the context each expert was last
+    # sent (by expert ID) so its next prompt can reuse that prefix from the cache
+    cache_stats = PromptCacheStats()
+    sent_contexts = {}
+    
+    # Speculative synthesis drafts from rounds 1-2 while the consensus round runs
+    speculative = payload.get('speculativeSynthesis', SPECULATIVE_SYNTHESIS)
+    speculation = None
+    consensus_turns = []
+    
+    # The speculative draft must not outlive the debate, whether it ends
+    # normally, raises or is closed by a disconnecting client
+    try:
+        # Execute 3 rounds: 2 debate + 1 consensus (Requirement 2.1)
+        for round_num in range(1, 4):
+            # Round 3 is consensus, others are debate (Requirement 2.5)
+            round_type = "consensus" if round_num == 3 else "debate"
             
-            # Build prompt with problem, round info, and context
-            if round_type == "consensus":
-                prompt = f"""Problem: {problem}
-
-Round {round_num} (CONSENSUS ROUND - work toward agreement)
-
-Previous discussion:
-{mem_context}
-
-Your response (keep to ~200 words):"""
+            if parallel_round:
+                # Snapshot the earlier rounds once for every expert before anyone speaks,
+                # then invoke all three concurrently on the executor
+                contexts = await asyncio.gather(*[
+                    run_blocking(get_expert_context, session_id, agent) for agent in agents
+                ])
+                prompts = [
+                    build_expert_prompt(problem, round_num, round_type, mem_context, sent_contexts.get(agent.name))
+                    for agent, mem_context in zip(agents, contexts)
+                ]
+                sent_contexts.update((agent.name, mem_context) for agent, mem_context in zip(agents, contexts))
+                logger.info(f"Invoking {len(agents)} agents concurrently for round {round_num}")
+                responses = await asyncio.gather(*[
+                    run_blocking(invoke_expert, agent, prompt, round_num, cache_stats)
+                    for agent, prompt in zip(agents, prompts)
+                ])
+                
+                # Store in the fixed expert order so memory reads back as sequential turns
+                for agent, response_text in zip(agents, responses):
+                    await scheduler.release(len(timeline))
+                    yield {"type": "expert_speaking", "expertId": agent.name, "round": round_num}
+                    await run_blocking(store_expert_response, session_id, agent, round_num, response_text)
+                    timeline.append(turn_timing(scheduler, len(timeline), round_num, agent))
+                    if round_num == 3:
+                        consensus_turns.append((agent.name, response_text))
+                    yield turn_complete_event(agent, round_num, response_text, timeline[-1])
             else:
-                prompt = f"""Problem: {problem}
-
-Round {round_num} ({round_type})
-
-Previous discussion:
-{mem_context}
-
-Your response (keep to ~200 words):"""
+                # Invoke each expert sequentially (Requirement 2.2)
+                for agent in agents:
+                    yield {"type": "expert_speaking", "expertId": agent.name, "round": round_num}
+                    
+                    # Retrieve cumulative context before each expert invocation (Requirement 6.2)
+                    mem_context = await run_blocking(get_expert_context, session_id, agent)
+                    
+                    # Build prompt with problem, round info, and context
+                    prompt = build_expert_prompt(
+                        problem, round_num, round_type, mem_context, sent_contexts.get(agent.name)
+                    )
+                    sent_contexts[agent.name] = mem_context
+                    
+                    # Invoke expert agent with correct pattern
+                    if stream_tokens:
+                        parts = []
+                        try:
+                            logger.info(f"Streaming agent {agent.name} for round {round_num}")
+                            async for delta in stream_agent_text(agent, prompt, cache_stats):
+                                parts.append(delta)
+                                yield {
+                                    "type": "expert_response",
+                                    "expertId": agent.name,
+                                    "round": round_num,
+                                    "content": delta,
+                                    "isComplete": False
+                                }
+                            response_text = "".join(parts)
+                        except (KeyError, TypeError, IndexError) as e:
+                            logger.error(f"Error extracting response from {agent.name}: {e}")
+                            response_text = f"[Agent {agent.name} failed to respond - invalid response structure]"
+                        except Exception as e:
+                            logger.error(f"Error invoking {agent.name}: {e}")
+                            response_text = f"[Agent {agent.name} failed to respond]"
+                    else:
+                        response_text = await run_blocking(invoke_expert, agent, prompt, round_num, cache_stats)
+                    
+                    # Speaking time (Requirement 2.3) is enforced by the scheduler: realtime
+                    # pacing holds the turn until its slot, other modes release immediately
+                    await scheduler.release(len(timeline))
+                    
+                    # Store response to AgentCore Memory (Requirement 2.3, 6.2)
+                    await run_blocking(store_expert_response, session_id, agent, round_num, response_text)
+                    timeline.append(turn_timing(scheduler, len(timeline), round_num, agent))
+                    if round_num == 3:
+                        consensus_turns.append((agent.name, response_text))
+                    yield turn_complete_event(agent, round_num, response_text, timeline[-1])
             
-            # Invoke expert agent with correct pattern
+            yield {"type": "round_complete", "roundNumber": round_num}
+            
+            if speculative and round_num == 2:
+                try:
+                    draft_context = await run_blocking(
+                        lambda: memory.get_full_context(session_id=session_id, actor_id=actor_id)
+                    )
+                    if not draft_context or not draft_context.strip():
+                        draft_context = "[No debate context available]"
+                    speculation = SpeculativeSynthesis(problem, draft_context, cache_stats)
+                    logger.info(f"Started speculative synthesis for session {session_id}")
+                except Exception as e:
+                    logger.error(f"Could not start speculative synthesis, will synthesize after round 3: {e}")
+        
+        # Queued responses must be persisted before the complete history is read back.
+        # A failed or timed-out flush is not fatal: queued responses stay buffered
+        # for retry and are still included in the context read below.
+        try:
+            await run_blocking(memory.flush, session_id, timeout=MEMORY_FLUSH_TIMEOUT)
+        except Exception as e:
+            logger.error(f"Error flushing memory for session {session_id}: {e}")
+        
+        # When streaming, the diagram is reported node by node and published as
+        # soon as its closing fence arrives
+        streamed_diagram = None
+        
+        # Finish the speculative draft and refine it with the consensus round
+        synthesis_text = None
+        if speculation is not None:
+            emitted = False
             try:
-                logger.info(f"Invoking agent {agent.name} for round {round_num}")
-                response = agent(prompt)
-                response_text = response.message['content'][0]['text']
-                logger.info(f"Agent {agent.name} responded successfully")
-            except (KeyError, TypeError, IndexError) as e:
-                logger.error(f"Error extracting response from {agent.name}: {e}")
-                response_text = f"[Agent {agent.name} failed to respond - invalid response structure]"
+                diagram_stream = MermaidStreamExtractor()
+                async for delta in speculation.draft_deltas():
+                    if stream_tokens:
+                        emitted = True
+                        yield {"type": "synthesis_partial", "content": delta}
+                        for event in diagram_stream.feed(delta):
+                            yield event
+                draft_text = "".join(speculation.draft_parts)
+                streamed_diagram = diagram_stream.diagram
+                
+                logger.info("Refining speculative synthesis with the consensus round")
+                update_parts = []
+                diagram_stream = MermaidStreamExtractor()
+                async for delta in speculation.refine(consensus_turns):
+                    if stream_tokens:
+                        if not update_parts:
+                            yield {"type": "synthesis_partial", "content": "\n\n"}
+                        yield {"type": "synthesis_partial", "content": delta}
+                        for event in diagram_stream.feed(delta):
+                            yield event
+                    update_parts.append(delta)
+                streamed_diagram = diagram_stream.diagram or streamed_diagram
+                update_text = "".join(update_parts)
+                
+                synthesis_text = f"{draft_text}\n\n{update_text}"
+                # An updated diagram in the delta supersedes the draft's
+                mermaid_diagram = extract_mermaid(update_text) or extract_mermaid(draft_text)
+                logger.info("Speculative synthesis completed successfully")
             except Exception as e:
-                logger.error(f"Error invoking {agent.name}: {e}")
-                response_text = f"[Agent {agent.name} failed to respond]"
-            
-            # Store response to AgentCore Memory (Requirement 2.3, 6.2)
+                logger.error(f"Speculative synthesis failed, falling back to full synthesis: {e}")
+                speculation.cancel()
+                synthesis_text = None
+                streamed_diagram = None
+                if emitted:
+                    yield {"type": "synthesis_restarted"}
+        
+        if synthesis_text is None:
+            # After all rounds complete, trigger Synthesis Agent (Requirement 2.6)
             try:
-                memory.store_response(
-                    session_id=session_id,
-                    actor_id=agent.name,
-                    round_num=round_num,
-                    content=response_text
+                full_context = await run_blocking(
+                    lambda: memory.get_full_context(session_id=session_id, actor_id=actor_id)
                 )
-                logger.info(f"Stored response for {agent.name} in round {round_num}")
-            except Exception as e:
-                logger.error(f"Error storing response for {agent.name}: {e}")
-                # Continue execution - memory failure shouldn't stop debate
+                # Handle empty context gracefully
+                if not full_context or not full_context.strip():
+                    logger.warning(f"No context retrieved for synthesis in session {session_id}")
+                    full_context = "[No debate context available]"
             
-            # Enforce 1-minute speaking time (Requirement 2.3)
-            # In production, this would be actual timing enforcement
-            # For now, we use a small delay to simulate sequential turns
-            await asyncio.sleep(1)  # Reduced for testing; production would be 60
-    
-    # After all rounds complete, trigger Synthesis Agent (Requirement 2.6)
-    try:
-        full_context = memory.get_full_context(session_id=session_id, actor_id=actor_id)
-        # Handle empty context gracefully
-        if not full_context or not full_context.strip():
-            logger.warning(f"No context retrieved for synthesis in session {session_id}")
-            full_context = "[No debate context available]"
-        
-        # Build synthesis prompt
-        synthesis_prompt = f"""You have observed a complete 3-round debate on the following problem:
-
-Problem: {problem}
-
-Complete debate transcript:
-{full_context}
-
-Please synthesize all three expert perspectives into a unified architecture proposal. Include:
-1. Architecture overview combining all viewpoints
-2. Core components and services
-3. A Mermaid diagram showing the architecture
-4. Key trade-offs between the different approaches
-
-Remember to honor:
-- Jeff's serverless and simplicity principles
-- Swami's speed-to-market and AI/ML focus
-- Werner's scale and distributed systems concerns"""
+                # Build synthesis prompt; the transcript is passed as its own content block
+                synthesis_prompt = build_synthesis_prompt(problem, full_context)
+            
+                logger.info("Invoking synthesis agent")
+                if stream_tokens:
+                    parts = []
+                    diagram_stream = MermaidStreamExtractor()
+                    async for delta in stream_agent_text(synthesis_agent, synthesis_prompt, cache_stats):
+                        parts.append(delta)
+                        yield {"type": "synthesis_partial", "content": delta}
+                        for event in diagram_stream.feed(delta):
+                            yield event
+                    synthesis_text = "".join(parts)
+                    streamed_diagram = diagram_stream.diagram
+                else:
+                    synthesis_result = await run_blocking(lambda: fresh_agent(synthesis_agent)(synthesis_prompt))
+                    cache_stats.record_result(synthesis_result)
+                    synthesis_text = synthesis_result.message['content'][0]['text']
+                logger.info("Synthesis agent completed successfully")
+            
+                # Extract Mermaid diagram from synthesis
+                mermaid_diagram = extract_mermaid(synthesis_text)
+                logger.info(f"Extracted Mermaid diagram: {len(mermaid_diagram)} characters")
+            
+            except (KeyError, TypeError, IndexError) as e:
+                logger.error(f"Error extracting synthesis response: {e}")
+                yield error_event(
+                    f"Synthesis failed - invalid response structure: {str(e)}",
+                    actor_id,
+                    session_id,
+                    sessionId=session_id,
+                    synthesis=None,
+                    mermaidDiagram=None
+                )
+                return
+            except Exception as e:
+                logger.error(f"Error during synthesis: {e}")
+                yield error_event(
+                    f"Synthesis failed: {str(e)}",
+                    actor_id,
+                    session_id,
+                    sessionId=session_id,
+                    synthesis=None,
+                    mermaidDiagram=None
+                )
+                return
         
-        logger.info("Invoking synthesis agent")
-        synthesis_result = synthesis_agent(synthesis_prompt)
-        synthesis_text = synthesis_result.message['content'][0]['text']
-        logger.info("Synthesis agent completed successfully")
+        if mermaid_diagram != streamed_diagram:
+            yield {"type": "mermaid_ready", "diagram": mermaid_diagram}
         
-        # Extract Mermaid diagram from synthesis
-        mermaid_diagram = extract_mermaid(synthesis_text)
-        logger.info(f"Extracted Mermaid diagram: {len(mermaid_diagram)} characters")
+        prompt_cache = cache_stats.snapshot()
+        prompt_cache_stats.merge(cache_stats)
+        logger.info(
+            f"Prompt cache for session {session_id}: hit rate {prompt_cache['hitRate']:.1%} of input tokens, "
+            f"{prompt_cache['cacheHits']}/{prompt_cache['calls']} calls; "
+            f"process total {prompt_cache_stats.snapshot()['hitRate']:.1%}"
+        )
         
-    except (KeyError, TypeError, IndexError) as e:
-        logger.error(f"Error extracting synthesis response: {e}")
-        return {
-            "status": "error",
-            "error": f"Synthesis failed - invalid response structure: {str(e)}",
-            "sessionId": session_id,
-            "actor_id": actor_id,
-            "session_id": session_id,
-            "synthesis": None,
-            "mermaidDiagram": None
-        }
-    except Exception as e:
-        logger.error(f"Error during synthesis: {e}")
-        return {
-            "status": "error",
-            "error": f"Synthesis failed: {str(e)}",
+        # Return final result with synthesis and Mermaid diagram
+        yield {
+            "type": "debate_complete",
             "sessionId": session_id,
             "actor_id": actor_id,
             "session_id": session_id,
-            "synthesis": None,
-            "mermaidDiagram": None
+            "synthesis": synthesis_text,
+            "mermaidDiagram": mermaid_diagram,
+            "timeline": timeline,
+            "promptCache": prompt_cache,
+            "status": "complete"
         }
-    
-    # Return final result with synthesis and Mermaid diagram
-    return {
-        "sessionId": session_id,
-        "actor_id": actor_id,
-        "session_id": session_id,
-        "synthesis": synthesis_text,
-        "mermaidDiagram": mermaid_diagram,
-        "status": "complete"
-    }
+    finally:
+        if speculation is not None:
+            speculation.cancel()
 
 if __name__ == "__main__":
     app.run()
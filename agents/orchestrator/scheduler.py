@@ -0,0 +1,140 @@
+"""Turn scheduling strategies for debate pacing.
+
+The orchestrator never sleeps to simulate speaking time. Instead it asks a
+TurnScheduler when a finished turn may be released and how that turn should be
+timestamped, so pacing can happen in real time on the backend, not at all, or
+on the client from the timestamps in the response.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+DEFAULT_TURN_SECONDS = 60.0
+
+
+class TurnScheduler:
+    """
+    Base scheduler: releases turns immediately and records generation times.
+
+    Subclasses override `release` to pace turns and `timing` to describe how a
+    client should play them back.
+    """
+
+    mode = "batch"
+
+    def __init__(self, turn_seconds: float = DEFAULT_TURN_SECONDS):
+        """
+        Initialize the scheduler.
+
+        Args:
+            turn_seconds: Speaking time allotted to each expert turn
+        """
+        self.turn_seconds = turn_seconds
+        self._started_at: Optional[float] = None
+
+    def start(self) -> None:
+        """Mark the start of the debate; all offsets are relative to this point."""
+        self._started_at = time.monotonic()
+
+    def elapsed(self) -> float:
+        """Seconds since `start` was called (0.0 before the debate starts)."""
+        if self._started_at is None:
+            return 0.0
+        return time.monotonic() - self._started_at
+
+    async def release(self, turn_index: int) -> None:
+        """
+        Wait until the given turn may be published.
+
+        Args:
+            turn_index: Zero-based index of the turn across the whole debate
+        """
+        return None
+
+    def timing(self, turn_index: int) -> dict:
+        """
+        Describe the timing of a released turn.
+
+        Args:
+            turn_index: Zero-based index of the turn across the whole debate
+
+        Returns:
+            Timing metadata to include with the turn in the response
+        """
+        return {
+            "turnIndex": turn_index,
+            "generatedAt": round(self.elapsed(), 3)
+        }
+
+
+class BatchScheduler(TurnScheduler):
+    """Zero-delay scheduler for offline and batch generation."""
+
+    mode = "batch"
+
+
+class ClientPacedScheduler(TurnScheduler):
+    """
+    Zero-delay scheduler that stamps each turn with its playback slot.
+
+    The client plays turn N at `playAt` seconds after the debate starts and
+    holds it for `duration` seconds, so the backend can return as soon as the
+    content is ready.
+    """
+
+    mode = "client"
+
+    def timing(self, turn_index: int) -> dict:
+        timing = super().timing(turn_index)
+        timing["playAt"] = turn_index * self.turn_seconds
+        timing["duration"] = self.turn_seconds
+        return timing
+
+
+class RealTimeScheduler(ClientPacedScheduler):
+    """
+    Real-time scheduler for the live UI.
+
+    Turn N is released no earlier than N * turn_seconds after the debate
+    started. Generation time counts toward the slot, so the orchestrator only
+    waits for whatever is left of it rather than sleeping a fixed amount.
+    """
+
+    mode = "realtime"
+
+    async def release(self, turn_index: int) -> None:
+        remaining = turn_index * self.turn_seconds - self.elapsed()
+        if remaining > 0:
+            logger.debug(f"Holding turn {turn_index} for {remaining:.2f}s")
+            await asyncio.sleep(remaining)
+
+
+SCHEDULERS = {
+    scheduler.mode: scheduler
+    for scheduler in (BatchScheduler, ClientPacedScheduler, RealTimeScheduler)
+}
+
+
+def get_scheduler(mode: str, turn_seconds: float = DEFAULT_TURN_SECONDS) -> TurnScheduler:
+    """
+    Create a scheduler for the given pacing mode.
+
+    Args:
+        mode: One of 'realtime', 'batch' or 'client'
+        turn_seconds: Speaking time allotted to each expert turn
+
+    Returns:
+        A new TurnScheduler instance
+
+    Raises:
+        ValueError: If the mode is not recognised
+    """
+    scheduler_cls = SCHEDULERS.get(mode)
+    if scheduler_cls is None:
+        raise ValueError(f"Unknown pacing mode '{mode}', expected one of {sorted(SCHEDULERS)}")
+    return scheduler_cls(turn_seconds=turn_seconds)
@@ -10,6 +10,8 @@ import sys
 from typing import List, Dict
 from dataclasses import dataclass
 
+from gateway import model_gateway, estimate_request_tokens
+
 
 @dataclass
 class Panelist:
@@ -60,12 +62,16 @@ class PanelDiscussion:
             ]
         }
         
-        response = self.bedrock.invoke_model(
-            modelId=self.model_id,
-            body=json.dumps(request_body)
-        )
-        
-        response_body = json.loads(response['body'].read())
+        reserved = estimate_request_tokens(request_body['messages'], system_prompt, request_body['max_tokens'])
+        with model_gateway.slot(self.model_id, reserved) as permit:
+            response = self.bedrock.invoke_model(
+                modelId=self.model_id,
+                body=json.dumps(request_body)
+            )
+            
+            response_body = json.loads(response['body'].read())
+            usage = response_body.get('usage', {})
+            permit.record_usage(usage.get('input_tokens', 0) + usage.get('output_tokens', 0))
         return response_body['content'][0]['text']
 
     def _format_discussion_context(self, round_num: int, round_name: str) -> str:
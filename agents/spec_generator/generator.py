@@ -6,7 +6,9 @@ from dataclasses import dataclass
 from typing import Optional
 
 from strands import Agent
-from strands.models import BedrockModel
+
+from agent_registry import agent_registry
+from gateway import GatewayBedrockModel
 
 from .parser import InputParser, ParsedArchitecture
 from .packager import ZipPackager, SpecPackage, PackageResult
@@ -22,10 +24,7 @@ class SpecResult:
     local_path: Optional[str] = None
 
 
-# Create the spec generator agent following existing patterns
-spec_generator_agent = Agent(
-    model=BedrockModel(model_id="us.anthropic.claude-sonnet-4-20250514-v1:0"),
-    system_prompt="""You are a Kiro spec generator that transforms synthesized architecture designs into structured specification documents.
+SPEC_GENERATOR_PROMPT = """You are a Kiro spec generator that transforms synthesized architecture designs into structured specification documents.
 
 Your task is to generate THREE separate markdown documents from the provided architecture synthesis:
 
@@ -61,10 +60,20 @@ IMPORTANT RULES:
 OUTPUT FORMAT:
 Return a JSON object with three keys: "requirements", "design", "tasks"
 Each value should be the complete markdown content for that document."""
-)
 
-# Set the agent name after initialization (following existing pattern)
-spec_generator_agent.name = "spec_generator"
+
+def build_spec_generator_agent() -> Agent:
+    """Build the spec generator agent, following the same pattern as the experts."""
+    agent = Agent(
+        model=GatewayBedrockModel(model_id="us.anthropic.claude-sonnet-4-20250514-v1:0"),
+        system_prompt=SPEC_GENERATOR_PROMPT
+    )
+    agent.name = "spec_generator"
+    return agent
+
+
+# Built on first use (or pre-warm) by the agent registry, not at import
+spec_generator_agent = agent_registry.register("spec_generator", build_spec_generator_agent)
 
 
 def generate_spec_package(
@@ -1,13 +1,14 @@
 """ZIP packager for bundling spec documents and uploading to S3."""
 
 import zipfile
-import boto3
 from io import BytesIO
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 import os
 
+from aws_clients import get_client
+
 
 @dataclass
 class SpecPackage:
@@ -37,7 +38,7 @@ class ZipPackager:
         Args:
             s3_bucket: S3 bucket name for uploads. If None, uses local storage.
         """
-        self.s3 = boto3.client('s3')
+        self.s3 = get_client('s3')
         self.bucket = s3_bucket or os.environ.get('SPEC_BUCKET', 'disagree-commit-specs')
     
     def package(self, spec: SpecPackage, session_id: str = "") -> PackageResult:
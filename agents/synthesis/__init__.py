@@ -1,4 +1,5 @@
 # Synthesis agent module
 from .synthesizer import synthesis_agent, extract_mermaid
+from .mermaid_stream import MermaidStreamExtractor, parse_mermaid_line
 
-__all__ = ["synthesis_agent", "extract_mermaid"]
+__all__ = ["synthesis_agent", "extract_mermaid", "MermaidStreamExtractor", "parse_mermaid_line"]
@@ -0,0 +1,220 @@
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+OPEN_FENCE = "```mermaid"
+CLOSE_FENCE = "```"
+
+# Diagram lines that declare no nodes or edges
+_DIRECTIVE = re.compile(
+    r"^(?:graph|flowchart|subgraph|end|direction|style|classDef|class|click|linkStyle|%%)\b"
+)
+
+# A node reference: an ID followed by an optional shape holding its label
+_NODE = re.compile(
+    r"\s*(?P<id>\w+)\s*"
+    r"(?P<shape>\(\(.*?\)\)|\(\[.*?\]\)|\[\[.*?\]\]|\[\(.*?\)\]|\{\{.*?\}\}"
+    r"|\[.*?\]|\(.*?\)|\{.*?\}|>.*?\])?"
+)
+
+# A link between nodes: `-->`, `---`, `-.->`, `==>`, `--x`, `--o`, with an
+# optional `-- text -->` or `-->|text|` label
+_LINK = re.compile(
+    r"\s*(?:(?:--|==|-\.)\s*(?P<text>[^|>\-=.][^|>]*?)\s*)?"
+    r"<?(?:-{2,}|={2,}|-\.+-)(?:>|[xo](?=[\s|]))?"
+    r"\s*(?:\|(?P<label>[^|]*)\|)?"
+)
+
+_AMPERSAND = re.compile(r"\s*&")
+
+_SHAPE_DELIMITERS = "[](){}>/\\\"' "
+
+
+def _node_label(shape: Optional[str]) -> Optional[str]:
+    if not shape:
+        return None
+    return shape.strip(_SHAPE_DELIMITERS) or None
+
+
+def parse_mermaid_line(line: str) -> Tuple[List[Tuple[str, Optional[str]]], List[Tuple[str, str, Optional[str]]]]:
+    """
+    Parse the nodes and edges declared on one line of a Mermaid flowchart.
+
+    Lines that are not node or link statements (the graph header, subgraph
+    markers, styling, comments) yield nothing, as do lines this simple parser
+    does not understand; the diagram itself is still extracted verbatim.
+
+    Args:
+        line: A single line of Mermaid source
+
+    Returns:
+        (nodes, edges) where nodes are (id, label) and edges are
+        (source, target, label); labels are None when absent
+
+    Example:
+        >>> parse_mermaid_line("  A[User] -->|HTTPS| B[API Gateway]")
+        ([('A', 'User'), ('B', 'API Gateway')], [('A', 'B', 'HTTPS')])
+    """
+    line = line.strip().rstrip(";")
+    if not line or _DIRECTIVE.match(line):
+        return [], []
+
+    nodes = []
+    edges = []
+    position = 0
+    previous: List[str] = []
+    link_label = None
+    while True:
+        # One group of nodes joined with `&`
+        group = []
+        while True:
+            match = _NODE.match(line, position)
+            if not match:
+                return nodes, edges
+            group.append(match.group("id"))
+            nodes.append((match.group("id"), _node_label(match.group("shape"))))
+            position = match.end()
+            joined = _AMPERSAND.match(line, position)
+            if not joined:
+                break
+            position = joined.end()
+
+        for source in previous:
+            for target in group:
+                edges.append((source, target, link_label))
+
+        link = _LINK.match(line, position)
+        if not link or link.end() == position:
+            return nodes, edges
+        label = link.group("label") or link.group("text")
+        link_label = label.strip() if label else None
+        position = link.end()
+        previous = group
+
+
+class MermaidStreamExtractor:
+    """
+    Incrementally extracts the Mermaid diagram from a streamed synthesis.
+
+    Feed the synthesis text deltas in order. While the ```mermaid block is
+    being generated, every completed diagram line is parsed and reported as
+    `mermaid_node` / `mermaid_edge` events so the diagram can be rendered
+    progressively; `mermaid_ready` is emitted as soon as the closing fence
+    arrives, without waiting for the rest of the synthesis. The final diagram
+    matches what extract_mermaid returns for the complete text.
+
+    Example:
+        >>> extractor = MermaidStreamExtractor()
+        >>> events = extractor.feed("```mermaid\\ngraph TD\\n  A-->")
+        >>> events += extractor.feed("B\\n```\\n## Trade-offs")
+        >>> [event["type"] for event in events]
+        ['mermaid_node', 'mermaid_node', 'mermaid_edge', 'mermaid_ready']
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._inside = False
+        self._lines: List[str] = []
+        self._nodes: Dict[str, Optional[str]] = {}
+        self._edges = set()
+        self.diagram: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the closing fence of the diagram has been seen."""
+        return self.diagram is not None
+
+    @property
+    def partial_diagram(self) -> str:
+        """The diagram lines received so far."""
+        return "\n".join(self._lines).strip()
+
+    def feed(self, delta: str) -> List[dict]:
+        """
+        Consume the next text delta.
+
+        Args:
+            delta: Synthesis text in generation order
+
+        Returns:
+            The events completed by this delta, in order
+        """
+        if self.done or not delta:
+            return []
+        self._buffer += delta
+        events = []
+        while not self.done:
+            if self._inside:
+                if not self._read_diagram_line(events):
+                    break
+            elif not self._find_open_fence():
+                break
+        return events
+
+    def close(self) -> List[dict]:
+        """
+        Finish the stream.
+
+        An unterminated block is not a diagram (as with extract_mermaid), so
+        no event is emitted for it; the last line is still parsed so its
+        nodes and edges are reported.
+        """
+        events = []
+        if self._inside and not self.done and self._buffer:
+            line, self._buffer = self._buffer, ""
+            if not line.startswith(CLOSE_FENCE):
+                self._add_line(line, events)
+        if self._inside and not self.done:
+            logger.warning("Mermaid block was not closed before the end of the stream")
+        return events
+
+    def _find_open_fence(self) -> bool:
+        start = self._buffer.find(OPEN_FENCE)
+        if start < 0:
+            # Keep a tail that could be the start of a fence split across deltas
+            self._buffer = self._buffer[-(len(OPEN_FENCE) - 1):]
+            return False
+        rest = self._buffer[start + len(OPEN_FENCE):]
+        stripped = rest.lstrip(" \t\r")
+        if not stripped:
+            self._buffer = self._buffer[start:]
+            return False
+        if stripped[0] != "\n":
+            # e.g. ```mermaidjs - keep looking after this marker
+            self._buffer = rest
+            return True
+        self._buffer = stripped[1:]
+        self._inside = True
+        return True
+
+    def _read_diagram_line(self, events: List[dict]) -> bool:
+        if self._buffer.startswith(CLOSE_FENCE):
+            self.diagram = self.partial_diagram
+            self._buffer = ""
+            logger.info(f"Streamed Mermaid diagram complete ({len(self.diagram)} characters)")
+            events.append({"type": "mermaid_ready", "diagram": self.diagram})
+            return True
+        end = self._buffer.find("\n")
+        if end < 0:
+            return False
+        line, self._buffer = self._buffer[:end], self._buffer[end + 1:]
+        self._add_line(line, events)
+        return True
+
+    def _add_line(self, line: str, events: List[dict]) -> None:
+        self._lines.append(line)
+        nodes, edges = parse_mermaid_line(line)
+        for node_id, label in nodes:
+            known = node_id in self._nodes
+            if known and (label is None or self._nodes[node_id] == label):
+                continue
+            self._nodes[node_id] = label if label is not None else self._nodes.get(node_id)
+            events.append({"type": "mermaid_node", "id": node_id, "label": label})
+        for source, target, label in edges:
+            if (source, target, label) in self._edges:
+                continue
+            self._edges.add((source, target, label))
+            events.append({"type": "mermaid_edge", "source": source, "target": target, "label": label})
@@ -1,20 +1,14 @@
 import re
 import logging
 from strands import Agent
-from strands.models.bedrock import BedrockModel
+from experts.prompt_cache import cacheable_system_prompt
+from agent_registry import agent_registry
+from gateway import GatewayBedrockModel
 
 # Get logger instance for this module
 logger = logging.getLogger(__name__)
 
-logger.info("Initializing synthesis agent")
-
-synthesis_agent = Agent(
-    model=BedrockModel(
-        model_id="us.anthropic.claude-sonnet-4-20250514-v1:0",
-        temperature=0.7,
-        max_tokens=2048
-    ),
-    system_prompt="""Synthesize expert debate into final architecture.
+SYNTHESIS_PROMPT = """Synthesize expert debate into final architecture.
 
 INPUT: All debate rounds from three experts
 OUTPUT: 
@@ -46,8 +40,26 @@ FORMAT:
 
 ## Trade-offs
 [Analysis of competing concerns]"""
-)
-synthesis_agent.name = "synthesis"
+
+
+def build_synthesis_agent() -> Agent:
+    """Build the synthesis agent."""
+    logger.info("Initializing synthesis agent")
+    agent = Agent(
+        model=GatewayBedrockModel(
+            model_id="us.anthropic.claude-sonnet-4-20250514-v1:0",
+            temperature=0.7,
+            max_tokens=2048
+        ),
+        # Cache point after the static instructions so repeated syntheses reuse them
+        system_prompt=cacheable_system_prompt(SYNTHESIS_PROMPT)
+    )
+    agent.name = "synthesis"
+    return agent
+
+
+# Built on first use (or pre-warm) by the agent registry, not at import
+synthesis_agent = agent_registry.register("synthesis", build_synthesis_agent)
 
 
 def extract_mermaid(synthesis_output: str) -> str:
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Test script for the streaming Mermaid extractor."""
+
+from synthesis.mermaid_stream import MermaidStreamExtractor, parse_mermaid_line
+from synthesis.synthesizer import extract_mermaid
+
+
+SYNTHESIS = """## Architecture Overview
+Some text here
+
+```mermaid
+graph TD
+  A[Client] -->|HTTPS| B[CloudFront]
+  B --> C[API Gateway]
+  C --> D[Lambda]
+  D --> E[(DynamoDB)] & F[S3]
+```
+
+## Trade-offs
+More text"""
+
+
+def stream(text, chunk_size):
+    """Feed text to a new extractor in fixed-size chunks and collect its events."""
+    extractor = MermaidStreamExtractor()
+    events = []
+    for start in range(0, len(text), chunk_size):
+        events += extractor.feed(text[start:start + chunk_size])
+    events += extractor.close()
+    return extractor, events
+
+
+def test_matches_extract_mermaid():
+    """Test the streamed diagram matches extract_mermaid for any chunking."""
+    for chunk_size in [1, 2, 3, 7, 16, len(SYNTHESIS)]:
+        extractor, events = stream(SYNTHESIS, chunk_size)
+        assert extractor.diagram == extract_mermaid(SYNTHESIS), f"Mismatch with chunk size {chunk_size}"
+        assert events[-1] == {"type": "mermaid_ready", "diagram": extract_mermaid(SYNTHESIS)}
+    print("✓ Test 1 passed: Streamed diagram matches extract_mermaid")
+
+
+def test_ready_before_stream_ends():
+    """Test mermaid_ready is emitted as soon as the closing fence arrives."""
+    extractor = MermaidStreamExtractor()
+    fence_end = SYNTHESIS.index("```\n\n## Trade-offs") + 3
+
+    events = extractor.feed(SYNTHESIS[:fence_end])
+    assert events[-1]["type"] == "mermaid_ready"
+    assert extractor.done
+    assert extractor.feed(SYNTHESIS[fence_end:]) == [], "Text after the diagram should produce no events"
+    print("✓ Test 2 passed: Diagram ready at the closing fence")
+
+
+def test_partial_node_and_edge_events():
+    """Test nodes and edges are reported line by line while the diagram streams."""
+    extractor = MermaidStreamExtractor()
+
+    events = extractor.feed("```mermaid\ngraph TD\n  A[Client] -->|HTTPS| B[Cloud")
+    assert events == [], "Incomplete lines should not be parsed"
+
+    events = extractor.feed("Front]\n  B --> C\n")
+    assert events == [
+        {"type": "mermaid_node", "id": "A", "label": "Client"},
+        {"type": "mermaid_node", "id": "B", "label": "CloudFront"},
+        {"type": "mermaid_edge", "source": "A", "target": "B", "label": "HTTPS"},
+        {"type": "mermaid_node", "id": "C", "label": None},
+        {"type": "mermaid_edge", "source": "B", "target": "C", "label": None},
+    ]
+    assert extractor.partial_diagram == "graph TD\n  A[Client] -->|HTTPS| B[CloudFront]\n  B --> C"
+
+    # A label defined later updates the node; repeats are not reported again
+    events = extractor.feed("  C[API Gateway] --> B\n  B --> C\n")
+    assert events == [
+        {"type": "mermaid_node", "id": "C", "label": "API Gateway"},
+        {"type": "mermaid_edge", "source": "C", "target": "B", "label": None},
+    ]
+    assert not extractor.done
+    print("✓ Test 3 passed: Node and edge events while streaming")
+
+
+def test_no_or_unterminated_block():
+    """Test that text without a complete block yields no diagram."""
+    extractor, events = stream("## Architecture Overview\nSome text without mermaid", 5)
+    assert events == [] and extractor.diagram is None
+
+    extractor, events = stream("```mermaid\ngraph TD\n  A --> B", 4)
+    assert extractor.diagram is None
+    assert [event["type"] for event in events] == ["mermaid_node", "mermaid_node", "mermaid_edge"]
+    print("✓ Test 4 passed: No diagram without a closing fence")
+
+
+def test_parse_mermaid_line():
+    """Test flowchart statements are parsed into nodes and edges."""
+    assert parse_mermaid_line("graph LR") == ([], [])
+    assert parse_mermaid_line("  style A fill:#f9f") == ([], [])
+    assert parse_mermaid_line("A -- replicates --> B") == (
+        [("A", None), ("B", None)], [("A", "B", "replicates")]
+    )
+    assert parse_mermaid_line("A -.-> B{Decision} ==> C((End));") == (
+        [("A", None), ("B", "Decision"), ("C", "End")], [("A", "B", None), ("B", "C", None)]
+    )
+    assert parse_mermaid_line("A & B --- C")[1] == [("A", "C", None), ("B", "C", None)]
+    print("✓ Test 5 passed: Mermaid statements parsed")
+
+
+if __name__ == "__main__":
+    test_matches_extract_mermaid()
+    test_ready_before_stream_ends()
+    test_partial_node_and_edge_events()
+    test_no_or_unterminated_block()
+    test_parse_mermaid_line()
+    print("\n✅ All tests passed!")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Unit tests for the panel audio script."""
+
+import io
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from audio import AudioPipeline, AudioSegment
+from generate_panel_audio import write_panel_files
+
+
+class EchoPolly:
+    """Polly client returning the request text as audio."""
+
+    def synthesize_speech(self, **request):
+        return {"AudioStream": io.BytesIO(request["Text"].encode())}
+
+
+def test_files_get_their_own_segment(tmp_path):
+    """Verify each file holds its whole segment when segments span several Polly requests."""
+    texts = [
+        " ".join(f"Jeff sentence {n} on serverless." for n in range(6)),
+        "Swami keeps it short.",
+        " ".join(f"Werner sentence {n} on failure." for n in range(6)),
+    ]
+    segments = [AudioSegment(text, "Matthew") for text in texts]
+    assert len(segments[0].chunks(60)) > 1, "Test needs multi-chunk segments"
+    filenames = [tmp_path / name for name in ("r1_jeff.mp3", "r1_swami.mp3", "r1_werner.mp3")]
+
+    with AudioPipeline(client=EchoPolly(), cache=None, max_chunk_chars=60) as pipeline:
+        write_panel_files(pipeline, segments, filenames)
+
+    for filename, segment in zip(filenames, segments):
+        expected = "".join(chunk.text for chunk in segment.chunks(60)).encode()
+        assert filename.read_bytes() == expected, f"{filename.name} got another segment's audio"
+    print("✓ Each panel file gets its own segment's audio")
+
+
+if __name__ == '__main__':
+    import tempfile
+    from pathlib import Path
+    with tempfile.TemporaryDirectory() as directory:
+        test_files_get_their_own_segment(Path(directory))
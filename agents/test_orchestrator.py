@@ -65,6 +65,11 @@ async def test_orchestrator_validation():
     result = await debate_orchestrator({}, {})
     assert result['status'] == 'error', "Should reject missing problem"
     
+    # Unknown pacing modes are rejected before a session is created
+    result = await debate_orchestrator({"problem": "Test problem", "pacing": "slow-motion"}, {})
+    assert result['status'] == 'error', "Should reject unknown pacing mode"
+    assert 'pacing' in result['error'].lower(), "Error should mention pacing"
+    
     print("✓ Input validation verified")
     print("  - Rejects empty problems")
     print("  - Rejects whitespace-only problems")
@@ -152,7 +157,8 @@ def test_requirements_coverage():
     print("✓ Requirement 2.5: Round 3 is consensus round")
     
     # Requirement 2.6: Trigger synthesis after rounds
-    assert 'synthesis_agent(' in code, "Should trigger synthesis agent with correct pattern"
+    assert 'fresh_agent(synthesis_agent)(synthesis_prompt)' in code, \
+        "Should trigger synthesis agent with correct pattern on a per-invocation copy"
     assert 'get_full_context' in code, "Should retrieve full context for synthesis"
     print("✓ Requirement 2.6: Triggers Synthesis Agent after all rounds")
     
@@ -230,6 +236,8 @@ async def test_agent_invocation_with_mocks():
         assert 'sessionId' in result, "Response missing sessionId"
         assert 'synthesis' in result, "Response missing synthesis"
         assert 'mermaidDiagram' in result, "Response missing mermaidDiagram"
+        assert len(result['timeline']) == 9, "Timeline should have one entry per turn"
+        assert [t['expertId'] for t in result['timeline'][:3]] == ["jeff_barr", "swami", "werner_vogels"]
         assert 'actor_id' in result, "Response missing actor_id"
         assert 'session_id' in result, "Response missing session_id"
         
@@ -548,6 +556,686 @@ async def test_response_structure_validation():
         print("  - Required fields present even on error")
 
 
+async def test_parallel_round_mode():
+    """Test parallel round mode invokes a round's experts concurrently and stores in fixed order."""
+    print("\nTesting parallel round mode...")
+    
+    import threading
+    
+    # All three experts of a round must be in flight at once to pass the barrier
+    barrier = threading.Barrier(3, timeout=5)
+    
+    def make_expert(text):
+        def respond(prompt):
+            barrier.wait()
+            response = Mock()
+            response.message = {'content': [{'text': text}]}
+            return response
+        return respond
+    
+    with patch('orchestrator.app.jeff_barr_agent') as mock_jeff, \
+         patch('orchestrator.app.swami_agent') as mock_swami, \
+         patch('orchestrator.app.werner_agent') as mock_werner, \
+         patch('orchestrator.app.synthesis_agent') as mock_synthesis, \
+         patch('orchestrator.app.memory') as mock_memory:
+        
+        mock_jeff.side_effect = make_expert('Jeff says')
+        mock_jeff.name = "jeff_barr"
+        mock_swami.side_effect = make_expert('Swami says')
+        mock_swami.name = "swami"
+        mock_werner.side_effect = make_expert('Werner says')
+        mock_werner.name = "werner_vogels"
+        
+        mock_synthesis_response = Mock()
+        mock_synthesis_response.message = {
+            'content': [
+                {'text': '## Architecture\nTest\n```mermaid\ngraph TD\n  A-->B\n```'}
+            ]
+        }
+        mock_synthesis.return_value = mock_synthesis_response
+        
+        mock_memory.create_session.return_value = "test_session_12345678901234567890123"
+        mock_memory.get_context.return_value = "Previous context"
+        mock_memory.get_full_context.return_value = "Context"
+        mock_memory.store_response.return_value = None
+        
+        result = await debate_orchestrator(
+            {"problem": "Test problem", "parallelRound": True},
+            {}
+        )
+        
+        assert result['status'] == 'complete', f"Expected complete status, got {result['status']}"
+        assert mock_jeff.call_count == 3, "Jeff should be called 3 times"
+        assert mock_swami.call_count == 3, "Swami should be called 3 times"
+        assert mock_werner.call_count == 3, "Werner should be called 3 times"
+        
+        # Context snapshot is still taken once per expert turn
+        assert mock_memory.get_context.call_count == 9, "get_context should be called 9 times"
+        
+        # Responses are stored in the fixed expert order within each round
+        stored = [
+            (call.kwargs['round_num'], call.kwargs['actor_id'], call.kwargs['content'])
+            for call in mock_memory.store_response.call_args_list
+        ]
+        expected = [
+            (round_num, actor, text)
+            for round_num in range(1, 4)
+            for actor, text in [
+                ("jeff_barr", "Jeff says"),
+                ("swami", "Swami says"),
+                ("werner_vogels", "Werner says")
+            ]
+        ]
+        assert stored == expected, f"Responses stored out of order: {stored}"
+        
+        print("✓ Parallel round mode verified")
+        print("  - Experts within a round invoked concurrently")
+        print("  - Responses stored in fixed order (jeff, swami, werner)")
+
+
+async def test_streaming_mode():
+    """Test stream mode yields turn, round, synthesis and mermaid events as they happen."""
+    print("\nTesting streaming mode...")
+    
+    mock_response = Mock()
+    mock_response.message = {'content': [{'text': 'Streamed expert response'}]}
+    
+    with patch('orchestrator.app.jeff_barr_agent') as mock_jeff, \
+         patch('orchestrator.app.swami_agent') as mock_swami, \
+         patch('orchestrator.app.werner_agent') as mock_werner, \
+         patch('orchestrator.app.synthesis_agent') as mock_synthesis, \
+         patch('orchestrator.app.memory') as mock_memory:
+        
+        mock_jeff.return_value = mock_response
+        mock_jeff.name = "jeff_barr"
+        mock_swami.return_value = mock_response
+        mock_swami.name = "swami"
+        mock_werner.return_value = mock_response
+        mock_werner.name = "werner_vogels"
+        
+        mock_synthesis_response = Mock()
+        mock_synthesis_response.message = {
+            'content': [
+                {'text': '## Architecture\nTest\n```mermaid\ngraph TD\n  A-->B\n```'}
+            ]
+        }
+        mock_synthesis.return_value = mock_synthesis_response
+        
+        mock_memory.create_session.return_value = "test_session_12345678901234567890123"
+        mock_memory.get_context.return_value = ""
+        mock_memory.get_full_context.return_value = "Context"
+        mock_memory.store_response.return_value = None
+        
+        stream = await debate_orchestrator({"problem": "Test problem", "stream": True}, {})
+        assert hasattr(stream, '__aiter__'), "Stream mode should return an async generator"
+        
+        events = [event async for event in stream]
+        types = [event['type'] for event in events]
+        
+        # The first turn starts right after the session is created
+        assert types[:2] == ['session_started', 'expert_speaking'], f"Unexpected event order: {types[:2]}"
+        assert events[1]['expertId'] == 'jeff_barr'
+        
+        # Each turn: started, partial text, complete
+        assert types.count('expert_speaking') == 9, "Should announce 9 turns"
+        partials = [e for e in events if e['type'] == 'expert_response' and not e['isComplete']]
+        completes = [e for e in events if e['type'] == 'expert_response' and e['isComplete']]
+        assert len(partials) == 9 and len(completes) == 9, "Each turn should stream and complete"
+        assert completes[0]['content'] == 'Streamed expert response'
+        assert 'timing' in completes[0], "Completed turns should carry their timing"
+        
+        assert [e['roundNumber'] for e in events if e['type'] == 'round_complete'] == [1, 2, 3]
+        assert 'synthesis_partial' in types, "Synthesis should stream"
+        assert types.index('mermaid_ready') < types.index('debate_complete')
+        assert events[types.index('mermaid_ready')]['diagram'] == 'graph TD\n  A-->B'
+        assert types.count('mermaid_ready') == 1, "The streamed diagram should be published once"
+        assert [(e['source'], e['target']) for e in events if e['type'] == 'mermaid_edge'] == [('A', 'B')]
+        assert types.index('mermaid_node') < types.index('mermaid_ready'), "Nodes should stream before the diagram"
+        
+        # The terminal event carries the full response
+        final = events[-1]
+        assert final['type'] == 'debate_complete'
+        assert final['status'] == 'complete'
+        assert final['mermaidDiagram'] == 'graph TD\n  A-->B'
+        
+        print("✓ Streaming mode verified")
+        print("  - Turn started / partial / complete events per expert")
+        print("  - Synthesis partials and mermaid_ready before debate_complete")
+        print("  - Diagram nodes and edges streamed as they are generated")
+    
+    # Validation errors are streamed as a single terminal event
+    stream = await debate_orchestrator({"problem": "", "stream": True}, {})
+    events = [event async for event in stream]
+    assert len(events) == 1 and events[0]['type'] == 'error', "Should stream a single error event"
+    print("✓ Streaming validation errors verified")
+
+
+async def test_stream_agent_text_yields_tokens():
+    """Test Strands agents are streamed token by token on a per-invocation copy."""
+    print("\nTesting token streaming from Strands agents...")
+    
+    from strands import Agent
+    from strands.models import BedrockModel
+    from orchestrator.app import stream_agent_text
+    
+    template = Agent(
+        model=BedrockModel(model_id="us.anthropic.claude-sonnet-4-20250514-v1:0", region_name="us-east-1"),
+        system_prompt="You are a test expert.",
+        name="test_expert"
+    )
+    invoked_on = []
+    
+    async def fake_stream_async(self, prompt, **kwargs):
+        invoked_on.append(self)
+        for token in ["Hello", ", ", "Mars"]:
+            yield {"data": token}
+        yield {"result": Mock()}
+    
+    with patch.object(Agent, 'stream_async', fake_stream_async):
+        deltas = [delta async for delta in stream_agent_text(template, "prompt")]
+    
+    assert deltas == ["Hello", ", ", "Mars"], f"Unexpected deltas: {deltas}"
+    assert invoked_on and invoked_on[0] is not template, "Should stream on a per-invocation copy"
+    print("✓ Token streaming verified")
+
+
+async def test_result_cache_serves_problem_id():
+    """Test predefined problems are served from the result cache after the first debate."""
+    print("\nTesting result cache for predefined problems...")
+    
+    import time
+    from cache import DebateResultCache, MemoryBackend
+    from orchestrator.app import debate_cache_key, get_problem_by_id
+    
+    result_cache = DebateResultCache(MemoryBackend())
+    mock_response = Mock()
+    mock_response.message = {'content': [{'text': 'Mocked expert response'}]}
+    mock_synthesis_response = Mock()
+    mock_synthesis_response.message = {'content': [{'text': '## Architecture\n```mermaid\ngraph TD\n  A-->B\n```'}]}
+    
+    with patch('orchestrator.app.jeff_barr_agent') as mock_jeff, \
+         patch('orchestrator.app.swami_agent') as mock_swami, \
+         patch('orchestrator.app.werner_agent') as mock_werner, \
+         patch('orchestrator.app.synthesis_agent') as mock_synthesis, \
+         patch('orchestrator.app.memory') as mock_memory, \
+         patch('orchestrator.app.result_cache', result_cache):
+        
+        for mock_agent, name in [(mock_jeff, "jeff_barr"), (mock_swami, "swami"), (mock_werner, "werner_vogels")]:
+            mock_agent.return_value = mock_response
+            mock_agent.name = name
+        mock_synthesis.return_value = mock_synthesis_response
+        mock_memory.create_session.return_value = "test_session_12345678901234567890123"
+        mock_memory.get_context.return_value = "Previous context"
+        mock_memory.get_full_context.return_value = "Full debate context"
+        
+        live = await debate_orchestrator(
+            {"problemId": "mars_currency", "pacing": "batch", "actor_id": "alice"}, {}
+        )
+        assert live['status'] == 'complete'
+        assert 'cached' not in live, "First debate should run live"
+        assert mock_jeff.call_count == 3
+        
+        cached = await debate_orchestrator(
+            {"problemId": "mars_currency", "pacing": "client", "actor_id": "bob"}, {}
+        )
+        assert cached['cached'] is True, "Second debate should be served from the cache"
+        assert cached['actor_id'] == "bob", "Replays belong to the current requester"
+        assert cached['sessionId'] == cached['session_id'] != live['sessionId']
+        assert cached['promptCache']['calls'] == 0
+        assert cached['synthesis'] == live['synthesis']
+        assert cached['mermaidDiagram'] == live['mermaidDiagram']
+        assert [t['expertId'] for t in cached['timeline']] == [t['expertId'] for t in live['timeline']]
+        assert cached['timeline'][4]['playAt'] == 240, "Replayed turns should be re-timed by the scheduler"
+        assert mock_jeff.call_count == 3, "Cached debates should not invoke the agents"
+        assert mock_memory.create_session.call_count == 1
+        
+        # Realtime pacing replays the cached turns at their speaking slots
+        with patch('orchestrator.app.TURN_SECONDS', 0.02):
+            started = time.monotonic()
+            replay = await debate_orchestrator({"problemId": "mars_currency", "pacing": "realtime"}, {})
+            assert time.monotonic() - started >= 8 * 0.02
+        assert replay['cached'] is True
+        
+        # Caching can be bypassed per request, and custom problems are never cached
+        bypass = await debate_orchestrator({"problemId": "mars_currency", "pacing": "batch", "cache": False}, {})
+        assert 'cached' not in bypass and mock_jeff.call_count == 6
+        custom = await debate_orchestrator({"problem": "Custom problem", "pacing": "batch"}, {})
+        assert 'cached' not in custom
+        
+        # Debates run with other settings are cached separately
+        parallel = await debate_orchestrator({"problemId": "mars_currency", "pacing": "batch", "parallelRound": True}, {})
+        assert 'cached' not in parallel and mock_jeff.call_count == 12
+        with patch('orchestrator.app.CONTEXT_MAX_TOKENS', 1000):
+            budgeted = await debate_orchestrator({"problemId": "mars_currency", "pacing": "batch"}, {})
+        assert 'cached' not in budgeted and mock_jeff.call_count == 15
+        assert (await debate_orchestrator({"problemId": "mars_currency", "pacing": "batch", "parallelRound": True}, {}))['cached']
+        speculative = await debate_orchestrator(
+            {"problemId": "mars_currency", "pacing": "batch", "speculativeSynthesis": True}, {}
+        )
+        assert 'cached' not in speculative and mock_jeff.call_count == 18
+    
+        # Stored events carry nothing of the request that ran the debate
+        stored = result_cache.get(debate_cache_key(get_problem_by_id("mars_currency")))
+        assert stored and all('actor_id' not in e and 'sessionId' not in e and 'promptCache' not in e for e in stored)
+    
+    print("✓ Result cache verified")
+    print("  - Cache hit skips all model and memory calls")
+    print("  - Replayed turns are paced by the turn scheduler")
+    print("  - Round mode, speculative synthesis and context budget are part of the key")
+
+
+async def test_speculative_synthesis():
+    """Test synthesis is drafted during round 3 and refined with a delta pass."""
+    print("\nTesting speculative synthesis...")
+    
+    import time
+    
+    completed_turns = []
+    synthesis_calls = []
+    
+    def expert_call(prompt):
+        time.sleep(0.05)
+        completed_turns.append(prompt)
+        response = Mock()
+        response.message = {'content': [{'text': f'Expert turn {len(completed_turns)}'}]}
+        return response
+    
+    def synthesis_call(prompt):
+        synthesis_calls.append((len(completed_turns), "".join(block.get("text", "") for block in prompt)))
+        response = Mock()
+        if len(synthesis_calls) == 1:
+            response.message = {'content': [{'text': '## Draft\n```mermaid\ngraph TD\n  A-->B\n```'}]}
+        else:
+            response.message = {'content': [{'text': '## Consensus Updates\n- Agreed on B'}]}
+        return response
+    
+    with patch('orchestrator.app.jeff_barr_agent') as mock_jeff, \
+         patch('orchestrator.app.swami_agent') as mock_swami, \
+         patch('orchestrator.app.werner_agent') as mock_werner, \
+         patch('orchestrator.app.synthesis_agent') as mock_synthesis, \
+         patch('orchestrator.app.memory') as mock_memory:
+        
+        for mock_agent, name in [(mock_jeff, "jeff_barr"), (mock_swami, "swami"), (mock_werner, "werner_vogels")]:
+            mock_agent.side_effect = expert_call
+            mock_agent.name = name
+        mock_synthesis.side_effect = synthesis_call
+        mock_memory.create_session.return_value = "test_session_12345678901234567890123"
+        mock_memory.get_context.return_value = "Previous context"
+        mock_memory.get_full_context.return_value = "Rounds 1-2 context"
+        
+        result = await debate_orchestrator(
+            {"problem": "Speculative problem", "pacing": "batch", "speculativeSynthesis": True}, {}
+        )
+        
+        assert result['status'] == 'complete'
+        assert len(synthesis_calls) == 2, "Should run one draft and one delta pass"
+        assert synthesis_calls[0][0] < 9, "Draft should start before the consensus round finishes"
+        assert "Expert turn 9" in synthesis_calls[1][1], "Delta pass should see the consensus turns"
+        for name in ("Jeff Barr: ", "Swami Sivasubramanian: ", "Werner Vogels: "):
+            assert name in synthesis_calls[1][1], "Consensus turns should be labeled by expert"
+        assert "## Draft" in synthesis_calls[1][1], "Delta pass should see the draft"
+        assert result['synthesis'].startswith('## Draft')
+        assert result['synthesis'].endswith('## Consensus Updates\n- Agreed on B')
+        assert result['mermaidDiagram'] == 'graph TD\n  A-->B', "Draft diagram should be kept"
+        
+        # A failed speculative pass falls back to the regular synthesis
+        synthesis_calls.clear()
+        completed_turns.clear()
+        fallback_response = Mock()
+        fallback_response.message = {'content': [{'text': 'Full synthesis'}]}
+        mock_synthesis.side_effect = [RuntimeError("Throttled"), fallback_response]
+        
+        result = await debate_orchestrator(
+            {"problem": "Speculative problem", "pacing": "batch", "speculativeSynthesis": True}, {}
+        )
+        assert result['status'] == 'complete'
+        assert result['synthesis'] == 'Full synthesis'
+        assert mock_synthesis.call_count == 4
+    
+    print("✓ Speculative synthesis verified")
+    print("  - Draft overlaps the consensus round")
+    print("  - Delta pass appends consensus updates; failures fall back to full synthesis")
+
+
+async def test_speculative_synthesis_cancelled_on_disconnect():
+    """Test the speculative draft is cancelled when a streaming client goes away mid-debate."""
+    print("\nTesting speculative synthesis cleanup...")
+    
+    import threading
+    from orchestrator import app
+    
+    release = threading.Event()
+    drafts = []
+    
+    class RecordingSpeculation(app.SpeculativeSynthesis):
+        def __init__(self, *args):
+            super().__init__(*args)
+            drafts.append(self)
+    
+    def expert_call(prompt):
+        response = Mock()
+        response.message = {'content': [{'text': 'Expert turn'}]}
+        return response
+    
+    def slow_draft(prompt):
+        release.wait(5)
+        return Mock(message={'content': [{'text': 'Draft'}]})
+    
+    with patch('orchestrator.app.jeff_barr_agent') as mock_jeff, \
+         patch('orchestrator.app.swami_agent') as mock_swami, \
+         patch('orchestrator.app.werner_agent') as mock_werner, \
+         patch('orchestrator.app.synthesis_agent') as mock_synthesis, \
+         patch('orchestrator.app.memory') as mock_memory, \
+         patch('orchestrator.app.SpeculativeSynthesis', RecordingSpeculation):
+        
+        for mock_agent, name in [(mock_jeff, "jeff_barr"), (mock_swami, "swami"), (mock_werner, "werner_vogels")]:
+            mock_agent.side_effect = expert_call
+            mock_agent.name = name
+        mock_synthesis.side_effect = slow_draft
+        mock_memory.create_session.return_value = "test_session_12345678901234567890123"
+        mock_memory.get_context.return_value = "Previous context"
+        mock_memory.get_full_context.return_value = "Rounds 1-2 context"
+        
+        events = await debate_orchestrator(
+            {"problem": "Speculative problem", "pacing": "batch", "speculativeSynthesis": True, "stream": True}, {}
+        )
+        try:
+            async for event in events:
+                if event['type'] == 'expert_speaking' and event['round'] == 3:
+                    break
+            await events.aclose()
+            await asyncio.sleep(0)
+            assert len(drafts) == 1 and drafts[0]._task.cancelled(), "Draft should be cancelled"
+        finally:
+            release.set()
+    
+    print("✓ Speculative draft cancelled when the client disconnects")
+
+
+async def test_turn_audio():
+    """Test each turn's audio is synthesized while the next expert is invoked."""
+    print("\nTesting per-turn audio...")
+    
+    import time
+    from orchestrator.app import turn_narrator
+    
+    call_started = []
+    
+    def expert_call(prompt):
+        call_started.append(time.monotonic())
+        time.sleep(0.05)
+        response = Mock()
+        response.message = {'content': [{'text': f'Expert turn {len(call_started)}'}]}
+        return response
+    
+    async def synthesize_async(segment):
+        await asyncio.sleep(0.05)
+        return segment.text.encode()
+    
+    store = Mock()
+    store.publish.side_effect = lambda key, audio: f"https://audio.example.com/{audio.decode()}"
+    
+    with patch('orchestrator.app.jeff_barr_agent') as mock_jeff, \
+         patch('orchestrator.app.swami_agent') as mock_swami, \
+         patch('orchestrator.app.werner_agent') as mock_werner, \
+         patch('orchestrator.app.synthesis_agent') as mock_synthesis, \
+         patch('orchestrator.app.memory') as mock_memory, \
+         patch.object(turn_narrator.pipeline, 'synthesize_async', synthesize_async), \
+         patch.object(turn_narrator, 'store', store):
+        
+        for mock_agent, name in [(mock_jeff, "jeff_barr"), (mock_swami, "swami"), (mock_werner, "werner_vogels")]:
+            mock_agent.side_effect = expert_call
+            mock_agent.name = name
+        mock_synthesis_response = Mock()
+        mock_synthesis_response.message = {'content': [{'text': 'Synthesis'}]}
+        mock_synthesis.return_value = mock_synthesis_response
+        mock_memory.create_session.return_value = "test_session_12345678901234567890123"
+        mock_memory.get_context.return_value = ""
+        mock_memory.get_full_context.return_value = "Context"
+        
+        stream = await debate_orchestrator(
+            {"problem": "Audio problem", "pacing": "batch", "stream": True, "audio": True}, {}
+        )
+        events = []
+        delivered = []
+        async for event in stream:
+            events.append(event)
+            if event['type'] == 'expert_response' and event['isComplete']:
+                delivered.append(time.monotonic())
+        
+        turns = [e for e in events if e['type'] == 'expert_response' and e['isComplete']]
+        assert len(turns) == 9
+        assert [e['audioUrl'] for e in turns] == [f"https://audio.example.com/Expert turn {n}" for n in range(1, 10)]
+        # Turn N is delivered after its audio, which overlaps the model call of turn N+1
+        assert all(call_started[n + 1] < delivered[n] for n in range(8)), "Audio should overlap the next turn"
+        assert events[-1]['type'] == 'debate_complete'
+        
+        # Audio is off unless requested
+        result = await debate_orchestrator({"problem": "Audio problem", "pacing": "batch"}, {})
+        assert result['status'] == 'complete'
+        assert store.publish.call_count == 9
+    
+    print("✓ Per-turn audio verified")
+    print("  - Each turn carries its audioUrl")
+    print("  - Synthesis overlaps the next expert's model call")
+
+
+def answering_agents():
+    """Stand-in for fresh_agent: each of the registry's real agents answers with its name and turn count."""
+    turns = {}
+    
+    def answer_as(agent):
+        def respond(prompt):
+            turns[agent.name] = turns.get(agent.name, 0) + 1
+            return Mock(message={'content': [{'text': f"{agent.name} turn {turns[agent.name]}"}]})
+        return respond
+    return answer_as
+
+
+async def test_turn_audio_uses_expert_voices():
+    """Test narration of a debate run with the real expert agents picks each expert's own voice."""
+    print("\nTesting expert voices...")
+    
+    from audio.narration import EXPERT_VOICES
+    from orchestrator.app import run_debate, turn_narrator
+    
+    async def synthesize_async(segment):
+        return segment.voice_id.encode()
+    
+    store = Mock()
+    store.publish.side_effect = lambda key, audio: audio.decode()
+    
+    with patch('orchestrator.app.fresh_agent', side_effect=answering_agents()), \
+         patch('orchestrator.app.memory') as mock_memory, \
+         patch.object(turn_narrator.pipeline, 'synthesize_async', synthesize_async), \
+         patch.object(turn_narrator, 'store', store):
+        
+        mock_memory.create_session.return_value = "test_session_12345678901234567890123"
+        mock_memory.get_context.return_value = ""
+        mock_memory.get_full_context.return_value = "Context"
+        
+        events = [event async for event in run_debate({"problem": "Audio problem", "pacing": "batch", "audio": True})]
+        turns = [e for e in events if e['type'] == 'expert_response']
+        assert [e['expertId'] for e in turns[:3]] == ["jeff_barr", "swami", "werner_vogels"]
+        assert all(e['audioUrl'] == EXPERT_VOICES[e['expertId']][0] for e in turns), \
+            "Every turn should be voiced by its own expert's voice"
+    
+    print("✓ Each expert narrated in its own voice")
+
+
+async def test_transcript_export():
+    """Test the orchestrator writes a JSON Lines transcript as turns complete."""
+    print("\nTesting transcript export...")
+    
+    import tempfile
+    from transcripts import TranscriptRecorder, read_transcript
+    
+    with tempfile.TemporaryDirectory() as directory, \
+         patch('orchestrator.app.transcript_recorder', TranscriptRecorder(directory)) as recorder, \
+         patch('orchestrator.app.jeff_barr_agent') as mock_jeff, \
+         patch('orchestrator.app.swami_agent') as mock_swami, \
+         patch('orchestrator.app.werner_agent') as mock_werner, \
+         patch('orchestrator.app.synthesis_agent') as mock_synthesis, \
+         patch('orchestrator.app.memory') as mock_memory:
+        
+        for mock_agent, name in [(mock_jeff, "jeff_barr"), (mock_swami, "swami"), (mock_werner, "werner_vogels")]:
+            mock_response = Mock()
+            mock_response.message = {'content': [{'text': f'{name} response'}]}
+            mock_agent.return_value = mock_response
+            mock_agent.name = name
+        mock_synthesis_response = Mock()
+        mock_synthesis_response.message = {'content': [{'text': 'Synthesis'}]}
+        mock_synthesis.return_value = mock_synthesis_response
+        mock_memory.create_session.return_value = "test_session_12345678901234567890123"
+        mock_memory.get_context.return_value = ""
+        mock_memory.get_full_context.return_value = "Context"
+        
+        stream = await debate_orchestrator({"problem": "Transcript problem", "pacing": "batch", "stream": True}, {})
+        path = recorder.path("test_session_12345678901234567890123")
+        turns_on_disk = []
+        async for event in stream:
+            if event['type'] == 'expert_response' and event['isComplete']:
+                turns_on_disk.append(sum(1 for record in read_transcript(path) if record['type'] == 'turn'))
+        
+        assert turns_on_disk == list(range(1, 10)), "Each turn is written before it is delivered"
+        records = list(read_transcript(path))
+        assert records[0]['problem'] == "Transcript problem"
+        turns = [record for record in records if record['type'] == 'turn']
+        assert [(turn['round'], turn['speaker']) for turn in turns[:3]] == [
+            (1, "jeff_barr"), (1, "swami"), (1, "werner_vogels")
+        ]
+        assert all(turn['tokens'] > 0 and 'durationMs' in turn for turn in turns)
+        assert [record['type'] for record in records[-2:]] == ['synthesis', 'end']
+        assert records[-1]['status'] == 'complete'
+    
+    print("✓ Transcript export verified")
+    print("  - One record per turn, written as it completes")
+    print("  - Synthesis and end records close the transcript")
+
+
+async def test_transcript_feeds_audio_scripts():
+    """Test a transcript recorded from the real expert agents is indexed by expert ID downstream."""
+    print("\nTesting transcript round trip...")
+    
+    import tempfile
+    from audio import Transcript
+    from orchestrator.app import run_debate
+    from transcripts import TranscriptRecorder
+    
+    with tempfile.TemporaryDirectory() as directory, \
+         patch('orchestrator.app.transcript_recorder', TranscriptRecorder(directory)) as recorder, \
+         patch('orchestrator.app.fresh_agent', side_effect=answering_agents()), \
+         patch('orchestrator.app.memory') as mock_memory:
+        
+        mock_memory.create_session.return_value = "test_session_12345678901234567890123"
+        mock_memory.get_context.return_value = ""
+        mock_memory.get_full_context.return_value = "Context"
+        
+        events = [event async for event in run_debate({"problem": "Transcript problem", "pacing": "batch"})]
+        assert events[-1]['type'] == 'debate_complete'
+        
+        transcript = Transcript.load(recorder.path("test_session_12345678901234567890123"))
+        assert transcript.round_numbers() == [1, 2, 3]
+        for round_num in (1, 2, 3):
+            assert set(transcript.rounds[round_num].by_speaker) == {"jeff_barr", "swami", "werner_vogels"}
+            for expert in ("jeff_barr", "swami", "werner_vogels"):
+                assert transcript.turn(round_num, expert) == f"{expert} turn {round_num}"
+    
+    print("✓ Recorded transcript is read back by expert ID")
+
+
+def test_debate_model_calls():
+    """Test the per-model call plan used to budget batch rate limits."""
+    print("\nTesting debate model call plan...")
+    
+    from orchestrator.app import debate_model_calls
+    
+    assert sum(debate_model_calls({"problem": "p"}).values()) == 10, "9 expert turns and 1 synthesis"
+    assert sum(debate_model_calls({"problem": "p", "speculativeSynthesis": True}).values()) == 11
+    print("✓ Debate model call plan verified")
+
+
+def test_expert_prompt_blocks():
+    """Test expert prompts put the stable prefix first, each part followed by a cache point."""
+    print("\nTesting expert prompt content blocks...")
+    
+    from orchestrator.app import build_expert_prompt
+    
+    context = "Jeff round 1\n\nSwami round 1"
+    prompt = build_expert_prompt("Mars currency", 2, "debate", context)
+    
+    assert [list(block) for block in prompt] == [["text"], ["cachePoint"], ["text"], ["cachePoint"], ["text"]]
+    assert prompt[2]["text"] is context, "Context should be passed through, not copied"
+    text = "".join(block.get("text", "") for block in prompt)
+    assert text == ("Problem: Mars currency\n\nPrevious discussion:\n" + context +
+                    "\n\nRound 2 (debate)\n\nYour response (keep to ~200 words):")
+    
+    consensus = "".join(block.get("text", "") for block in build_expert_prompt("Mars currency", 3, "consensus", context))
+    assert "Round 3 (CONSENSUS ROUND - work toward agreement)" in consensus
+    
+    # Context already sent to this expert is split off as its own cached block
+    previous = "Jeff round 1"
+    prompt = build_expert_prompt("Mars currency", 2, "debate", context, previous)
+    assert [block.get("text") for block in prompt if "text" in block][1:3] == [previous, "\n\nSwami round 1"]
+    assert sum("cachePoint" in block for block in prompt) == 3
+    
+    # A context that does not extend the previous one is sent as a single block
+    prompt = build_expert_prompt("Mars currency", 2, "debate", "Summary of rounds 1-1", previous)
+    assert sum("cachePoint" in block for block in prompt) == 2
+    print("✓ Expert prompt content blocks verified")
+
+
+async def test_expert_prompt_reuses_own_context():
+    """Test each expert's cached context is the context that expert was sent on its previous turn."""
+    print("\nTesting per-expert prompt cache context...")
+    
+    from orchestrator import app
+    
+    stored = []
+    
+    def make_expert(text):
+        def respond(prompt):
+            response = Mock()
+            response.message = {'content': [{'text': text}]}
+            return response
+        return respond
+    
+    with patch('orchestrator.app.jeff_barr_agent') as mock_jeff, \
+         patch('orchestrator.app.swami_agent') as mock_swami, \
+         patch('orchestrator.app.werner_agent') as mock_werner, \
+         patch('orchestrator.app.synthesis_agent') as mock_synthesis, \
+         patch('orchestrator.app.memory') as mock_memory, \
+         patch('orchestrator.app.build_expert_prompt', wraps=app.build_expert_prompt) as build_prompt:
+        
+        for agent, name in [(mock_jeff, "jeff_barr"), (mock_swami, "swami"), (mock_werner, "werner_vogels")]:
+            agent.side_effect = make_expert(f"{name} says")
+            agent.name = name
+        mock_synthesis.return_value = Mock(message={'content': [{'text': 'Synthesis'}]})
+        
+        # Memory that grows with every stored response
+        mock_memory.create_session.return_value = "test_session_12345678901234567890123"
+        mock_memory.store_response.side_effect = lambda **kwargs: stored.append(kwargs['content'])
+        mock_memory.get_context.side_effect = lambda **kwargs: "\n\n".join(stored)
+        mock_memory.get_full_context.return_value = "Context"
+        
+        result = await debate_orchestrator({"problem": "Test problem"}, {})
+        assert result['status'] == 'complete'
+        
+        # Sequential turns: jeff, swami, werner in every round
+        calls = build_prompt.call_args_list
+        assert len(calls) == 9
+        for turn in range(3, 9):
+            mem_context, cached_context = calls[turn].args[3], calls[turn].args[4]
+            own_previous = calls[turn - 3].args[3]
+            assert cached_context == own_previous, f"Turn {turn} reused another expert's context"
+            if turn >= 6:
+                assert mem_context.startswith(cached_context), "Later rounds extend the cached prefix"
+        assert calls[3].args[4] == "[No previous context]"
+        assert calls[4].args[4] == "jeff_barr says"
+    
+    print("✓ Each expert reuses its own previous context")
+
+
 async def run_async_tests():
     """Run all async tests."""
     await test_orchestrator_validation()
@@ -556,6 +1244,17 @@ async def run_async_tests():
     await test_agent_invocation_with_mocks()
     await test_error_handling()
     await test_response_structure_validation()
+    await test_parallel_round_mode()
+    await test_streaming_mode()
+    await test_stream_agent_text_yields_tokens()
+    await test_result_cache_serves_problem_id()
+    await test_speculative_synthesis()
+    await test_speculative_synthesis_cancelled_on_disconnect()
+    await test_turn_audio()
+    await test_turn_audio_uses_expert_voices()
+    await test_transcript_export()
+    await test_transcript_feeds_audio_scripts()
+    await test_expert_prompt_reuses_own_context()
 
 
 if __name__ == "__main__":
@@ -567,6 +1266,8 @@ if __name__ == "__main__":
     test_problem_loading()
     test_get_problem_by_id()
     test_requirements_coverage()
+    test_expert_prompt_blocks()
+    test_debate_model_calls()
     
     # Run async tests
     print("\nRunning async tests...")
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Load test for the orchestrator entrypoint.
+
+Runs many debates concurrently on one event loop against mocked agents and
+memory whose calls block like real boto3/Strands calls, and verifies that
+throughput scales with concurrency and the event loop stays responsive.
+"""
+
+import asyncio
+import gc
+import sys
+import os
+import time
+from unittest.mock import Mock, patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from orchestrator.app import debate_orchestrator, fresh_agent
+
+# Simulated latency of a single blocking model / memory call
+MODEL_LATENCY = 0.05
+MEMORY_LATENCY = 0.01
+
+
+def _blocking_response(text):
+    """Build a side effect that blocks like a synchronous Bedrock call."""
+    def respond(prompt):
+        time.sleep(MODEL_LATENCY)
+        response = Mock()
+        response.message = {'content': [{'text': text}]}
+        return response
+    return respond
+
+
+def _blocking(value):
+    """Build a side effect that blocks like a synchronous AgentCore Memory call."""
+    def call(*args, **kwargs):
+        time.sleep(MEMORY_LATENCY)
+        return value
+    return call
+
+
+async def _run_debates(concurrency):
+    """Run `concurrency` debates at once and return (elapsed, max event-loop lag)."""
+    max_lag = 0.0
+    done = False
+
+    async def heartbeat():
+        nonlocal max_lag
+        while not done:
+            started = time.monotonic()
+            await asyncio.sleep(0.005)
+            max_lag = max(max_lag, time.monotonic() - started - 0.005)
+
+    with patch('orchestrator.app.jeff_barr_agent') as mock_jeff, \
+         patch('orchestrator.app.swami_agent') as mock_swami, \
+         patch('orchestrator.app.werner_agent') as mock_werner, \
+         patch('orchestrator.app.synthesis_agent') as mock_synthesis, \
+         patch('orchestrator.app.memory') as mock_memory:
+
+        mock_jeff.side_effect = _blocking_response('Jeff says')
+        mock_jeff.name = "jeff_barr"
+        mock_swami.side_effect = _blocking_response('Swami says')
+        mock_swami.name = "swami"
+        mock_werner.side_effect = _blocking_response('Werner says')
+        mock_werner.name = "werner_vogels"
+        mock_synthesis.side_effect = _blocking_response(
+            '## Architecture\nTest\n```mermaid\ngraph TD\n  A-->B\n```'
+        )
+
+        mock_memory.create_session.return_value = "test_session_12345678901234567890123"
+        mock_memory.get_context.side_effect = _blocking("Previous context")
+        mock_memory.get_full_context.side_effect = _blocking("Full context")
+        mock_memory.store_response.side_effect = _blocking(None)
+
+        # A full garbage collection over everything earlier tests left in the
+        # process can pause the loop for longer than the lag threshold. Those
+        # objects are collected and frozen first, so the heartbeat only
+        # measures blocking caused by the debates themselves.
+        gc.collect()
+        gc.freeze()
+        try:
+            monitor = asyncio.create_task(heartbeat())
+            started = time.monotonic()
+            results = await asyncio.gather(*[
+                debate_orchestrator({"problem": f"Load test problem {i}", "pacing": "batch"}, {})
+                for i in range(concurrency)
+            ])
+            elapsed = time.monotonic() - started
+            done = True
+            await monitor
+        finally:
+            gc.unfreeze()
+
+    assert all(r['status'] == 'complete' for r in results), "All debates should complete"
+    return elapsed, max_lag
+
+
+async def test_throughput_scales_with_concurrency():
+    """Verify one worker multiplexes concurrent debates instead of serializing them."""
+    print("\nTesting orchestrator throughput under concurrency...")
+
+    baseline, _ = await _run_debates(1)
+    baseline_throughput = 1 / baseline
+    print(f"  1 debate: {baseline:.2f}s ({baseline_throughput:.2f} debates/s)")
+
+    for concurrency in (4, 16):
+        elapsed, max_lag = await _run_debates(concurrency)
+        throughput = concurrency / elapsed
+        speedup = throughput / baseline_throughput
+        print(f"  {concurrency} debates: {elapsed:.2f}s ({throughput:.2f} debates/s, "
+              f"{speedup:.1f}x, max loop lag {max_lag * 1000:.0f}ms)")
+
+        # Blocking calls run on the executor, so throughput grows with concurrency
+        assert speedup >= concurrency / 2, \
+            f"Throughput should scale with concurrency, got {speedup:.1f}x at {concurrency}"
+
+        # The event loop never waits on a model or memory call
+        assert max_lag < MODEL_LATENCY, f"Event loop blocked for {max_lag * 1000:.0f}ms"
+
+    print("✓ Throughput scales with concurrency")
+
+
+def test_fresh_agent_isolates_conversation_state():
+    """Verify each invocation gets its own agent sharing the template's model and prompt."""
+    from strands import Agent
+    from strands.models import BedrockModel
+
+    template = Agent(
+        model=BedrockModel(model_id="us.anthropic.claude-sonnet-4-20250514-v1:0", region_name="us-east-1"),
+        system_prompt="You are a test expert.",
+        name="test_expert"
+    )
+
+    first = fresh_agent(template)
+    second = fresh_agent(template)
+
+    assert first is not template and first is not second, "Each invocation should get its own agent"
+    assert first.model is template.model, "Copies should share the model client"
+    assert first.system_prompt == template.system_prompt
+    assert first.name == "test_expert"
+
+    # Non-Strands callables (e.g. mocks) are used as-is
+    sentinel = Mock()
+    assert fresh_agent(sentinel) is sentinel
+
+
+if __name__ == "__main__":
+    test_fresh_agent_isolates_conversation_state()
+    asyncio.run(test_throughput_scales_with_concurrency())
+    print("\n✅ ALL LOAD TESTS PASSED!")
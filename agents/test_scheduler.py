@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Unit tests for the orchestrator turn schedulers."""
+
+import asyncio
+import sys
+import os
+import time
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from orchestrator.scheduler import (
+    get_scheduler,
+    BatchScheduler,
+    ClientPacedScheduler,
+    RealTimeScheduler,
+)
+
+
+def test_get_scheduler_modes():
+    """Verify each pacing mode maps to its scheduler."""
+    assert isinstance(get_scheduler('batch'), BatchScheduler)
+    assert isinstance(get_scheduler('client'), ClientPacedScheduler)
+    assert isinstance(get_scheduler('realtime'), RealTimeScheduler)
+    assert get_scheduler('client', turn_seconds=5).turn_seconds == 5
+
+    with pytest.raises(ValueError):
+        get_scheduler('slow-motion')
+
+
+async def test_batch_and_client_never_wait():
+    """Verify batch and client pacing release every turn immediately."""
+    for mode in ('batch', 'client'):
+        scheduler = get_scheduler(mode, turn_seconds=60)
+        scheduler.start()
+
+        started = time.monotonic()
+        for turn_index in range(9):
+            await scheduler.release(turn_index)
+        assert time.monotonic() - started < 0.5, f"{mode} scheduler should not wait"
+
+
+def test_client_timing_includes_playback_slot():
+    """Verify client pacing stamps each turn with its playback slot."""
+    scheduler = get_scheduler('client', turn_seconds=60)
+    scheduler.start()
+
+    timing = scheduler.timing(4)
+    assert timing['turnIndex'] == 4
+    assert timing['playAt'] == 240
+    assert timing['duration'] == 60
+    assert 'generatedAt' in timing
+
+    # Batch mode has no playback schedule
+    assert 'playAt' not in get_scheduler('batch').timing(4)
+
+
+async def test_realtime_waits_only_for_remaining_slot():
+    """Verify realtime pacing counts generation time toward the turn's slot."""
+    scheduler = get_scheduler('realtime', turn_seconds=0.2)
+    scheduler.start()
+
+    # First turn is released immediately
+    started = time.monotonic()
+    await scheduler.release(0)
+    assert time.monotonic() - started < 0.1
+
+    # Simulate a slow model call that uses most of the next slot
+    time.sleep(0.15)
+    started = time.monotonic()
+    await scheduler.release(1)
+    waited = time.monotonic() - started
+    assert waited < 0.15, f"Should only wait for the rest of the slot, waited {waited:.2f}s"
+    assert scheduler.elapsed() >= 0.2
+
+
+if __name__ == '__main__':
+    test_get_scheduler_modes()
+    asyncio.run(test_batch_and_client_never_wait())
+    test_client_timing_includes_playback_slot()
+    asyncio.run(test_realtime_waits_only_for_remaining_slot())
+    print("✅ All scheduler tests passed")
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the orchestrator.
+
+Measures, in a fresh interpreter, how long importing orchestrator.app takes
+(what an AgentCore cold start pays before it can accept a request) and how
+long it then takes until every agent and the memory client are built and
+ready. Credentials are dummies and instance metadata lookups are disabled,
+so no network calls are made.
+
+Import costs of the main packages are profiled with `python -X importtime`
+and checked against startup_baseline.json; a package whose import got more
+than the baseline's threshold slower fails the check. The timings are
+absolute, so the check only means something on the machine and Python
+version the baseline was recorded with: under pytest it runs only with
+STARTUP_IMPORT_CHECK=true, and it is skipped when the Python version differs.
+
+    python test_startup.py --runs 5          # import-to-ready time
+    python test_startup.py --imports         # import profile, checked against the baseline
+    python test_startup.py --update-baseline # record the current import costs
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+AGENTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(AGENTS_DIR, "startup_baseline.json")
+
+# Packages whose import cost is tracked, each imported alone in a fresh interpreter
+IMPORT_TARGETS = ["orchestrator.app", "experts", "synthesis", "spec_generator", "memory"]
+
+# Allowed slowdown over the baseline (0.5 = 50%), unless the baseline or
+# STARTUP_REGRESSION_THRESHOLD says otherwise
+DEFAULT_THRESHOLD = 0.5
+# Regressions smaller than this are timer noise, whatever the percentage
+MIN_REGRESSION_MS = 50.0
+# The baseline check spawns ten interpreters and compares wall-clock timings,
+# so it is opt-in for the pytest run (e.g. on the machine that recorded it)
+STARTUP_IMPORT_CHECK = os.getenv("STARTUP_IMPORT_CHECK", "false").lower() == "true"
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+# Runs in the child interpreter; prints one JSON line of measurements
+STARTUP_SCRIPT = """
+import json
+import time
+
+started = time.perf_counter()
+import orchestrator.app as app
+imported = time.perf_counter()
+
+import spec_generator
+from agent_registry import agent_registry
+built_at_import = agent_registry.built()
+agent_registry.prewarm(background=False, extra=[lambda: app.memory.client])
+ready = time.perf_counter()
+
+print(json.dumps({
+    "importSeconds": imported - started,
+    "readySeconds": ready - started,
+    "builtAtImport": built_at_import,
+    "buildSeconds": agent_registry.build_seconds,
+}))
+"""
+
+
+def offline_env() -> dict:
+    """Environment for a child interpreter that never reaches AWS."""
+    env = dict(os.environ)
+    env.update({
+        "AWS_ACCESS_KEY_ID": "benchmark",
+        "AWS_SECRET_ACCESS_KEY": "benchmark",
+        "AWS_DEFAULT_REGION": env.get("AWS_DEFAULT_REGION", "us-east-1"),
+        "AWS_EC2_METADATA_DISABLED": "true",
+        "PREWARM_AGENTS": "false",
+        "LOG_LEVEL": "WARNING",
+    })
+    env.pop("TRANSCRIPT_DIR", None)
+    return env
+
+
+def measure_startup() -> dict:
+    """Import the orchestrator in a fresh interpreter and return its startup timings."""
+    result = subprocess.run(
+        [sys.executable, "-c", STARTUP_SCRIPT],
+        cwd=AGENTS_DIR,
+        env=offline_env(),
+        capture_output=True,
+        text=True,
+        timeout=120
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Startup benchmark failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_agents_are_built_lazily():
+    """Test importing the orchestrator builds no agent, and pre-warming builds them all."""
+    print("\nTesting startup time...")
+    
+    timings = measure_startup()
+    
+    assert timings["builtAtImport"] == [], "Importing the orchestrator and spec generator should not build agents"
+    assert set(timings["buildSeconds"]) == {"jeff_barr", "swami", "werner_vogels", "synthesis", "spec_generator"}
+    assert timings["readySeconds"] >= timings["importSeconds"]
+    
+    print(f"✓ Import: {timings['importSeconds'] * 1000:.0f} ms, "
+          f"ready: {timings['readySeconds'] * 1000:.0f} ms")
+    print(f"  - Agent builds deferred: {sum(timings['buildSeconds'].values()) * 1000:.0f} ms")
+
+
+def parse_importtime(output: str) -> Dict[str, Tuple[float, float]]:
+    """Parse `-X importtime` output into {module: (self ms, cumulative ms)}."""
+    profile = {}
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, module = match.groups()
+            profile[module] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+    return profile
+
+
+def profile_import(module: str) -> Dict[str, Tuple[float, float]]:
+    """Import a module in a fresh, offline interpreter and return its import profile."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=AGENTS_DIR,
+        env=offline_env(),
+        capture_output=True,
+        text=True,
+        timeout=120
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+    profile = parse_importtime(result.stderr)
+    if module not in profile:
+        raise RuntimeError(f"No import time reported for {module}")
+    return profile
+
+
+def import_cost(module: str, runs: int = 3) -> Tuple[float, Dict[str, Tuple[float, float]]]:
+    """
+    Return the cumulative import time of a module in ms and the profile of that run.
+    
+    The fastest of `runs` fresh interpreters is kept: slower runs measure
+    machine noise, not the code.
+    """
+    profiles = [profile_import(module) for _ in range(runs)]
+    fastest = min(profiles, key=lambda profile: profile[module][1])
+    return fastest[module][1], fastest
+
+
+def top_imports(profile: Dict[str, Tuple[float, float]], count: int = 10) -> List[Tuple[str, float]]:
+    """The modules with the highest self import time, most expensive first."""
+    ranked = sorted(profile.items(), key=lambda item: item[1][0], reverse=True)
+    return [(module, self_ms) for module, (self_ms, _) in ranked[:count]]
+
+
+def load_baseline(path: str = BASELINE_PATH) -> dict:
+    """Load the stored import costs; an empty baseline when there is none."""
+    if not os.path.exists(path):
+        return {"targets": {}}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_baseline(costs: Dict[str, float], path: str = BASELINE_PATH, threshold: float = DEFAULT_THRESHOLD) -> None:
+    """Store import costs as the new baseline."""
+    baseline = {
+        "python": f"{sys.version_info.major}.{sys.version_info.minor}",
+        "threshold": threshold,
+        "targets": {module: {"cumulativeMs": round(ms, 1)} for module, ms in costs.items()}
+    }
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+
+
+def baseline_mismatch(baseline: dict) -> Optional[str]:
+    """Why the baseline's timings do not apply to this interpreter, or None."""
+    recorded = baseline.get("python")
+    current = f"{sys.version_info.major}.{sys.version_info.minor}"
+    if recorded and recorded != current:
+        return f"baseline was recorded on Python {recorded}, this is Python {current}"
+    return None
+
+
+def regression_threshold(baseline: dict) -> float:
+    """Allowed relative slowdown: STARTUP_REGRESSION_THRESHOLD, else the baseline's, else the default."""
+    return float(os.getenv("STARTUP_REGRESSION_THRESHOLD", baseline.get("threshold", DEFAULT_THRESHOLD)))
+
+
+def find_regressions(costs: Dict[str, float], baseline: dict, threshold: float) -> List[str]:
+    """
+    Describe every import that is slower than its baseline allows.
+    
+    An import regresses when it exceeds the baseline by more than `threshold`
+    (relative) and by more than MIN_REGRESSION_MS. Modules without a
+    baseline entry are not checked.
+    """
+    regressions = []
+    for module, measured in costs.items():
+        entry = baseline.get("targets", {}).get(module)
+        if entry is None:
+            continue
+        expected = entry["cumulativeMs"]
+        limit = max(expected * (1 + threshold), expected + MIN_REGRESSION_MS)
+        if measured > limit:
+            regressions.append(
+                f"import {module}: {measured:.0f} ms, baseline {expected:.0f} ms (limit {limit:.0f} ms)"
+            )
+    return regressions
+
+
+def test_parse_importtime_and_regressions():
+    """Test -X importtime parsing and the regression rule on fixed numbers."""
+    print("\nTesting import profile checks...")
+    
+    output = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |     botocore.utils",
+        "import time:      9000 |      30500 |   boto3",
+        "import time:      2000 |      40000 | memory",
+    ])
+    profile = parse_importtime(output)
+    assert profile["memory"] == (2.0, 40.0)
+    assert top_imports(profile, 2) == [("boto3", 9.0), ("memory", 2.0)]
+    
+    baseline = {"threshold": 0.5, "targets": {"memory": {"cumulativeMs": 200.0}, "experts": {"cumulativeMs": 20.0}}}
+    assert find_regressions({"memory": 290.0, "experts": 60.0}, baseline, 0.5) == [], \
+        "Within 50%, and small absolute slowdowns are noise"
+    assert len(find_regressions({"memory": 310.0, "experts": 80.0, "synthesis": 999.0}, baseline, 0.5)) == 2
+    assert baseline_mismatch(baseline) is None, "Baselines without a version are not rejected"
+    assert "Python 2.7" in baseline_mismatch(dict(baseline, python="2.7"))
+    
+    print("✓ Import profile checks verified")
+
+
+@pytest.mark.skipif(not STARTUP_IMPORT_CHECK, reason="set STARTUP_IMPORT_CHECK=true to check import times")
+def test_import_times_within_baseline():
+    """Test each tracked package imports no slower than startup_baseline.json allows."""
+    print("\nTesting import times against the baseline...")
+    
+    baseline = load_baseline()
+    mismatch = baseline_mismatch(baseline)
+    if mismatch:
+        pytest.skip(f"{mismatch}; record one with --update-baseline")
+    costs = {}
+    profiles = {}
+    for module in IMPORT_TARGETS:
+        costs[module], profiles[module] = import_cost(module, runs=2)
+    
+    regressions = find_regressions(costs, baseline, regression_threshold(baseline))
+    report = "\n".join(
+        f"  {name:<50} {self_ms:7.1f} ms" for name, self_ms in top_imports(profiles["orchestrator.app"])
+    )
+    assert not regressions, "Import time regressed:\n" + "\n".join(regressions) + \
+        "\nMost expensive imports of orchestrator.app:\n" + report
+    
+    for module in IMPORT_TARGETS:
+        print(f"✓ import {module}: {costs[module]:.0f} ms")
+
+
+def report_imports(args) -> int:
+    """Print import costs and check them against the baseline; returns the exit code."""
+    baseline = load_baseline()
+    costs = {}
+    profiles = {}
+    for module in IMPORT_TARGETS:
+        costs[module], profiles[module] = import_cost(module, runs=args.runs)
+    
+    print(f"Import time, fastest of {args.runs} runs (baseline in parentheses):")
+    for module in IMPORT_TARGETS:
+        entry = baseline["targets"].get(module)
+        expected = f"({entry['cumulativeMs']:.0f} ms)" if entry else "(no baseline)"
+        print(f"  {module:<20} {costs[module]:8.0f} ms {expected}")
+    print(f"\nTop {args.top} imports of orchestrator.app by self time:")
+    for name, self_ms in top_imports(profiles["orchestrator.app"], args.top):
+        print(f"  {name:<50} {self_ms:8.1f} ms")
+    
+    if args.update_baseline:
+        save_baseline(costs, threshold=baseline.get("threshold", DEFAULT_THRESHOLD))
+        print(f"\nBaseline written to {BASELINE_PATH}")
+        return 0
+    mismatch = baseline_mismatch(baseline)
+    if mismatch:
+        print(f"\nNot checked against the baseline: {mismatch}")
+        return 0
+    regressions = find_regressions(costs, baseline, regression_threshold(baseline))
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure orchestrator import-to-ready time and import costs")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to measure (default 5)")
+    parser.add_argument("--imports", action="store_true", help="Profile import costs and check them against the baseline")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the measured import costs as the baseline")
+    parser.add_argument("--top", type=int, default=15, help="Most expensive imports to list (default 15)")
+    args = parser.parse_args()
+    
+    if args.imports or args.update_baseline:
+        sys.exit(report_imports(args))
+    
+    runs = [measure_startup() for _ in range(args.runs)]
+    print(f"Orchestrator startup over {args.runs} runs (median):")
+    print(f"  import orchestrator.app: {statistics.median(r['importSeconds'] for r in runs) * 1000:8.0f} ms")
+    print(f"  ready (agents built):    {statistics.median(r['readySeconds'] for r in runs) * 1000:8.0f} ms")
+    for name in runs[0]["buildSeconds"]:
+        print(f"    build {name:<16} {statistics.median(r['buildSeconds'][name] for r in runs) * 1000:8.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""Token estimates shared by the model gateway, context budgeting and transcripts."""
+
+from .estimate import CHARS_PER_TOKEN, estimate_tokens
+
+__all__ = [
+    'CHARS_PER_TOKEN',
+    'estimate_tokens',
+]
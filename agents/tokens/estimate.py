@@ -0,0 +1,9 @@
+import math
+
+# Rough characters-per-token ratio for English prose with Claude tokenizers
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text without calling a tokenizer."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
@@ -0,0 +1,14 @@
+"""Unit tests for token estimates."""
+
+from tokens import CHARS_PER_TOKEN, estimate_tokens
+
+
+class TestEstimateTokens:
+    """Test suite for estimate_tokens."""
+
+    def test_rounds_up(self):
+        """Test partial tokens count as whole tokens."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd") == 1
+        assert estimate_tokens("abcde") == 2
+        assert estimate_tokens("a" * CHARS_PER_TOKEN * 10) == 10
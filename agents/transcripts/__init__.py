@@ -0,0 +1,19 @@
+"""Structured, versioned debate transcripts written by the orchestrator."""
+
+from .recorder import (
+    TRANSCRIPT_VERSION,
+    TranscriptRecorder,
+    TranscriptWriter,
+    create_transcript_recorder,
+    read_transcript,
+    read_turns
+)
+
+__all__ = [
+    'TRANSCRIPT_VERSION',
+    'TranscriptRecorder',
+    'TranscriptWriter',
+    'create_transcript_recorder',
+    'read_transcript',
+    'read_turns',
+]
@@ -0,0 +1,241 @@
+import asyncio
+import functools
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import IO, Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Union
+
+from tokens import estimate_tokens
+
+# Get logger instance for this module
+logger = logging.getLogger(__name__)
+
+# Bump when a record's fields change incompatibly; readers reject newer files
+TRANSCRIPT_VERSION = 1
+
+# Runs a blocking call off the event loop and returns its result
+RunBlocking = Callable[..., Awaitable[Any]]
+
+
+async def _run_in_default_executor(func: Callable, *args) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args))
+
+
+class TranscriptWriter:
+    """
+    Appends transcript records to a JSON Lines file, one compact object per line.
+
+    Every record is flushed as soon as it is written, so a reader (or a crash)
+    sees all turns completed so far.
+    """
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+
+    @classmethod
+    def create(cls, path: Union[str, Path]) -> "TranscriptWriter":
+        """Create a new transcript file; raises FileExistsError if it exists."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return cls(open(path, 'x', encoding='utf-8'))
+
+    def write(self, record: dict) -> None:
+        """Append one record, leaving out fields that are None."""
+        record = {key: value for key, value in record.items() if value is not None}
+        self.stream.write(json.dumps(record, separators=(',', ':'), ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.stream.close()
+
+
+def read_transcript(path: Union[str, Path]) -> Iterator[dict]:
+    """
+    Yield the records of a transcript file.
+
+    The first record is the "session" header; a ValueError is raised if it is
+    missing or the file was written by a newer TRANSCRIPT_VERSION. A partial
+    last line (a transcript still being written) is skipped.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    for index, line in enumerate(lines):
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            if index == len(lines) - 1 and not line.endswith("\n"):
+                return
+            raise ValueError(f"Invalid transcript record on line {index + 1} of {path}")
+        if index == 0:
+            if record.get('type') != 'session':
+                raise ValueError(f"{path} does not start with a session record")
+            if record.get('version', 0) > TRANSCRIPT_VERSION:
+                raise ValueError(f"{path} has transcript version {record['version']}, "
+                                 f"newer than {TRANSCRIPT_VERSION}")
+        yield record
+
+
+def read_turns(path: Union[str, Path]) -> List[dict]:
+    """Return the "turn" records of a transcript file in speaking order."""
+    return [record for record in read_transcript(path) if record['type'] == 'turn']
+
+
+class TranscriptRecorder:
+    """
+    Writes the transcript of each debate as it is produced.
+
+    `record` wraps a run_debate event stream and passes every event through
+    unchanged, appending a record to `<directory>/<sessionId>.jsonl` as each
+    turn completes:
+
+    - session: version, sessionId, startedAt and the metadata passed to record
+    - turn: round, position in the round, speaker, text, estimated tokens,
+      startedAt and durationMs of the generation, and the scheduler timing
+    - synthesis: text, estimated tokens, mermaidDiagram
+    - end: status, error, promptCache and the debate's durationMs
+
+    Times are Unix timestamps in seconds. An existing transcript file is never
+    overwritten (session IDs are unique, so this only guards against a
+    collision), and write failures are logged without interrupting the debate.
+    Files are opened and written through `run_blocking` (by default the
+    loop's default executor) so the event loop never waits on the disk.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        clock: Callable[[], float] = time.time,
+        run_blocking: Optional[RunBlocking] = None
+    ):
+        self.directory = Path(directory)
+        self.clock = clock
+        self.run_blocking = run_blocking or _run_in_default_executor
+
+    def path(self, session_id: str) -> Path:
+        """Transcript file of a session."""
+        return self.directory / f"{session_id}.jsonl"
+
+    async def record(self, events: AsyncIterator[dict], **metadata) -> AsyncIterator[dict]:
+        """Yield the events of a debate while writing its transcript."""
+        session = _Session(metadata)
+        try:
+            async for event in events:
+                if session.active:
+                    try:
+                        now = self.clock()
+                        if _writes(event):
+                            await self.run_blocking(self._observe, session, event, now)
+                        else:
+                            self._observe(session, event, now)
+                    except (OSError, TypeError, ValueError) as e:
+                        logger.error(f"Could not write transcript for session {session.session_id}: {e}")
+                        session.close()
+                        session.active = False
+                yield event
+        finally:
+            session.close()
+            # Stop the debate too when the consumer stops early
+            aclose = getattr(events, 'aclose', None)
+            if aclose is not None:
+                await aclose()
+
+    def _observe(self, session: "_Session", event: dict, now: float) -> None:
+        kind = event.get('type')
+        if kind == 'session_started':
+            session.session_id = event['sessionId']
+            try:
+                session.writer = TranscriptWriter.create(self.path(session.session_id))
+            except FileExistsError:
+                logger.info(f"Transcript for session {session.session_id} already exists; not rewriting it")
+                session.active = False
+                return
+            session.started_at = now
+            session.writer.write({
+                "type": "session",
+                "version": TRANSCRIPT_VERSION,
+                "sessionId": session.session_id,
+                "startedAt": now,
+                **session.metadata
+            })
+            return
+        writer = session.writer
+        if writer is None:
+            return
+        if kind == 'expert_speaking':
+            session.speaking.setdefault((event['expertId'], event['round']), []).append(now)
+        elif kind == 'expert_response' and event.get('isComplete', True):
+            round_num = event['round']
+            started = session.speaking.get((event['expertId'], round_num))
+            started_at = started.pop(0) if started else None
+            position = session.positions.get(round_num, 0)
+            session.positions[round_num] = position + 1
+            writer.write({
+                "type": "turn",
+                "round": round_num,
+                "position": position,
+                "speaker": event['expertId'],
+                "text": event['content'],
+                "tokens": estimate_tokens(event['content']),
+                "startedAt": started_at,
+                "durationMs": round((now - started_at) * 1000) if started_at is not None else None,
+                "timing": event.get('timing')
+            })
+        elif kind == 'debate_complete':
+            synthesis = event.get('synthesis') or ""
+            writer.write({
+                "type": "synthesis",
+                "text": synthesis,
+                "tokens": estimate_tokens(synthesis),
+                "mermaidDiagram": event.get('mermaidDiagram')
+            })
+            self._end(session, now, status=event.get('status', 'complete'), promptCache=event.get('promptCache'))
+        elif kind == 'error':
+            self._end(session, now, status='error', error=event.get('error'))
+
+    def _end(self, session: "_Session", now: float, **fields) -> None:
+        session.writer.write({
+            "type": "end",
+            "durationMs": round((now - session.started_at) * 1000),
+            **fields
+        })
+        session.close()
+        session.active = False
+
+
+def _writes(event: dict) -> bool:
+    """Whether recording an event opens or writes the transcript file."""
+    kind = event.get('type')
+    if kind == 'expert_response':
+        return event.get('isComplete', True)
+    return kind in ('session_started', 'debate_complete', 'error')
+
+
+class _Session:
+    """Recording state of one debate."""
+
+    def __init__(self, metadata: dict):
+        self.metadata = metadata
+        self.active = True
+        self.session_id: Optional[str] = None
+        self.writer: Optional[TranscriptWriter] = None
+        self.started_at = 0.0
+        # Start times of turns in progress, by (expertId, round)
+        self.speaking: Dict[tuple, List[float]] = {}
+        self.positions: Dict[int, int] = {}
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+def create_transcript_recorder(
+    directory: Optional[str] = None,
+    run_blocking: Optional[RunBlocking] = None
+) -> Optional[TranscriptRecorder]:
+    """Create the recorder configured by TRANSCRIPT_DIR, or None when transcripts are disabled."""
+    directory = directory or os.getenv('TRANSCRIPT_DIR')
+    return TranscriptRecorder(directory, run_blocking=run_blocking) if directory else None
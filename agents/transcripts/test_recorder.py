@@ -0,0 +1,134 @@
+"""Unit tests for the JSON Lines debate transcript."""
+
+import asyncio
+import itertools
+import json
+import threading
+
+import pytest
+
+from transcripts import TRANSCRIPT_VERSION, TranscriptRecorder, TranscriptWriter, read_transcript, read_turns
+
+
+def debate_events(session_id="debate_1"):
+    events = [{"type": "session_started", "sessionId": session_id}]
+    for round_num in (1, 2):
+        for expert in ("jeff_barr", "swami"):
+            events.append({"type": "expert_speaking", "expertId": expert, "round": round_num})
+            events.append({"type": "expert_response", "expertId": expert, "round": round_num,
+                           "content": "partial", "isComplete": False})
+            events.append({"type": "expert_response", "expertId": expert, "round": round_num,
+                           "content": f"{expert} says {round_num}", "isComplete": True,
+                           "timing": {"turn": 0}})
+        events.append({"type": "round_complete", "roundNumber": round_num})
+    events.append({"type": "debate_complete", "sessionId": session_id, "synthesis": "Use Lambda.",
+                   "mermaidDiagram": "graph TD", "promptCache": {"calls": 5}, "status": "complete"})
+    return events
+
+
+async def produce(events):
+    for event in events:
+        yield event
+
+
+def collect(recorder, events, **metadata):
+    async def scenario():
+        return [event async for event in recorder.record(produce(events), **metadata)]
+
+    return asyncio.run(scenario())
+
+
+class TestTranscriptRecorder:
+    """Test suite for TranscriptRecorder."""
+
+    def test_records_turns_and_synthesis(self, tmp_path):
+        """Test events pass through unchanged and each turn is written with tokens and timings."""
+        clock = itertools.count(100)
+        recorder = TranscriptRecorder(tmp_path, clock=lambda: float(next(clock)))
+        events = debate_events()
+
+        assert collect(recorder, events, problem="Build it", problemId=None) == events
+
+        records = list(read_transcript(recorder.path("debate_1")))
+        assert [record["type"] for record in records] == ["session"] + ["turn"] * 4 + ["synthesis", "end"]
+        assert records[0] == {"type": "session", "version": TRANSCRIPT_VERSION, "sessionId": "debate_1",
+                              "startedAt": 100.0, "problem": "Build it"}
+        turn = records[3]
+        assert (turn["round"], turn["position"], turn["speaker"], turn["text"]) == (2, 0, "jeff_barr", "jeff_barr says 2")
+        assert turn["tokens"] == 4 and turn["timing"] == {"turn": 0}
+        # The clock ticks once per event: expert_speaking, a partial, then the complete turn
+        assert turn["durationMs"] == 2000
+        assert records[5] == {"type": "synthesis", "text": "Use Lambda.", "tokens": 3, "mermaidDiagram": "graph TD"}
+        assert records[6]["status"] == "complete" and records[6]["promptCache"] == {"calls": 5}
+        # Compact encoding: no spaces between separators
+        assert '", "' not in recorder.path("debate_1").read_text()
+
+    def test_written_incrementally(self, tmp_path):
+        """Test each turn is on disk before the consumer receives it."""
+        recorder = TranscriptRecorder(tmp_path)
+
+        async def scenario():
+            written = []
+            async for event in recorder.record(produce(debate_events())):
+                if event["type"] == "expert_response" and event["isComplete"]:
+                    written.append(len(read_turns(recorder.path("debate_1"))))
+            return written
+
+        assert asyncio.run(scenario()) == [1, 2, 3, 4]
+
+    def test_file_io_runs_off_the_event_loop(self, tmp_path, monkeypatch):
+        """Test the transcript is opened and written through run_blocking, not on the loop thread."""
+        threads = []
+        write = TranscriptWriter.write
+        monkeypatch.setattr(TranscriptWriter, "write",
+                            lambda writer, record: threads.append(threading.current_thread()) or write(writer, record))
+        blocking_calls = []
+
+        async def run_blocking(func, *args):
+            blocking_calls.append(args[1]["type"])
+            return await asyncio.to_thread(func, *args)
+
+        recorder = TranscriptRecorder(tmp_path, run_blocking=run_blocking)
+        collect(recorder, debate_events())
+
+        assert blocking_calls == ["session_started"] + ["expert_response"] * 4 + ["debate_complete"]
+        assert len(threads) == 7 and threading.main_thread() not in threads
+        assert len(read_turns(recorder.path("debate_1"))) == 4
+
+    def test_errors_and_replays(self, tmp_path):
+        """Test an error ends the transcript and an existing transcript is not rewritten."""
+        recorder = TranscriptRecorder(tmp_path)
+        events = debate_events()[:4] + [{"type": "error", "error": "Synthesis failed"}]
+        collect(recorder, events)
+        records = list(read_transcript(recorder.path("debate_1")))
+        assert records[-1]["status"] == "error" and records[-1]["error"] == "Synthesis failed"
+
+        before = recorder.path("debate_1").read_text()
+        assert collect(recorder, debate_events()) == debate_events()
+        assert recorder.path("debate_1").read_text() == before
+
+        # Debates that fail before a session is created write nothing
+        collect(recorder, [{"type": "error", "error": "Problem statement cannot be empty"}])
+        assert len(list(tmp_path.iterdir())) == 1
+
+
+class TestReadTranscript:
+    """Test suite for read_transcript."""
+
+    def test_partial_last_line_and_versions(self, tmp_path):
+        """Test a partially written last line is skipped and newer versions are rejected."""
+        path = tmp_path / "debate.jsonl"
+        path.write_text(json.dumps({"type": "session", "version": 1}) + "\n" + '{"type": "tu')
+        assert [record["type"] for record in read_transcript(path)] == ["session"]
+
+        path.write_text(json.dumps({"type": "session", "version": TRANSCRIPT_VERSION + 1}) + "\n")
+        with pytest.raises(ValueError):
+            list(read_transcript(path))
+
+        path.write_text(json.dumps({"type": "turn"}) + "\n")
+        with pytest.raises(ValueError):
+            list(read_transcript(path))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])